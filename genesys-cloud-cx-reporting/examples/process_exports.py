@@ -12,12 +12,32 @@ Usage:
 
 import pandas as pd
 import argparse
+import sys
 from datetime import datetime
+from pathlib import Path
+
+# Cached, typed reloads through the ISPN columnar frame cache when available
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+try:
+    from utils.frame_cache import load_export
+except ImportError:
+    load_export = None
+
+try:
+    from utils.thresholds import describe_target
+except ImportError:
+    describe_target = None
+
+
+def target_text(metric: str, default: str) -> str:
+    """Target as shown in the report, from targets.json when available."""
+    return describe_target(metric) if describe_target else default
 
 
 def load_interactions(filepath: str) -> pd.DataFrame:
     """Load and prepare Interactions export."""
-    df = pd.read_csv(filepath)
+    df = load_export(filepath) if load_export else pd.read_csv(filepath)
     
     # Convert time fields to numeric (milliseconds)
     time_cols = ['Total Queue', 'Total Alert', 'Total Handle', 
@@ -31,7 +51,7 @@ def load_interactions(filepath: str) -> pd.DataFrame:
 
 def load_agent_status(filepath: str) -> pd.DataFrame:
     """Load and prepare Agent Status Duration Details export."""
-    df = pd.read_csv(filepath)
+    df = load_export(filepath) if load_export else pd.read_csv(filepath)
     
     # Convert time fields to numeric (milliseconds)
     time_cols = ['Logged In', 'On Queue', 'Off Queue', 'Training',
@@ -45,7 +65,7 @@ def load_agent_status(filepath: str) -> pd.DataFrame:
 
 def load_adherence(filepath: str) -> pd.DataFrame:
     """Load and prepare WFM Historical Adherence export."""
-    df = pd.read_csv(filepath, encoding='utf-8-sig')
+    df = load_export(filepath) if load_export else pd.read_csv(filepath, encoding='utf-8-sig')
     
     # Convert adherence percentage strings to floats
     if 'Adherence (%)' in df.columns:
@@ -56,7 +76,7 @@ def load_adherence(filepath: str) -> pd.DataFrame:
 
 def load_agent_performance(filepath: str) -> pd.DataFrame:
     """Load and prepare Agent Performance export."""
-    df = pd.read_csv(filepath)
+    df = load_export(filepath) if load_export else pd.read_csv(filepath)
     
     # Convert numeric fields
     numeric_cols = ['Handle', 'Total Handle', 'Total Talk', 'Total Hold', 
@@ -239,8 +259,8 @@ CALL METRICS
 ------------
 Inbound Handled Calls (≥20s):     {call_metrics['inbound_count']:,}
 Inbound Call Hours:               {call_metrics['inbound_hours']:.2f}
-AHT (minutes):                    {call_metrics['aht_minutes']:.2f}  (Target: < 10.7)
-AWT (seconds):                    {call_metrics['awt_seconds']:.2f}  (Target: < 90)
+AHT (minutes):                    {call_metrics['aht_minutes']:.2f}  (Target: {target_text('aht', '< 10.7 min')})
+AWT (seconds):                    {call_metrics['awt_seconds']:.2f}  (Target: {target_text('awt', '< 90 sec')})
 
 Answer Speed Distribution:
   Answered ≤30s:                  {call_metrics['answered_30s']:,}
@@ -279,8 +299,8 @@ Shrinkage Breakdown:
   - Meeting:                      {workforce_metrics['meeting_hours']:.2f} hrs
 
 Efficiency Metrics:
-  Utilization:                    {workforce_metrics['utilization_pct']:.1f}%  (Target: > 55%)
-  Occupancy:                      {workforce_metrics['occupancy_pct']:.1f}%  (Target: > 75%)
+  Utilization:                    {workforce_metrics['utilization_pct']:.1f}%  (Target: {target_text('utilization', '55-65%')})
+  Occupancy:                      {workforce_metrics['occupancy_pct']:.1f}%  (Target: {target_text('occupancy', '75-85%')})
 
 WFM ADHERENCE
 -------------
@@ -21,6 +21,7 @@ def generate_dashboard(results: Dict) -> str:
     
     meta = results['metadata']
     tiers = results['tier_distribution']
+    thresholds = results['tier_thresholds']
     agents = results['agents']
     categories = results['categories']
     evaluators = results['evaluators']
@@ -348,7 +349,7 @@ def generate_dashboard(results: Dict) -> str:
         <div class="metric-row">
             <div class="metric-card">
                 <div class="metric-label">Team Average</div>
-                <div class="metric-value" style="color: {'var(--success)' if meta['team_average'] >= 80 else 'var(--amber)' if meta['team_average'] >= 65 else 'var(--error)'};">{meta['team_average']}%</div>
+                <div class="metric-value" style="color: {'var(--success)' if meta['team_average'] >= thresholds['standard'] else 'var(--amber)' if meta['team_average'] >= thresholds['development'] else 'var(--error)'};">{meta['team_average']}%</div>
             </div>
             <div class="metric-card">
                 <div class="metric-label">Evaluations</div>
@@ -570,6 +571,8 @@ def _generate_evaluator_rows(evaluators: List[Dict]) -> str:
 
 
 if __name__ == '__main__':
+    from qa_analyzer import GenesysQAAnalyzer
+    
     # Test with sample data
     sample_results = {
         'metadata': {
@@ -585,6 +588,7 @@ if __name__ == '__main__':
             'Development': 4,
             'Critical': 4
         },
+        'tier_thresholds': GenesysQAAnalyzer.TIER_THRESHOLDS,
         'agents': [],
         'categories': [],
         'evaluators': [],
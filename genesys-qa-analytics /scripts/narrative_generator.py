@@ -21,6 +21,9 @@ def generate_narrative(results: Dict) -> str:
     
     meta = results['metadata']
     tiers = results['tier_distribution']
+    thresholds = results['tier_thresholds']
+    exemplary, standard, development = (
+        thresholds['exemplary'], thresholds['standard'], thresholds['development'])
     agents = results['agents']
     categories = results['categories']
     evaluators = results['evaluators']
@@ -52,10 +55,10 @@ This report analyzes **{meta['evaluation_count']} quality evaluations** across *
 
 | Tier | Count | Percentage | Action Required |
 |------|-------|------------|-----------------|
-| Exemplary (≥95%) | {tiers.get('Exemplary', 0)} | {(tiers.get('Exemplary', 0) / total_agents * 100):.1f}% | Recognition & mentorship |
-| Standard (80-94%) | {tiers.get('Standard', 0)} | {(tiers.get('Standard', 0) / total_agents * 100):.1f}% | Maintenance coaching |
-| Development (65-79%) | {tiers.get('Development', 0)} | {(tiers.get('Development', 0) / total_agents * 100):.1f}% | Targeted skill building |
-| Critical (<65%) | {tiers.get('Critical', 0)} | {(tiers.get('Critical', 0) / total_agents * 100):.1f}% | Immediate intervention |
+| Exemplary (≥{exemplary:g}%) | {tiers.get('Exemplary', 0)} | {(tiers.get('Exemplary', 0) / total_agents * 100):.1f}% | Recognition & mentorship |
+| Standard ({standard:g}-{exemplary - 1:g}%) | {tiers.get('Standard', 0)} | {(tiers.get('Standard', 0) / total_agents * 100):.1f}% | Maintenance coaching |
+| Development ({development:g}-{standard - 1:g}%) | {tiers.get('Development', 0)} | {(tiers.get('Development', 0) / total_agents * 100):.1f}% | Targeted skill building |
+| Critical (<{development:g}%) | {tiers.get('Critical', 0)} | {(tiers.get('Critical', 0) / total_agents * 100):.1f}% | Immediate intervention |
 
 **Coaching Priority:** {len(coaching_needed)} agents ({pct_coaching:.1f}% of team) require active coaching intervention.
 
@@ -230,6 +233,7 @@ def generate_coaching_summary(results: Dict) -> str:
     
     coaching_needed = results['coaching_needed']
     questions = results['questions']
+    standard = results['tier_thresholds']['standard']
     
     if not coaching_needed:
         return "# Coaching Summary\n\n✅ All agents performing at Standard tier or above. No immediate coaching required."
@@ -247,7 +251,7 @@ def generate_coaching_summary(results: Dict) -> str:
     for i, agent in enumerate(coaching_needed, 1):
         md += f"""### {i}. {agent['name']}
 
-**Current Score:** {agent['avg_percentage']}% | **Tier:** {agent['tier']} | **Target:** ≥80%
+**Current Score:** {agent['avg_percentage']}% | **Tier:** {agent['tier']} | **Target:** ≥{standard:g}%
 
 **Failure Patterns:**
 """
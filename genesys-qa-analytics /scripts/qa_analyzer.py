@@ -14,7 +14,41 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
 import json
+import sys
+
+# Cached, typed reloads through the ISPN columnar frame cache when available
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+try:
+    from utils.frame_cache import load_export
+except ImportError:
+    load_export = None
+
+try:
+    from utils.thresholds import get_spec
+except ImportError:
+    get_spec = None
+
+# Tier minimums used when data/metrics/targets.json isn't reachable
+DEFAULT_TIER_THRESHOLDS = {
+    'exemplary': 95.0,
+    'standard': 80.0,
+    'development': 65.0
+    # Below development = critical
+}
+
+
+def load_tier_thresholds() -> Dict[str, float]:
+    """quality.qa_tiers from targets.json, or the built-in defaults outside the repo"""
+    if get_spec is None:
+        return dict(DEFAULT_TIER_THRESHOLDS)
+    try:
+        spec = get_spec('quality') or {}
+    except OSError:
+        return dict(DEFAULT_TIER_THRESHOLDS)
+    return spec.get('qa_tiers', DEFAULT_TIER_THRESHOLDS)
 
 
 @dataclass
@@ -82,13 +116,9 @@ class GenesysQAAnalyzer:
     - Coaching plan generation
     """
     
-    # Performance tier thresholds (configurable)
-    TIER_THRESHOLDS = {
-        'exemplary': 95.0,
-        'standard': 80.0,
-        'development': 65.0
-        # Below development = critical
-    }
+    # Performance tier thresholds: quality.qa_tiers in data/metrics/targets.json
+    # (exemplary / standard / development minimums; below development = critical)
+    TIER_THRESHOLDS = load_tier_thresholds()
     
     # Calibration thresholds
     CALIBRATION_THRESHOLDS = {
@@ -126,7 +156,7 @@ class GenesysQAAnalyzer:
     def load_and_validate(self) -> bool:
         """Load CSV and validate structure"""
         try:
-            self.df = pd.read_csv(self.csv_path)
+            self.df = load_export(self.csv_path) if load_export else pd.read_csv(self.csv_path)
         except Exception as e:
             self.validation_errors.append(f"Failed to read CSV: {str(e)}")
             return False
@@ -413,6 +443,7 @@ class GenesysQAAnalyzer:
                 'team_std': round(self.team_std, 1) if pd.notna(self.team_std) else None
             },
             'tier_distribution': tier_counts,
+            'tier_thresholds': dict(self.TIER_THRESHOLDS),
             'agents': [self._agent_to_dict(a) for a in sorted_agents],
             'questions': [self._question_to_dict(q) for q in sorted_questions],
             'categories': [self._category_to_dict(c) for c in sorted_categories],
@@ -493,6 +524,8 @@ class GenesysQAAnalyzer:
                     'team_avg_failure': q.failure_rate
                 })
         
+        standard = self.TIER_THRESHOLDS['standard']
+        
         # Generate plan
         plan = f"""
 ═══════════════════════════════════════════════════════════════════════════════
@@ -501,7 +534,7 @@ AGENT COACHING PLAN
 
 Agent: {agent.name}
 Performance Tier: {agent.tier}
-Current Score: {agent.avg_percentage}% | Target: ≥80% | Gap: {max(0, 80 - agent.avg_percentage):.1f}%
+Current Score: {agent.avg_percentage}% | Target: ≥{standard:g}% | Gap: {max(0, standard - agent.avg_percentage):.1f}%
 Evaluations Analyzed: {agent.eval_count}
 Score Consistency (σ): {agent.std_dev if agent.std_dev else 'N/A'}
 
@@ -539,7 +572,7 @@ PRIORITY COACHING AREAS (Ranked by Impact)
 ───────────────────────────────────────────────────────────────────────────────
 SUCCESS METRICS
 ───────────────────────────────────────────────────────────────────────────────
-• Target: Move to Standard tier (≥80%) within 30 days
+• Target: Move to Standard tier (≥{standard:g}%) within 30 days
 • Checkpoint: Re-evaluate minimum 3 calls in 2 weeks
 • KPI: Zero failures on Priority 1-2 items in next evaluation cycle
 • Progress Review: Weekly 1:1 with supervisor to review call samples
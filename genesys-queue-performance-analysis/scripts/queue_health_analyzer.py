@@ -5,38 +5,76 @@ Analyzes Genesys queue performance data against targets and generates summary re
 
 Usage:
     python queue_health_analyzer.py --file queues_performance.csv --targets targets.json --output report.md
+    python queue_health_analyzer.py --file queue_intervals.csv --by-interval     # A month of 15-min rows
+    python queue_health_analyzer.py --file queues_performance.csv --flags-csv flags.csv
+
+Flagging is column-wise (one boolean mask per target), so every row gets
+flag_* columns, a flag_count and the readable performance_flags string
+without a per-row loop; --by-interval summarizes thousands of queue-interval
+rows per queue and per time of day instead of listing each one.
 """
 
 import pandas as pd
+import numpy as np
 import json
 import argparse
 import sys
 from datetime import datetime
 from pathlib import Path
 
+# Targets and RAG rules come from the shared data/metrics/targets.json engine
+# and exports load through the ISPN frame cache, so this needs the repo layout
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+try:
+    from utils import thresholds
+    from utils.frame_cache import load_export
+except ImportError:
+    print("Error: queue_health_analyzer.py must run from the ISPN repo (needs scripts/utils)",
+          file=sys.stderr)
+    sys.exit(1)
+
+# Queue columns reported against targets (targets.json metrics via thresholds.ALIASES)
+TARGET_METRICS = ['service_level_pct', 'abandon_rate_pct', 'avg_wait_time_sec',
+                  'avg_handle_time_min', 'occupancy_pct', 'answer_rate_pct']
+
 
 def load_targets(targets_file):
-    """Load target thresholds from JSON file."""
+    """
+    Load threshold rules, in data/metrics/targets.json form.
+    
+    Without a file these are the shared ISPN targets. A --targets file may
+    use the same form, or map queue columns to plain targets
+    ({"service_level_pct": 85}); a plain target replaces that metric's
+    rule, so anything short of it (or outside it, for ranges) is flagged.
+    """
+    targets = thresholds.load_targets()
     if not targets_file:
-        # Default ISPN targets
-        return {
-            "service_level_pct": 80.0,
-            "abandon_rate_pct": 5.0,
-            "avg_wait_time_sec": 90,
-            "avg_handle_time_min": 10.7,
-            "avg_speed_of_answer_sec": 60,
-            "occupancy_pct": 75.0,
-            "answer_rate_pct": 90.0
-        }
+        return targets
     
     with open(targets_file, 'r') as f:
-        return json.load(f)
+        custom = json.load(f)
+    
+    targets = dict(targets)
+    for metric, value in custom.items():
+        name = thresholds.ALIASES.get(metric, metric)
+        if isinstance(value, dict):
+            targets[name] = value
+            continue
+        spec = thresholds.get_spec(name, targets) or {}
+        rule = {'direction': spec.get('direction', 'higher_better'), 'unit': spec.get('unit')}
+        if rule['direction'] == 'range':
+            rule['target_low'], rule['target_high'] = value, spec.get('target_high', value)
+        else:
+            rule['target'] = value
+        targets[name] = rule
+    return targets
 
 
 def load_queue_data(queue_file):
     """Load Genesys queue performance data from CSV."""
     try:
-        df = pd.read_csv(queue_file)
+        df = load_export(queue_file)
         print(f"✓ Loaded {len(df)} queue records from {queue_file}")
         return df
     except Exception as e:
@@ -68,7 +106,10 @@ def standardize_column_names(df):
         'Avg Speed of Answer': 'avg_speed_of_answer_sec',
         'ASA': 'avg_speed_of_answer_sec',
         'Occupancy': 'occupancy_pct',
-        'Occupancy %': 'occupancy_pct'
+        'Occupancy %': 'occupancy_pct',
+        'Interval': 'interval',
+        'Interval Start': 'interval',
+        'intervalStart': 'interval'
     }
     
     df_renamed = df.rename(columns=column_mapping)
@@ -88,41 +129,55 @@ def calculate_derived_metrics(df):
     return df
 
 
+# (metric column, flag column, flag label for the gap to target)
+FLAG_RULES = [
+    ('service_level_pct', 'flag_sl', "SL {:+.1f}pp"),
+    ('abandon_rate_pct', 'flag_abandon', "Abandon {:+.1f}pp"),
+    ('avg_wait_time_sec', 'flag_awt', "AWT +{:.0f}s"),
+    ('avg_handle_time_min', 'flag_aht', "AHT +{:.1f}m"),
+    ('occupancy_pct', 'flag_occupancy', "Occ {:+.1f}pp"),
+]
+
+ALL_TARGETS_MET = "✓ All targets met"
+
+
+def target_gap(values, evaluator):
+    """Distance from target (the nearer bound for range metrics)."""
+    if evaluator.direction == 'range':
+        low, high = evaluator.bounds[4], evaluator.bounds[5]
+        return values - np.where(values < low, low, high)
+    return values - evaluator.bounds[2]
+
+
 def flag_underperformers(df, targets):
-    """Flag queues that don't meet target thresholds."""
-    flags = []
+    """
+    Flag queues that don't meet target thresholds.
     
-    for idx, row in df.iterrows():
-        queue_flags = []
-        
-        # Service level
-        if 'service_level_pct' in row and row['service_level_pct'] < targets.get('service_level_pct', 80):
-            variance = row['service_level_pct'] - targets['service_level_pct']
-            queue_flags.append(f"SL {variance:+.1f}pp")
-        
-        # Abandon rate
-        if 'abandon_rate_pct' in row and row['abandon_rate_pct'] > targets.get('abandon_rate_pct', 5):
-            variance = row['abandon_rate_pct'] - targets['abandon_rate_pct']
-            queue_flags.append(f"Abandon {variance:+.1f}pp")
-        
-        # Average wait time
-        if 'avg_wait_time_sec' in row and row['avg_wait_time_sec'] > targets.get('avg_wait_time_sec', 90):
-            variance = row['avg_wait_time_sec'] - targets['avg_wait_time_sec']
-            queue_flags.append(f"AWT +{variance:.0f}s")
-        
-        # Average handle time
-        if 'avg_handle_time_min' in row and row['avg_handle_time_min'] > targets.get('avg_handle_time_min', 10.7):
-            variance = row['avg_handle_time_min'] - targets['avg_handle_time_min']
-            queue_flags.append(f"AHT +{variance:.1f}m")
-        
-        # Occupancy
-        if 'occupancy_pct' in row and row['occupancy_pct'] < targets.get('occupancy_pct', 75):
-            variance = row['occupancy_pct'] - targets['occupancy_pct']
-            queue_flags.append(f"Occ {variance:+.1f}pp")
+    Each FLAG_RULES column is classified in one thresholds.get_statuses()
+    call; YELLOW or RED sets its boolean flag_* column. Also adds
+    flag_count and performance_flags (e.g. "SL -4.2pp | AWT +35s").
+    Missing values are never flagged.
+    """
+    flag_text = pd.Series('', index=df.index, dtype=object)
+    flag_columns = []
+    
+    for column, flag_column, label in FLAG_RULES:
+        evaluator = thresholds.get_evaluator(column, targets)
+        if column not in df.columns or evaluator is None:
+            continue
+        values = pd.to_numeric(df[column], errors='coerce')
+        mask = thresholds.get_statuses(column, values, targets).isin(['YELLOW', 'RED'])
+        df[flag_column] = mask
+        flag_columns.append(flag_column)
         
-        flags.append(" | ".join(queue_flags) if queue_flags else "✓ All targets met")
+        # Only flagged cells are formatted; the rest stay ''
+        piece = pd.Series('', index=df.index, dtype=object)
+        piece[mask] = target_gap(values[mask], evaluator).map(label.format)
+        separator = np.where(mask & (flag_text != ''), ' | ', '')
+        flag_text = flag_text + separator + piece
     
-    df['performance_flags'] = flags
+    df['flag_count'] = df[flag_columns].sum(axis=1).astype(int) if flag_columns else 0
+    df['performance_flags'] = flag_text.where(flag_text != '', ALL_TARGETS_MET)
     return df
 
 
@@ -135,12 +190,27 @@ def generate_summary_stats(df, targets):
         'total_abandoned': df['abandoned'].sum() if 'abandoned' in df.columns else 0,
         'avg_service_level': df['service_level_pct'].mean() if 'service_level_pct' in df.columns else 0,
         'avg_abandon_rate': df['abandon_rate_pct'].mean() if 'abandon_rate_pct' in df.columns else 0,
-        'queues_missing_sl_target': len(df[df['service_level_pct'] < targets['service_level_pct']]) if 'service_level_pct' in df.columns else 0,
-        'queues_exceeding_abandon_target': len(df[df['abandon_rate_pct'] > targets['abandon_rate_pct']]) if 'abandon_rate_pct' in df.columns else 0
+        'queues_missing_sl_target': int(df['flag_sl'].sum()) if 'flag_sl' in df.columns else 0,
+        'queues_exceeding_abandon_target': int(df['flag_abandon'].sum()) if 'flag_abandon' in df.columns else 0
     }
     return summary
 
 
+def markdown_rows(df, cells):
+    """
+    Markdown table rows, built column-wise.
+    
+    Args:
+        df: Rows to render
+        cells: [(column, format string, default when the column is missing), ...]
+    """
+    line = pd.Series('|', index=df.index, dtype=object)
+    for column, fmt, default in cells:
+        values = df[column] if column in df.columns else pd.Series(default, index=df.index)
+        line = line + ' ' + values.map(fmt.format).astype(object) + ' |'
+    return line.tolist()
+
+
 def generate_markdown_report(df, targets, summary, output_file):
     """Generate markdown-formatted analysis report."""
     with open(output_file, 'w') as f:
@@ -157,8 +227,10 @@ def generate_markdown_report(df, targets, summary, output_file):
         f.write(f"- Abandoned: {summary['total_abandoned']:,}\n\n")
         
         f.write(f"**Average Metrics:**\n")
-        f.write(f"- Service Level: {summary['avg_service_level']:.1f}% (Target: {targets['service_level_pct']:.0f}%)\n")
-        f.write(f"- Abandon Rate: {summary['avg_abandon_rate']:.1f}% (Target: <{targets['abandon_rate_pct']:.0f}%)\n\n")
+        f.write(f"- Service Level: {summary['avg_service_level']:.1f}% "
+                f"(Target: {thresholds.describe_target('service_level_pct', targets)})\n")
+        f.write(f"- Abandon Rate: {summary['avg_abandon_rate']:.1f}% "
+                f"(Target: {thresholds.describe_target('abandon_rate_pct', targets)})\n\n")
         
         f.write(f"**Performance Gaps:**\n")
         f.write(f"- {summary['queues_missing_sl_target']} queue(s) below service level target\n")
@@ -167,23 +239,20 @@ def generate_markdown_report(df, targets, summary, output_file):
         f.write("---\n\n")
         
         # Underperforming Queues
-        underperformers = df[df['performance_flags'] != "✓ All targets met"]
+        underperformers = df[df['flag_count'] > 0]
         
         if len(underperformers) > 0:
             f.write("## ⚠️ Queues Missing Targets\n\n")
             f.write("| Queue | Offered | SL% | Abandon% | AWT (s) | AHT (m) | Issues |\n")
             f.write("|-------|---------|-----|----------|---------|---------|--------|\n")
             
-            for _, row in underperformers.iterrows():
-                queue_name = row.get('queue_name', 'Unknown')
-                offered = row.get('offered', 0)
-                sl = row.get('service_level_pct', 0)
-                abandon = row.get('abandon_rate_pct', 0)
-                awt = row.get('avg_wait_time_sec', 0)
-                aht = row.get('avg_handle_time_min', 0)
-                flags = row['performance_flags']
-                
-                f.write(f"| {queue_name} | {offered:,.0f} | {sl:.1f}% | {abandon:.1f}% | {awt:.0f} | {aht:.1f} | {flags} |\n")
+            rows = markdown_rows(underperformers, [
+                ('queue_name', '{}', 'Unknown'), ('offered', '{:,.0f}', 0),
+                ('service_level_pct', '{:.1f}%', 0), ('abandon_rate_pct', '{:.1f}%', 0),
+                ('avg_wait_time_sec', '{:.0f}', 0), ('avg_handle_time_min', '{:.1f}', 0),
+                ('performance_flags', '{}', ''),
+            ])
+            f.write("\n".join(rows) + "\n")
             
             f.write("\n")
         else:
@@ -200,13 +269,12 @@ def generate_markdown_report(df, targets, summary, output_file):
             f.write("| Rank | Queue | SL% | Offered | Abandon% |\n")
             f.write("|------|-------|-----|---------|----------|\n")
             
-            for rank, (_, row) in enumerate(top_performers.iterrows(), 1):
-                queue_name = row.get('queue_name', 'Unknown')
-                sl = row.get('service_level_pct', 0)
-                offered = row.get('offered', 0)
-                abandon = row.get('abandon_rate_pct', 0)
-                
-                f.write(f"| {rank} | {queue_name} | {sl:.1f}% | {offered:,.0f} | {abandon:.1f}% |\n")
+            top_performers = top_performers.assign(rank=range(1, len(top_performers) + 1))
+            rows = markdown_rows(top_performers, [
+                ('rank', '{}', ''), ('queue_name', '{}', 'Unknown'), ('service_level_pct', '{:.1f}%', 0),
+                ('offered', '{:,.0f}', 0), ('abandon_rate_pct', '{:.1f}%', 0),
+            ])
+            f.write("\n".join(rows) + "\n")
             
             f.write("\n")
         
@@ -232,8 +300,102 @@ def generate_markdown_report(df, targets, summary, output_file):
         
         f.write("---\n\n")
         f.write("## Target Thresholds Used\n\n")
-        for metric, value in targets.items():
-            f.write(f"- **{metric.replace('_', ' ').title()}:** {value}\n")
+        for metric in TARGET_METRICS:
+            f.write(f"- **{metric.replace('_', ' ').title()}:** {thresholds.describe_target(metric, targets)}\n")
+    
+    print(f"✓ Report generated: {output_file}")
+
+
+def summarize_intervals(df):
+    """
+    Roll flagged queue-interval rows up per queue and per time of day.
+    
+    Returns:
+        (summary dict, per-queue DataFrame, per-time-of-day DataFrame)
+    """
+    df['flagged'] = df['flag_count'] > 0
+    flag_columns = [flag for _, flag, _ in FLAG_RULES if flag in df.columns]
+    
+    agg = {'intervals': ('flagged', 'size'), 'flagged_intervals': ('flagged', 'sum')}
+    agg.update({flag: (flag, 'sum') for flag in flag_columns})
+    for column in ('offered', 'answered', 'abandoned'):
+        if column in df.columns:
+            agg[column] = (column, 'sum')
+    if 'service_level_pct' in df.columns:
+        agg['avg_service_level'] = ('service_level_pct', 'mean')
+        agg['min_service_level'] = ('service_level_pct', 'min')
+    
+    by_queue = df.groupby('queue_name', observed=True).agg(**agg)
+    by_queue['flagged_pct'] = by_queue['flagged_intervals'] / by_queue['intervals'] * 100
+    by_queue = by_queue.sort_values('flagged_pct', ascending=False).reset_index()
+    
+    by_slot = (df.groupby(df['interval'].dt.strftime('%H:%M'))['flagged']
+                 .agg(rows='size', flagged='sum').reset_index())
+    by_slot['flagged_pct'] = by_slot['flagged'] / by_slot['rows'] * 100
+    
+    summary = {
+        'total_queues': df['queue_name'].nunique(),
+        'total_rows': len(df),
+        'first_interval': df['interval'].min(),
+        'last_interval': df['interval'].max(),
+        'flagged_rows': int(df['flagged'].sum()),
+        'total_offered': df['offered'].sum() if 'offered' in df.columns else 0,
+        'avg_service_level': df['service_level_pct'].mean() if 'service_level_pct' in df.columns else 0,
+        'flag_totals': {flag: int(df[flag].sum()) for flag in flag_columns},
+    }
+    return summary, by_queue, by_slot
+
+
+def generate_interval_report(targets, summary, by_queue, by_slot, output_file):
+    """Generate markdown report for --by-interval runs (per queue / time of day, not per row)."""
+    flagged_pct = summary['flagged_rows'] / summary['total_rows'] * 100 if summary['total_rows'] else 0
+    
+    with open(output_file, 'w') as f:
+        f.write("# Genesys Queue Interval Performance Report\n\n")
+        f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"**Intervals:** {summary['first_interval']:%Y-%m-%d %H:%M} to "
+                f"{summary['last_interval']:%Y-%m-%d %H:%M}\n\n")
+        f.write("---\n\n")
+        
+        f.write("## Executive Summary\n\n")
+        f.write(f"- Queues: {summary['total_queues']}\n")
+        f.write(f"- Queue-intervals analyzed: {summary['total_rows']:,}\n")
+        f.write(f"- Queue-intervals missing a target: {summary['flagged_rows']:,} ({flagged_pct:.1f}%)\n")
+        f.write(f"- Offered: {summary['total_offered']:,.0f}\n")
+        f.write(f"- Average Service Level: {summary['avg_service_level']:.1f}% "
+                f"(Target: {thresholds.describe_target('service_level_pct', targets)})\n\n")
+        
+        if summary['flag_totals']:
+            f.write("**Misses by metric:**\n")
+            for flag, count in summary['flag_totals'].items():
+                f.write(f"- {flag.replace('flag_', '').upper()}: {count:,} intervals\n")
+            f.write("\n")
+        
+        f.write("---\n\n")
+        f.write("## Queues by Share of Intervals Missing Target\n\n")
+        f.write("| Queue | Intervals | Flagged | Flagged % | Avg SL% | Worst SL% |\n")
+        f.write("|-------|-----------|---------|-----------|---------|-----------|\n")
+        rows = markdown_rows(by_queue, [
+            ('queue_name', '{}', 'Unknown'), ('intervals', '{:,}', 0), ('flagged_intervals', '{:,}', 0),
+            ('flagged_pct', '{:.1f}%', 0), ('avg_service_level', '{:.1f}', 0),
+            ('min_service_level', '{:.1f}', 0),
+        ])
+        f.write("\n".join(rows) + "\n\n")
+        
+        f.write("---\n\n")
+        f.write("## Times of Day Most Often Missing Target\n\n")
+        f.write("| Interval | Queue-Intervals | Flagged | Flagged % |\n")
+        f.write("|----------|-----------------|---------|-----------|\n")
+        worst = by_slot[by_slot['flagged'] > 0].nlargest(10, 'flagged_pct')
+        rows = markdown_rows(worst, [
+            ('interval', '{}', ''), ('rows', '{:,}', 0), ('flagged', '{:,}', 0), ('flagged_pct', '{:.1f}%', 0),
+        ])
+        f.write("\n".join(rows) + "\n\n" if rows else "No intervals flagged.\n\n")
+        
+        f.write("---\n\n")
+        f.write("## Target Thresholds Used\n\n")
+        for metric in TARGET_METRICS:
+            f.write(f"- **{metric.replace('_', ' ').title()}:** {thresholds.describe_target(metric, targets)}\n")
     
     print(f"✓ Report generated: {output_file}")
 
@@ -256,6 +418,16 @@ def main():
         default='queue_health_report.md',
         help='Output report filename (default: queue_health_report.md)'
     )
+    parser.add_argument(
+        '--by-interval',
+        action='store_true',
+        help='Input is per-queue 15/30-minute interval rows (needs an Interval column); '
+             'report per queue and time of day'
+    )
+    parser.add_argument(
+        '--flags-csv',
+        help='Also write every row with its flag_* columns and performance_flags to this CSV'
+    )
     
     args = parser.parse_args()
     
@@ -271,7 +443,8 @@ def main():
     
     # Load targets
     targets = load_targets(args.targets)
-    print(f"✓ Loaded targets (SL: {targets['service_level_pct']}%, Abandon: <{targets['abandon_rate_pct']}%)")
+    print(f"✓ Loaded targets (SL: {thresholds.describe_target('service_level_pct', targets)}, "
+          f"Abandon: {thresholds.describe_target('abandon_rate_pct', targets)})")
     
     # Load queue data
     df = load_queue_data(args.file)
@@ -285,6 +458,27 @@ def main():
     # Flag underperformers
     df = flag_underperformers(df, targets)
     
+    if args.flags_csv:
+        df.to_csv(args.flags_csv, index=False)
+        print(f"✓ Flags written: {args.flags_csv}")
+    
+    if args.by_interval:
+        if 'interval' not in df.columns or 'queue_name' not in df.columns:
+            print("✗ Error: --by-interval needs Interval and Queue columns")
+            sys.exit(1)
+        df['interval'] = pd.to_datetime(df['interval'])
+        summary, by_queue, by_slot = summarize_intervals(df)
+        generate_interval_report(targets, summary, by_queue, by_slot, args.output)
+        
+        print()
+        print("=" * 60)
+        print(f"Analysis complete!")
+        print(f"Queues analyzed: {summary['total_queues']}")
+        print(f"Queue-intervals analyzed: {summary['total_rows']:,}")
+        print(f"Queue-intervals missing a target: {summary['flagged_rows']:,}")
+        print("=" * 60)
+        return
+    
     # Generate summary statistics
     summary = generate_summary_stats(df, targets)
     
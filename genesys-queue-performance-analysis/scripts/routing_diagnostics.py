@@ -13,13 +13,26 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+# Cached, typed reloads through the ISPN columnar frame cache when available
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'scripts'))
+
+try:
+    from utils.frame_cache import load_export
+except ImportError:
+    load_export = None
+
+
+def read_csv(filepath):
+    """Load a CSV export (cached frame when the ISPN scripts are available)."""
+    return load_export(filepath) if load_export else pd.read_csv(filepath)
+
 
 def load_data(queue_file, agent_file, skills_file):
     """Load all required data files."""
     data = {}
     
     try:
-        data['queues'] = pd.read_csv(queue_file)
+        data['queues'] = read_csv(queue_file)
         print(f"✓ Loaded {len(data['queues'])} queue records")
     except Exception as e:
         print(f"✗ Error loading queue data: {e}")
@@ -27,7 +40,7 @@ def load_data(queue_file, agent_file, skills_file):
     
     if agent_file:
         try:
-            data['agents'] = pd.read_csv(agent_file)
+            data['agents'] = read_csv(agent_file)
             print(f"✓ Loaded {len(data['agents'])} agent records")
         except Exception as e:
             print(f"⚠ Warning: Could not load agent data: {e}")
@@ -37,7 +50,7 @@ def load_data(queue_file, agent_file, skills_file):
     
     if skills_file:
         try:
-            data['skills'] = pd.read_csv(skills_file)
+            data['skills'] = read_csv(skills_file)
             print(f"✓ Loaded {len(data['skills'])} skill group records")
         except Exception as e:
             print(f"⚠ Warning: Could not load skills data: {e}")
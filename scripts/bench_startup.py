@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Benchmark
+
+Runs common ingest.py / board_report.py invocations in fresh interpreters
+under `python -X importtime` and reports wall time, total import time and
+the slowest top-level imports. Each case also lists modules it must not
+import (pandas for --calculate, python-pptx/docx for --help); a violation
+makes the script exit 1, so it can guard against eager imports creeping
+back in.
+
+Usage:
+    python scripts/bench_startup.py              # One run per case
+    python scripts/bench_startup.py --repeat 5   # Best of 5
+"""
+
+import re
+import subprocess
+import sys
+import time
+import argparse
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+BASE_DIR = SCRIPTS_DIR.parent
+
+# (label, interpreter arguments, modules that must not be imported)
+CASES = [
+    ('ingest.py --calculate --all', [str(SCRIPTS_DIR / 'ingest.py'), '--calculate', '--all', '--workers', '1'],
+     ('pandas', 'pptx', 'docx')),
+    ('board_report.py --help', [str(SCRIPTS_DIR / 'board_report.py'), '--help'],
+     ('pandas', 'pptx', 'docx')),
+    ('import ingest', ['-c', f'import sys; sys.path.insert(0, {str(SCRIPTS_DIR)!r}); import ingest'],
+     ('pandas',)),
+]
+
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def parse_importtime(stderr: str) -> list:
+    """[(module, self_us, cumulative_us, depth)] from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2)),
+                         len(match.group(3)) // 2))
+    return rows
+
+
+def run_case(args: list) -> dict:
+    """Run one invocation and summarize its imports."""
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=BASE_DIR,
+                          capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    rows = parse_importtime(proc.stderr)
+    return {
+        'wall_ms': wall * 1000,
+        'import_ms': sum(r[1] for r in rows) / 1000,
+        'modules': {r[0] for r in rows},
+        'top': sorted((r for r in rows if r[3] == 0), key=lambda r: -r[2])[:5],
+        'returncode': proc.returncode,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure CLI startup and import cost')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per case (best is reported)')
+    args = parser.parse_args()
+
+    failures = 0
+    for label, case_args, forbidden in CASES:
+        runs = [run_case(case_args) for _ in range(max(1, args.repeat))]
+        best = min(runs, key=lambda r: r['wall_ms'])
+        loaded = sorted(m for m in forbidden if any(r['modules'] & {m} for r in runs))
+
+        print(f"\n{label}")
+        print(f"  Wall: {best['wall_ms']:.0f} ms   Imports: {best['import_ms']:.0f} ms"
+              f"{'   (exit ' + str(best['returncode']) + ')' if best['returncode'] else ''}")
+        for module, _, cumulative, _ in best['top']:
+            print(f"    {cumulative / 1000:7.1f} ms  {module}")
+        if loaded:
+            failures += 1
+            print(f"  ❌ Imported {', '.join(loaded)}")
+        else:
+            print(f"  ✓ Did not import {', '.join(forbidden)}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
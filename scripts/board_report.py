@@ -3,8 +3,8 @@
 ISPN Board Report Generator v2.0
 
 CRITICAL: This report generator uses ISPN Canonical Calculations ONLY.
-All metrics are sourced from ispn_metrics_history.json - NEVER from raw
-Genesys exports or legacy kpi_history.json.
+All metrics are sourced from the ISPN metrics store (ispn_metrics.db) -
+NEVER from raw Genesys exports or legacy kpi_history.json.
 
 Generates weekly and monthly reports in PPTX and DOCX formats using
 standardized ISPN formulas from Charlie's LT Scorecard.
@@ -15,53 +15,74 @@ Key Differences from v1:
 - Occupancy uses: Call Hours / On Queue Hours
 - ACW uses fixed 15 seconds per call
 
+Weekly reports are calculated on demand from the 15-minute interval store
+(ingest.py keeps raw totals per interval), so a week is a real Monday-Sunday
+window rather than the month it falls in.
+
 Usage:
     python scripts/board_report.py                          # Generate monthly report
-    python scripts/board_report.py --period weekly          # Generate weekly report
+    python scripts/board_report.py --period weekly          # Latest week with interval data
+    python scripts/board_report.py --week 2025-W04          # Specific week
     python scripts/board_report.py --format pptx            # PPTX only
     python scripts/board_report.py --month 2025-01          # Specific month
+    python scripts/board_report.py --workers 1              # Render artifacts serially
+    python scripts/board_report.py --all-periods            # Every month in the store
+    python scripts/board_report.py --range 2025-01:2025-12  # A 12-month board pack
+
+The narrative, PPTX and DOCX are rendered concurrently in a process pool;
+each is written to a temporary file in the output directory and renamed
+into place, so a reader never sees a half-written report.
+
+Batch mode (--all-periods / --range) loads the metrics history once,
+computes every period's deltas in one pass and renders periods in a
+process pool. Each output directory keeps a fingerprint of the data it was
+rendered from (.render.json); periods whose fingerprint still matches are
+skipped unless --force is given.
 """
 
+import os
+import sys
 import json
+import hashlib
+import time
 import argparse
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+# Add scripts to path
+sys.path.insert(0, str(Path(__file__).parent))
 
-from docx import Document
-from docx.shared import Inches as DocxInches, Pt as DocxPt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from utils.store import open_store
+from utils.aggregates import grain_of, previous_period
+from utils.thresholds import describe_target, get_spec, get_evaluator
 
 # Paths
 BASE_DIR = Path(__file__).parent.parent
 METRICS_DIR = BASE_DIR / "data" / "metrics"
+STORE_FILE = METRICS_DIR / "ispn_metrics.db"
 PARSED_DIR = BASE_DIR / "data" / "parsed"
 REPORTS_DIR = BASE_DIR / "reports"
 TEMPLATES_DIR = BASE_DIR / "templates"
 
-# Colors for status indicators
+# Colors for status indicators (RGB; python-pptx is only imported when a deck is built)
 COLORS = {
-    'GREEN': RGBColor(0x28, 0xA7, 0x45),
-    'YELLOW': RGBColor(0xFF, 0xC1, 0x07),
-    'RED': RGBColor(0xDC, 0x35, 0x45),
-    'DARK': RGBColor(0x1A, 0x1A, 0x2E),
-    'ACCENT': RGBColor(0x00, 0xD4, 0xFF),
-    'MUTED': RGBColor(0x6C, 0x75, 0x7D),
+    'GREEN': (0x28, 0xA7, 0x45),
+    'YELLOW': (0xFF, 0xC1, 0x07),
+    'RED': (0xDC, 0x35, 0x45),
+    'DARK': (0x1A, 0x1A, 0x2E),
+    'ACCENT': (0x00, 0xD4, 0xFF),
+    'MUTED': (0x6C, 0x75, 0x7D),
 }
 
-# KPI display configuration
+# KPI display configuration (targets come from targets.json via describe_target())
 KPI_CONFIG = {
     'fcr': {
         'name': 'First Call Resolution',
         'short': 'FCR',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '> 70%',
         'description': 'Calls resolved without escalation'
     },
     'escalation': {
@@ -69,7 +90,6 @@ KPI_CONFIG = {
         'short': 'Escalation',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '< 30%',
         'description': 'Calls requiring escalation'
     },
     'aht': {
@@ -77,7 +97,6 @@ KPI_CONFIG = {
         'short': 'AHT',
         'unit': 'min',
         'format': lambda x: f"{x:.2f}" if x else 'N/A',
-        'target': '< 10.7 min',
         'description': 'Average call duration including hold and ACW'
     },
     'awt': {
@@ -85,7 +104,6 @@ KPI_CONFIG = {
         'short': 'AWT',
         'unit': 'sec',
         'format': lambda x: f"{x:.1f}" if x else 'N/A',
-        'target': '< 90 sec',
         'description': 'Average time to answer'
     },
     'shrinkage': {
@@ -93,7 +111,6 @@ KPI_CONFIG = {
         'short': 'Shrinkage',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '< 30%',
         'description': 'ISPN: (Hours Worked - On Queue) / Hours Worked'
     },
     'utilization': {
@@ -101,7 +118,6 @@ KPI_CONFIG = {
         'short': 'Utilization',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '> 55%',
         'description': 'FY25: Inbound Hours / (Hours Worked - Training)'
     },
     'occupancy': {
@@ -109,7 +125,6 @@ KPI_CONFIG = {
         'short': 'Occupancy',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '> 65%',
         'description': 'ISPN: Call Hours / On Queue Hours'
     },
     'quality': {
@@ -117,7 +132,6 @@ KPI_CONFIG = {
         'short': 'Quality',
         'unit': 'pts',
         'format': lambda x: f"{x:.1f}" if x else 'N/A',
-        'target': '> 88',
         'description': 'Average tech review score'
     },
     'abandon': {
@@ -125,12 +139,19 @@ KPI_CONFIG = {
         'short': 'Abandon',
         'unit': '%',
         'format': lambda x: f"{x:.1%}" if x else 'N/A',
-        'target': '< 5%',
         'description': 'Calls abandoned before answer'
     },
 }
 
 
+# KPIs charted on the trend slides, and how far back they go
+TREND_KPIS = ['fcr', 'aht', 'awt', 'shrinkage', 'utilization']
+TREND_MONTHS = 12
+
+# Value-axis formats for trend charts (percent KPIs are stored as fractions)
+TREND_NUMBER_FORMATS = {'%': '0%', 'min': '0.0', 'sec': '0'}
+
+
 # =============================================================================
 # DATA LOADING - ISPN CANONICAL METRICS ONLY
 # =============================================================================
@@ -142,22 +163,49 @@ def load_ispn_metrics_history() -> dict:
     CRITICAL: This is the ONLY valid source for board reports.
     Never use kpi_history.json or raw Genesys values.
     """
-    history_file = METRICS_DIR / "ispn_metrics_history.json"
+    with open_store(STORE_FILE) as store:
+        data = store.load_metrics_history()
     
-    if not history_file.exists():
-        print(f"⚠️  ISPN metrics history not found: {history_file}")
+    if not data['periods']:
+        print(f"⚠️  No ISPN metrics found in: {STORE_FILE}")
         print("   Run: python scripts/ingest.py --calculate")
-        return {'periods': {}}
     
-    with open(history_file, 'r') as f:
-        data = json.load(f)
+    return data
+
+
+def periods_of_grain(history: dict, grain: str) -> dict:
+    """History restricted to one period grain ('month', 'week', ...)."""
+    return {
+        'periods': {k: v for k, v in history.get('periods', {}).items() if grain_of(k) == grain},
+        'last_updated': history.get('last_updated'),
+    }
+
+
+def latest_interval_week() -> Optional[str]:
+    """ISO week (YYYY-Www) of the most recent interval data, or None."""
+    with open_store(STORE_FILE) as store:
+        span = store.interval_span()
+    if not span:
+        return None
+    iso = datetime.strptime(span[1][:10], '%Y-%m-%d').isocalendar()
+    return f"{iso[0]:04d}-W{iso[1]:02d}"
+
+
+def calculate_period_metrics(period: str) -> Optional[dict]:
+    """
+    Calculate and store ISPN metrics for a week (or any date range) from
+    the interval store, via the canonical engine in ingest.py.
     
-    # Verify it has the expected structure
-    if 'periods' not in data:
-        print("⚠️  Invalid ISPN metrics history format")
-        return {'periods': {}}
+    Returns:
+        The stored metrics record, or None if no raw data covers the period
+    """
+    from ingest import run_ispn_calculations
     
-    return data
+    metrics, _ = run_ispn_calculations(period)
+    if metrics is None:
+        return None
+    with open_store(STORE_FILE) as store:
+        return store.get_metrics(period)
 
 
 def get_latest_period(history: dict) -> Tuple[Optional[str], Optional[dict]]:
@@ -204,6 +252,25 @@ def calculate_deltas(current: dict, previous: dict) -> dict:
     return deltas
 
 
+def build_trends(history: dict, period: str, months: int = TREND_MONTHS) -> dict:
+    """
+    Trailing monthly series (up to and including period) for the trend slides.
+    
+    Returns:
+        {'periods': [...], 'kpis': {kpi: [value or None, ...]}}
+    """
+    periods = [p for p in sorted(history.get('periods', {})) if p <= period][-months:]
+    return trends_from_records([(p, history['periods'][p]) for p in periods])
+
+
+def trends_from_records(records: list) -> dict:
+    """Trend series from [(period, metrics record), ...] in period order."""
+    return {
+        'periods': [p for p, _ in records],
+        'kpis': {kpi: [record.get('kpis', {}).get(kpi) for _, record in records] for kpi in TREND_KPIS},
+    }
+
+
 # =============================================================================
 # NARRATIVE GENERATION
 # =============================================================================
@@ -381,8 +448,48 @@ def generate_narrative(period: str, data: dict, deltas: dict) -> str:
 # PPTX GENERATION
 # =============================================================================
 
-def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
-    """Generate PowerPoint presentation with ISPN metrics."""
+def trend_targets(kpi: str) -> list:
+    """[(series name, value)] target lines for a trend chart, in the KPI's stored unit."""
+    spec, evaluator = get_spec(kpi), get_evaluator(kpi)
+    if not spec or evaluator is None:
+        return []
+    scale = evaluator.scale('fraction' if KPI_CONFIG[kpi]['unit'] == '%' else None)
+    if evaluator.direction == 'range':
+        return [('Target low', spec['target_low'] / scale), ('Target high', spec['target_high'] / scale)]
+    if spec.get('target') is None:
+        return []
+    return [('Target', spec['target'] / scale)]
+
+
+def trend_chart_spec(kpi: str, trends: dict) -> dict:
+    """Chart spec (see utils.chart_cache.add_line_chart) for one KPI's trend."""
+    periods = trends['periods']
+    series = [{'name': KPI_CONFIG[kpi]['short'], 'values': trends['kpis'][kpi],
+               'color': COLORS['ACCENT'], 'width': 2.5}]
+    for name, value in trend_targets(kpi):
+        series.append({'name': name, 'values': [value] * len(periods), 'color': COLORS['MUTED'],
+                       'width': 1.5, 'dashed': True, 'markers': False})
+    return {
+        'categories': periods,
+        'number_format': TREND_NUMBER_FORMATS.get(KPI_CONFIG[kpi]['unit'], 'General'),
+        'font_size': 12,
+        'series': series,
+    }
+
+
+def create_pptx(period: str, data: dict, deltas: dict, output_path: Path, trends: dict = None):
+    """
+    Generate PowerPoint presentation with ISPN metrics.
+    
+    trends (build_trends()) adds a 12-month chart slide per TREND_KPIS
+    entry; charts are reused from the chart cache when their series match.
+    """
+    from pptx import Presentation
+    from pptx.util import Inches, Pt
+    from pptx.dml.color import RGBColor
+    from pptx.enum.text import PP_ALIGN
+    
+    colors = {name: RGBColor(*rgb) for name, rgb in COLORS.items()}
     prs = Presentation()
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
@@ -416,7 +523,7 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
     p = tf.paragraphs[0]
     p.text = "Using ISPN Canonical Calculations (Charlie's LT Scorecard)"
     p.font.size = Pt(14)
-    p.font.color.rgb = COLORS['MUTED']
+    p.font.color.rgb = colors['MUTED']
     p.alignment = PP_ALIGN.CENTER
     
     # =========================================================================
@@ -452,20 +559,20 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         p = tf.paragraphs[0]
         p.text = f"{status_name}: {count} KPIs"
         p.font.size = Pt(24)
-        p.font.color.rgb = COLORS[status_name]
+        p.font.color.rgb = colors[status_name]
         p.font.bold = True
         y_pos += 1.0
     
     # Overall status
     if status_counts['RED'] >= 2:
         overall_status = "ATTENTION REQUIRED"
-        overall_color = COLORS['RED']
+        overall_color = colors['RED']
     elif status_counts['RED'] == 1 or status_counts['YELLOW'] > 2:
         overall_status = "MONITORING"
-        overall_color = COLORS['YELLOW']
+        overall_color = colors['YELLOW']
     else:
         overall_status = "ON TRACK"
-        overall_color = COLORS['GREEN']
+        overall_color = colors['GREEN']
     
     status_box = slide.shapes.add_textbox(Inches(6), Inches(2), Inches(6), Inches(2))
     tf = status_box.text_frame
@@ -503,7 +610,7 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         p.text = header
         p.font.size = Pt(14)
         p.font.bold = True
-        p.font.color.rgb = COLORS['MUTED']
+        p.font.color.rgb = colors['MUTED']
     
     y_pos = 1.7
     
@@ -543,7 +650,7 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         p = tf.paragraphs[0]
         p.text = str(target)
         p.font.size = Pt(14)
-        p.font.color.rgb = COLORS['MUTED']
+        p.font.color.rgb = colors['MUTED']
         
         # Status
         box = slide.shapes.add_textbox(Inches(x_positions[3]), Inches(y_pos), Inches(col_widths[3]), Inches(0.5))
@@ -551,7 +658,7 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         p = tf.paragraphs[0]
         p.text = "●"
         p.font.size = Pt(24)
-        p.font.color.rgb = COLORS.get(status, COLORS['MUTED'])
+        p.font.color.rgb = colors.get(status, colors['MUTED'])
         
         # Delta
         if delta is not None:
@@ -568,7 +675,37 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         y_pos += 0.55
     
     # =========================================================================
-    # SLIDE 4: Formula Methodology
+    # TREND SLIDES: 12-month history per KPI
+    # =========================================================================
+    if trends and len(trends['periods']) > 1:
+        from utils.chart_cache import add_line_chart
+        
+        for kpi in TREND_KPIS:
+            values = trends['kpis'].get(kpi, [])
+            if all(v is None for v in values):
+                continue
+            config = KPI_CONFIG[kpi]
+            slide = prs.slides.add_slide(slide_layout)
+            
+            title = slide.shapes.add_textbox(Inches(0.5), Inches(0.3), Inches(12), Inches(0.8))
+            p = title.text_frame.paragraphs[0]
+            p.text = f"{config['name']}: {len(trends['periods'])}-Month Trend"
+            p.font.size = Pt(32)
+            p.font.bold = True
+            
+            latest = next((v for v in reversed(values) if v is not None), None)
+            subtitle = slide.shapes.add_textbox(Inches(0.5), Inches(1.0), Inches(12), Inches(0.5))
+            p = subtitle.text_frame.paragraphs[0]
+            p.text = (f"{trends['periods'][0]} to {trends['periods'][-1]}   |   "
+                      f"Target: {describe_target(kpi)}   |   Latest: {config['format'](latest)}")
+            p.font.size = Pt(14)
+            p.font.color.rgb = colors['MUTED']
+            
+            add_line_chart(slide, trend_chart_spec(kpi, trends),
+                           Inches(0.5), Inches(1.6), Inches(12.3), Inches(5.5))
+    
+    # =========================================================================
+    # FINAL SLIDE: Formula Methodology
     # =========================================================================
     slide = prs.slides.add_slide(slide_layout)
     
@@ -613,7 +750,7 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
         p = tf.paragraphs[0]
         p.text = f"[{source}]"
         p.font.size = Pt(12)
-        p.font.color.rgb = COLORS['MUTED']
+        p.font.color.rgb = colors['MUTED']
         
         y_pos += 0.6
     
@@ -624,11 +761,10 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
     p.text = "Source: Charlie's LT Scorecard Formulas (ISPN_iGLASS_LT_Scorecard_Weekly_Monthly_2025.xlsx)"
     p.font.size = Pt(12)
     p.font.italic = True
-    p.font.color.rgb = COLORS['MUTED']
+    p.font.color.rgb = colors['MUTED']
     
     # Save
-    prs.save(output_path)
-    print(f"  ✓ Created: {output_path}")
+    write_atomic(output_path, prs.save)
 
 
 # =============================================================================
@@ -637,6 +773,10 @@ def create_pptx(period: str, data: dict, deltas: dict, output_path: Path):
 
 def create_docx(period: str, narrative: str, output_path: Path):
     """Generate Word document with ISPN metrics."""
+    from docx import Document
+    from docx.shared import Pt as DocxPt
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    
     doc = Document()
     
     # Title
@@ -700,8 +840,281 @@ def create_docx(period: str, narrative: str, output_path: Path):
         elif line.strip():
             doc.add_paragraph(line)
     
-    doc.save(output_path)
-    print(f"  ✓ Created: {output_path}")
+    write_atomic(output_path, doc.save)
+
+
+# =============================================================================
+# RENDERING
+# =============================================================================
+
+# Artifacts in the order they are reported: (kind, file name)
+ARTIFACTS = [
+    ('narrative', 'narrative.md'),
+    ('pptx', 'board_report.pptx'),
+    ('docx', 'board_report.docx'),
+]
+
+
+def write_atomic(output_path: Path, write):
+    """
+    Write a file via a temporary sibling and rename it into place.
+    
+    Args:
+        output_path: Final path
+        write: Callable taking the temporary path (e.g. prs.save)
+    """
+    tmp = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, output_path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def write_narrative(narrative: str, output_path: Path):
+    """Save the narrative markdown."""
+    def write(tmp):
+        with open(tmp, 'w') as f:
+            f.write(narrative)
+    write_atomic(output_path, write)
+
+
+def render_artifact(kind: str, output_path: Path, period: str, data: dict, deltas: dict,
+                    narrative: str, trends: dict = None) -> float:
+    """Render one artifact; returns seconds taken. Runs in a pool worker."""
+    start = time.perf_counter()
+    if kind == 'narrative':
+        write_narrative(narrative, output_path)
+    elif kind == 'pptx':
+        create_pptx(period, data, deltas, output_path, trends)
+    elif kind == 'docx':
+        create_docx(period, narrative, output_path)
+    else:
+        raise ValueError(f"Unknown artifact: {kind}")
+    return time.perf_counter() - start
+
+
+def render_reports(output_dir: Path, kinds: list, period: str, data: dict, deltas: dict,
+                   narrative: str, workers: int = None, trends: dict = None) -> dict:
+    """
+    Render artifacts concurrently (one process each, up to workers).
+    
+    python-pptx and python-docx are pure Python, so processes rather than
+    threads are what actually overlap them.
+    
+    Returns:
+        {kind: {'path', 'seconds'} or {'path', 'error'}} in ARTIFACTS order
+    """
+    jobs = [(kind, output_dir / name) for kind, name in ARTIFACTS if kind in kinds]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    results = {}
+    
+    if workers == 1:
+        for kind, path in jobs:
+            try:
+                results[kind] = {'path': path,
+                                 'seconds': render_artifact(kind, path, period, data, deltas, narrative,
+                                                            trends)}
+            except Exception as e:
+                results[kind] = {'path': path, 'error': str(e)}
+        return results
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(kind, path, executor.submit(render_artifact, kind, path, period, data, deltas,
+                                                narrative, trends))
+                   for kind, path in jobs]
+        for kind, path, future in futures:
+            try:
+                results[kind] = {'path': path, 'seconds': future.result()}
+            except Exception as e:
+                results[kind] = {'path': path, 'error': str(e)}
+    return results
+
+
+def print_render_timings(results: dict, wall: float):
+    """Per-artifact timings, and what the concurrent run saved."""
+    for kind, result in results.items():
+        if 'error' in result:
+            print(f"  ❌ {result['path'].name}: {result['error']}")
+        else:
+            print(f"  ✓ Created: {result['path'].name:<20} {result['seconds']:6.2f}s")
+    serial = sum(r.get('seconds', 0) for r in results.values())
+    print(f"  ⏱  Rendered in {wall:.2f}s (artifacts total {serial:.2f}s)")
+
+
+# =============================================================================
+# BATCH GENERATION
+# =============================================================================
+
+# Bump when slide or document layout changes so batch runs re-render
+RENDER_VERSION = 2
+
+# Per-directory record of what the artifacts were rendered from
+MANIFEST_NAME = '.render.json'
+
+
+def render_fingerprint(period: str, data: dict, prev_period: Optional[str], prev_data: Optional[dict],
+                       kinds: list, trends: dict = None) -> str:
+    """sha256 of everything a period's artifacts are rendered from."""
+    payload = json.dumps({
+        'period': period,
+        'data': data,
+        'previous': [prev_period, prev_data],
+        'trends': trends,
+        'kinds': sorted(kinds),
+        'render_version': RENDER_VERSION,
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_rendered(output_dir: Path, fingerprint: str, kinds: list) -> bool:
+    """True if output_dir holds all kinds, rendered from the same fingerprint."""
+    try:
+        with open(output_dir / MANIFEST_NAME) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    names = dict(ARTIFACTS)
+    return (manifest.get('fingerprint') == fingerprint
+            and all((output_dir / names[kind]).exists() for kind in kinds))
+
+
+def record_rendered(output_dir: Path, fingerprint: str, kinds: list):
+    """Write the render manifest once all artifacts are in place."""
+    def write(tmp):
+        with open(tmp, 'w') as f:
+            json.dump({'fingerprint': fingerprint, 'kinds': sorted(kinds),
+                       'rendered_at': datetime.now().isoformat()}, f, indent=2)
+    write_atomic(output_dir / MANIFEST_NAME, write)
+
+
+def select_periods(history: dict, period_range: Optional[str] = None) -> list:
+    """
+    Months to render, oldest first.
+    
+    Args:
+        history: Monthly metrics history
+        period_range: 'YYYY-MM:YYYY-MM' (inclusive), or None for all periods
+    """
+    periods = sorted(history.get('periods', {}))
+    if not period_range:
+        return periods
+    start, _, end = period_range.partition(':')
+    end = end or start
+    if grain_of(start) != 'month' or grain_of(end) != 'month':
+        raise ValueError(f"Invalid range: {period_range} (expected YYYY-MM:YYYY-MM)")
+    return [p for p in periods if start <= p <= end]
+
+
+def batch_jobs(history: dict, periods: list, kinds: list) -> list:
+    """
+    One render job per period, with deltas against the previous period in
+    the history and trailing trend series (a single pass over the sorted
+    periods).
+    """
+    wanted = set(periods)
+    jobs = []
+    prev_period, prev_data = None, None
+    window = []
+    for period in sorted(history.get('periods', {})):
+        data = history['periods'][period]
+        window = (window + [(period, data)])[-TREND_MONTHS:]
+        if period in wanted:
+            trends = trends_from_records(window)
+            jobs.append({
+                'period': period,
+                'data': data,
+                'deltas': calculate_deltas(data, prev_data) if prev_data else {},
+                'trends': trends,
+                'output_dir': REPORTS_DIR / "board" / period,
+                'kinds': kinds,
+                'fingerprint': render_fingerprint(period, data, prev_period, prev_data, kinds, trends),
+            })
+        prev_period, prev_data = period, data
+    return jobs
+
+
+def render_period(job: dict) -> dict:
+    """Render one period's artifacts serially. Runs in a pool worker."""
+    start = time.perf_counter()
+    job['output_dir'].mkdir(parents=True, exist_ok=True)
+    narrative = generate_narrative(job['period'], job['data'], job['deltas'])
+    results = render_reports(job['output_dir'], job['kinds'], job['period'], job['data'],
+                             job['deltas'], narrative, workers=1, trends=job['trends'])
+    return {'period': job['period'], 'results': results, 'seconds': time.perf_counter() - start}
+
+
+def render_batch(jobs: list, workers: int = None, force: bool = False) -> list:
+    """
+    Render every job whose output is missing or stale, in a process pool.
+    
+    Returns:
+        [{'period', 'skipped'} or {'period', 'results', 'seconds'}] in period order
+    """
+    pending = [job for job in jobs
+               if force or not is_rendered(job['output_dir'], job['fingerprint'], job['kinds'])]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(pending) or 1))
+    
+    if workers == 1:
+        rendered = [render_period(job) for job in pending]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            rendered = list(executor.map(render_period, pending))
+    
+    by_period = {}
+    for job, result in zip(pending, rendered):
+        if not any('error' in r for r in result['results'].values()):
+            record_rendered(job['output_dir'], job['fingerprint'], job['kinds'])
+        by_period[job['period']] = result
+    return [by_period.get(job['period'], {'period': job['period'], 'skipped': True}) for job in jobs]
+
+
+def print_batch(results: list, wall: float):
+    """One line per period, then totals."""
+    failed = 0
+    for result in results:
+        if result.get('skipped'):
+            print(f"  ↷ {result['period']:<10} unchanged")
+            continue
+        errors = [f"{r['path'].name}: {r['error']}" for r in result['results'].values() if 'error' in r]
+        if errors:
+            failed += 1
+            print(f"  ❌ {result['period']:<10} {'; '.join(errors)}")
+        else:
+            timings = '  '.join(f"{kind} {r['seconds']:.2f}s" for kind, r in result['results'].items())
+            print(f"  ✓ {result['period']:<10} {result['seconds']:5.2f}s  ({timings})")
+    skipped = sum(1 for r in results if r.get('skipped'))
+    print(f"\nRendered: {len(results) - skipped - failed}  Unchanged: {skipped}  Failed: {failed}"
+          f"  ({wall:.2f}s)")
+    return failed
+
+
+def run_batch(args, kinds: list):
+    """--all-periods / --range: render many months from one history load."""
+    history = periods_of_grain(load_ispn_metrics_history(), 'month')
+    if not history.get('periods'):
+        print("\n❌ No ISPN metrics data found.")
+        print("   Run: python scripts/ingest.py --calculate")
+        return
+    
+    try:
+        periods = select_periods(history, args.range)
+    except ValueError as e:
+        print(f"\n❌ {e}")
+        return
+    if not periods:
+        print(f"\n❌ No data for range: {args.range}")
+        print(f"   Available periods: {', '.join(sorted(history['periods'].keys()))}")
+        return
+    
+    print(f"\n📊 Rendering {len(periods)} period(s): {periods[0]} .. {periods[-1]}")
+    print(f"📁 Output: {REPORTS_DIR / 'board'}")
+    
+    start = time.perf_counter()
+    results = render_batch(batch_jobs(history, periods, kinds), args.workers, args.force)
+    if print_batch(results, time.perf_counter() - start):
+        sys.exit(1)
 
 
 # =============================================================================
@@ -719,6 +1132,14 @@ def main():
     parser.add_argument('--week', type=str, help='Week (YYYY-Wxx) for weekly report')
     parser.add_argument('--format', choices=['pptx', 'docx', 'both'], default='both',
                         help='Output format')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Render processes (default: one per artifact, or per period in batch '
+                             'mode, up to CPU count; 1 = serial)')
+    parser.add_argument('--all-periods', action='store_true',
+                        help='Render every monthly period in the metrics store')
+    parser.add_argument('--range', type=str, help='Render months START:END, e.g. 2025-01:2025-12')
+    parser.add_argument('--force', action='store_true',
+                        help='Batch mode: re-render periods even if their data is unchanged')
     args = parser.parse_args()
     
     print("=" * 60)
@@ -726,34 +1147,66 @@ def main():
     print("Using ISPN Canonical Calculations")
     print("=" * 60)
     
-    # Load ISPN metrics (NOT legacy kpi_history.json)
-    history = load_ispn_metrics_history()
+    kinds = ['narrative']
+    if args.format in ['pptx', 'both']:
+        kinds.append('pptx')
+    if args.format in ['docx', 'both']:
+        kinds.append('docx')
     
-    if not history.get('periods'):
-        print("\n❌ No ISPN metrics data found.")
-        print("   Run: python scripts/ingest.py --calculate")
-        print("   to calculate metrics from raw Genesys data.")
+    if args.all_periods or args.range:
+        run_batch(args, kinds)
         return
     
-    # Get period to report on
-    if args.month:
-        period = args.month
-        if period not in history['periods']:
-            print(f"\n❌ No data for period: {period}")
-            print(f"   Available periods: {', '.join(sorted(history['periods'].keys()))}")
+    weekly = args.period == 'weekly' or bool(args.week)
+    
+    if weekly:
+        # Weeks come straight from the interval store (ISPN canonical engine)
+        period = args.week or latest_interval_week()
+        if not period or grain_of(period) != 'week':
+            print(f"\n❌ {'Invalid week: ' + period if period else 'No interval data found.'}")
+            print("   Weeks are YYYY-Www, e.g. --week 2025-W04; ingest Interactions exports first.")
             return
-        data = history['periods'][period]
+        data = calculate_period_metrics(period)
+        if not data:
+            print(f"\n❌ No interval data for week: {period}")
+            return
+        print(f"\n📐 Calculated {period} from 15-minute interval data")
+        prev_period = previous_period(period)
+        prev_data = calculate_period_metrics(prev_period)
+        if not prev_data:
+            prev_period = None
+        trends = None  # Trend slides are monthly (board packs)
     else:
-        period, data = get_latest_period(history)
-    
-    if not period or not data:
-        print("\n❌ No KPI data found.")
-        return
+        # Load ISPN metrics (NOT legacy kpi_history.json)
+        history = periods_of_grain(load_ispn_metrics_history(), 'month')
+        
+        if not history.get('periods'):
+            print("\n❌ No ISPN metrics data found.")
+            print("   Run: python scripts/ingest.py --calculate")
+            print("   to calculate metrics from raw Genesys data.")
+            return
+        
+        # Get period to report on
+        if args.month:
+            period = args.month
+            if period not in history['periods']:
+                print(f"\n❌ No data for period: {period}")
+                print(f"   Available periods: {', '.join(sorted(history['periods'].keys()))}")
+                return
+            data = history['periods'][period]
+        else:
+            period, data = get_latest_period(history)
+        
+        if not period or not data:
+            print("\n❌ No KPI data found.")
+            return
+        
+        # Get previous period for deltas
+        prev_period, prev_data = get_previous_period(history, period)
+        trends = build_trends(history, period)
     
     print(f"\n📊 Using data from period: {period}")
     
-    # Get previous period for deltas
-    prev_period, prev_data = get_previous_period(history, period)
     if prev_period:
         print(f"📈 Comparing to previous: {prev_period}")
     else:
@@ -766,29 +1219,23 @@ def main():
     narrative = generate_narrative(period, data, deltas)
     
     # Create output directory
-    if args.period == 'monthly':
-        output_dir = REPORTS_DIR / "board" / period
+    if weekly:
+        output_dir = REPORTS_DIR / "weekly" / period
     else:
-        output_dir = REPORTS_DIR / "weekly" / (args.week or period)
+        output_dir = REPORTS_DIR / "board" / period
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Generate outputs
     print(f"\n📁 Generating reports in: {output_dir}")
     
-    # Save narrative markdown
-    md_path = output_dir / "narrative.md"
-    with open(md_path, 'w') as f:
-        f.write(narrative)
-    print(f"  ✓ Created: {md_path.name}")
-    
-    if args.format in ['pptx', 'both']:
-        pptx_path = output_dir / "board_report.pptx"
-        create_pptx(period, data, deltas, pptx_path)
-    
-    if args.format in ['docx', 'both']:
-        docx_path = output_dir / "board_report.docx"
-        create_docx(period, narrative, docx_path)
+    start = time.perf_counter()
+    results = render_reports(output_dir, kinds, period, data, deltas, narrative, args.workers, trends)
+    print_render_timings(results, time.perf_counter() - start)
+    if any('error' in r for r in results.values()):
+        print("\n❌ Some reports failed to render")
+        sys.exit(1)
+    record_rendered(output_dir, render_fingerprint(period, data, prev_period, prev_data, kinds, trends), kinds)
     
     # Print summary
     print("\n" + "=" * 60)
@@ -17,26 +17,38 @@ Processes Genesys Cloud exports and internal ISPN files:
 Usage:
     python scripts/ingest.py                    # Process all files in data/raw/
     python scripts/ingest.py path/to/file.csv   # Process single file
+    python scripts/ingest.py --workers 8        # Parse data/raw/ files in 8 processes
+    python scripts/ingest.py --force            # Re-ingest files already in the manifest
     python scripts/ingest.py --calculate        # Run ISPN calculations on stored raw data
+    python scripts/ingest.py --calculate --period 2025-W04               # Any week, month or FY
+    python scripts/ingest.py --calculate --period 2025-01-06..2025-01-19 # Custom date range
+    python scripts/ingest.py --calculate --all  # Recompute only periods whose inputs changed
+    python scripts/ingest.py --watch            # Ingest new data/raw/ files as they land
+    python scripts/ingest.py --watch --poll 5 --settle 10
 """
 
+import os
 import sys
 import json
 import shutil
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from utils.parsers import parse_file, identify_file_type
-from utils.validators import validate_data, get_status, THRESHOLDS
+from utils.validators import validate_data, get_status
+from utils.thresholds import describe_target, load_targets
+from utils.store import MetricsStore, open_store
+from utils.aggregates import grain_of, period_bounds
 from utils.ispn_calculations import (
     ISPNCalculationEngine, 
     GenesysRawData, 
     ISPNCalculatedMetrics,
-    TARGETS,
     MS_TO_HOURS,
     MS_TO_MINUTES,
 )
@@ -51,6 +63,7 @@ DATA_DIR = BASE_DIR / 'data'
 RAW_DIR = DATA_DIR / 'raw'
 PARSED_DIR = DATA_DIR / 'parsed'
 METRICS_DIR = DATA_DIR / 'metrics'
+STORE_FILE = METRICS_DIR / 'ispn_metrics.db'
 
 # Output subdirectories by source type
 OUTPUT_DIRS = {
@@ -67,9 +80,32 @@ OUTPUT_DIRS = {
     'wcs': PARSED_DIR / 'wcs',
 }
 
+# Store sections that also keep 15-minute interval totals (parser 'intervals')
+INTERVAL_SECTIONS = {
+    'genesys_interactions': 'interactions',
+    'genesys_agent_status': 'agent_status',
+}
+
+# Interval-grain output of those sources lives in the store, not in the parsed JSON
+STORE_ONLY_KEYS = ('intervals', 'agent_days')
+
+# Export file types picked up from data/raw/
+SUPPORTED_EXTENSIONS = ('.csv', '.xlsx', '.xls')
+
+# Watch mode: seconds between scans, and how long a file's size and mtime
+# must stay unchanged before it counts as fully written
+WATCH_POLL_SECONDS = 2.0
+WATCH_SETTLE_SECONDS = 5.0
+
 # ISPN Calculation Engine instance
 CALC_ENGINE = ISPNCalculationEngine()
 
+# Metrics store (opened lazily by get_store)
+_STORE = None
+
+# Legacy KPI history kept in memory between files: (entries, file mtime_ns)
+_KPI_HISTORY = None
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -83,65 +119,95 @@ def ensure_dirs():
     RAW_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def load_raw_data_store() -> dict:
-    """Load the raw data store for ISPN calculations."""
-    store_file = METRICS_DIR / 'raw_data_store.json'
-    if store_file.exists():
-        with open(store_file) as f:
-            return json.load(f)
-    return {'periods': {}, 'last_updated': None}
+def get_store() -> MetricsStore:
+    """
+    Return the process-wide metrics store.
+    
+    Opened on first use; legacy JSON documents are migrated on that first open.
+    """
+    global _STORE
+    if _STORE is None:
+        _STORE = open_store(STORE_FILE)
+    return _STORE
 
 
-def save_raw_data_store(store: dict):
-    """Save the raw data store."""
-    store_file = METRICS_DIR / 'raw_data_store.json'
-    store['last_updated'] = datetime.now().isoformat()
-    with open(store_file, 'w') as f:
-        json.dump(store, f, indent=2, default=str)
+def load_raw_data_store() -> dict:
+    """Load the raw data store for ISPN calculations (legacy dict shape)."""
+    return get_store().load_raw_store()
 
 
-def update_raw_data_store(source: str, raw_data: dict, period: str = None):
+def update_raw_data_store(source: str, raw_data: dict, period: str = None, part: str = None):
     """
     Update raw data store with extracted values.
     Raw data accumulates across file types until ISPN calculation is triggered.
+    
+    period should come from the export itself (see extract_raw_by_period);
+    None falls back to the current month for exports without dates.
+    
+    Interactions, Agent Status and Adherence values are merged per file
+    (part = the file's content hash): two partial exports for one month add
+    up, and re-ingesting the same file replaces its earlier contribution.
+    Without a part, each source keeps a single contribution per period.
     """
     if period is None:
         period = datetime.now().strftime('%Y-%m')
     
-    store = load_raw_data_store()
-    
-    if period not in store['periods']:
-        store['periods'][period] = {
-            'interactions': {},
-            'agent_status': {},
-            'helpdesk': {},
-            'quality': {},
-            'manual': {},
-            'metadata': {'files_processed': []}
-        }
-    
-    period_data = store['periods'][period]
+    store = get_store()
     
     # Map source types to store sections
     if source == 'genesys_interactions':
-        period_data['interactions'].update(raw_data)
+        store.add_raw_part(period, 'interactions', part or source, raw_data, source=source)
     elif source == 'genesys_agent_status':
-        period_data['agent_status'].update(raw_data)
+        store.add_raw_part(period, 'agent_status', part or source, raw_data, source=source)
     elif source == 'genesys_agent_performance':
         # Can be used for validation/cross-check
-        period_data['agent_performance'] = raw_data
+        store.upsert_raw(period, 'agent_performance', raw_data, replace=True, source=source)
     elif source == 'genesys_adherence':
-        period_data['adherence'] = raw_data
-    
-    period_data['metadata']['files_processed'].append({
-        'source': source,
-        'timestamp': datetime.now().isoformat()
-    })
+        store.add_raw_part(period, 'adherence', part or source, raw_data, source=source)
+    else:
+        store.upsert_raw(period, source, {}, source=source)
     
-    save_raw_data_store(store)
     return period
 
 
+def find_ingested(content_hash: str, filepath: Path) -> Optional[dict]:
+    """
+    Return the manifest record if this exact file was already ingested.
+    
+    A record only counts if it was produced by the current PARSER_VERSION
+    and matches the file size, so a parser change re-ingests everything.
+    """
+    from utils.manifest import PARSER_VERSION
+    
+    entry = get_store().get_ingested(content_hash)
+    if entry is None:
+        return None
+    if entry.get('parser_version') != PARSER_VERSION:
+        return None
+    if entry.get('size') != filepath.stat().st_size:
+        return None
+    return entry
+
+
+def record_ingested(content_hash: str, filepath: Path, source: str):
+    """Add a successfully ingested file to the manifest."""
+    from utils.manifest import PARSER_VERSION
+    
+    get_store().record_ingested(
+        content_hash, filepath.name, filepath.stat().st_size, source, PARSER_VERSION
+    )
+
+
+def print_skipped(filepath: Path, content_hash: str, entry: dict):
+    """Report a file skipped because its content is already ingested."""
+    print(f"\n{'='*60}")
+    print(f"Processing: {filepath.name}")
+    print(f"{'='*60}")
+    print(f"  ↷ Unchanged (sha256 {content_hash[:12]}, {entry['source']}, "
+          f"ingested {entry['ingested_at'][:19]}) - skipping")
+    print("    Use --force to re-ingest")
+
+
 def extract_raw_for_ispn(parsed_data: dict) -> dict:
     """
     Extract RAW values from parsed data for ISPN calculations.
@@ -214,12 +280,29 @@ def extract_raw_for_ispn(parsed_data: dict) -> dict:
     return raw
 
 
+def extract_raw_by_period(parsed_data: dict) -> Dict[Optional[str], dict]:
+    """
+    Split RAW values for ISPN calculations by reporting period.
+    
+    Parsers that can read dates from the export (Interactions, Agent Status,
+    dated Adherence) emit raw totals per YYYY-MM under 'periods'. Anything
+    else returns a single {None: raw} entry, stored under the current month.
+    """
+    periods = parsed_data.get('periods')
+    if periods:
+        return {period: raw for period, raw in sorted(periods.items())}
+    return {None: extract_raw_for_ispn(parsed_data)}
+
+
 def run_ispn_calculations(period: str = None) -> Tuple[ISPNCalculatedMetrics, dict]:
     """
     Run ISPN canonical calculations on accumulated raw data for a period.
     
     Args:
-        period: Period to calculate (YYYY-MM format). None = current month.
+        period: Period to calculate. YYYY-MM (None = current month); weeks
+                (YYYY-Www), fiscal years (FY2025), days and custom ranges
+                (YYYY-MM-DD..YYYY-MM-DD) are rolled up from stored periods
+                or summed from the 15-minute interval rows.
     
     Returns:
         Tuple of (ISPNCalculatedMetrics, dict of warnings)
@@ -227,14 +310,24 @@ def run_ispn_calculations(period: str = None) -> Tuple[ISPNCalculatedMetrics, di
     if period is None:
         period = datetime.now().strftime('%Y-%m')
     
-    store = load_raw_data_store()
+    period_data = get_store().get_period(period, rollup=True)
     
-    if period not in store['periods']:
+    if period_data is None:
         return None, {'error': f'No raw data found for period {period}'}
     
-    period_data = store['periods'][period]
+    raw = raw_data_from_period(period_data)
     
-    # Build GenesysRawData from stored values
+    # Run calculations
+    metrics = CALC_ENGINE.calculate_all(raw)
+    
+    # Save calculated metrics
+    save_ispn_metrics(period, metrics, raw, input_fingerprint(period_data))
+    
+    return metrics, {'warnings': metrics.warnings}
+
+
+def raw_data_from_period(period_data: dict) -> GenesysRawData:
+    """Build GenesysRawData from a stored period (MetricsStore.get_period shape)."""
     interactions = period_data.get('interactions', {})
     agent_status = period_data.get('agent_status', {})
     helpdesk = period_data.get('helpdesk', {})
@@ -285,28 +378,47 @@ def run_ispn_calculations(period: str = None) -> Tuple[ISPNCalculatedMetrics, di
         wave_total_minutes=manual.get('wave_total_minutes', 0),
         wave_awt_seconds=manual.get('wave_awt_seconds', 0),
     )
-    
-    # Run calculations
-    metrics = CALC_ENGINE.calculate_all(raw)
-    
-    # Save calculated metrics
-    save_ispn_metrics(period, metrics, raw)
-    
-    return metrics, {'warnings': metrics.warnings}
+    return raw
 
 
-def save_ispn_metrics(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysRawData):
-    """Save ISPN-calculated metrics to history."""
-    history_file = METRICS_DIR / 'ispn_metrics_history.json'
-    
-    history = {}
-    if history_file.exists():
-        with open(history_file) as f:
-            history = json.load(f)
+def period_percentiles(period: str) -> dict:
+    """
+    p50/p90/p99 handle (minutes) and answered wait (seconds) for a period,
+    from the stored quantile sketches. Empty if no sketches were stored.
     
-    if 'periods' not in history:
-        history['periods'] = {}
+    Weeks use the per-ISO-week sketches (merged across the months a week
+    spans); other periods merge the 'all' sketches of their member periods.
+    """
+    store = get_store()
+    periods = store.rollup_members(period) or [period]
+    percentiles = {}
+    for name, metric, divisor in [('handle_min', 'handle_ms', 60000), ('wait_sec', 'queue_ms', 1000)]:
+        if grain_of(period) == 'week':
+            overall = store.get_percentiles(metric, 'week').get(period)
+        else:
+            overall = store.get_percentiles(metric, 'all', periods).get('all')
+        if overall:
+            percentiles[name] = {
+                k: (v / divisor if k != 'count' and v is not None else v)
+                for k, v in overall.items()
+            }
+    return percentiles
+
+
+def save_ispn_metrics(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysRawData,
+                      inputs: dict = None):
+    """
+    Save ISPN-calculated metrics to the metrics store.
     
+    inputs is the period's input_fingerprint(), kept in the record's
+    metadata so --calculate --all can tell whether it is stale.
+    """
+    get_store().save_metrics(period, build_metrics_record(period, metrics, raw, inputs))
+
+
+def build_metrics_record(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysRawData,
+                         inputs: dict = None) -> dict:
+    """The stored metrics record (KPIs, statuses, volumes, metadata) for a period."""
     # Build KPI dict with status
     kpis = {}
     statuses = {}
@@ -328,24 +440,7 @@ def save_ispn_metrics(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysR
         
         if value is not None:
             status = CALC_ENGINE.get_status(attr_name, value)
-            target_info = TARGETS.get(attr_name, {})
-            target = target_info.get('target')
-            direction = target_info.get('direction', 'above')
-            
-            # Format target for display
-            if target:
-                if 'pct' in attr_name:
-                    target_display = f"{'>' if direction == 'above' else '<'} {target:.0%}"
-                elif attr_name == 'aht_minutes':
-                    target_display = f"< {target} min"
-                elif attr_name == 'awt_seconds':
-                    target_display = f"< {target} sec"
-                elif attr_name == 'quality_score':
-                    target_display = f"> {target}"
-                else:
-                    target_display = str(target)
-            else:
-                target_display = 'N/A'
+            target_display = describe_target(attr_name)
             
             statuses[display_name] = {
                 'value': formatter(value),
@@ -354,7 +449,7 @@ def save_ispn_metrics(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysR
                 'status': status.upper()
             }
     
-    history['periods'][period] = {
+    record = {
         'kpis': kpis,
         'statuses': statuses,
         'call_volume': {
@@ -372,17 +467,15 @@ def save_ispn_metrics(period: str, metrics: ISPNCalculatedMetrics, raw: GenesysR
             'acw_hours': metrics.acw_hours,
         },
         'headcount': metrics.headcount,
+        'percentiles': period_percentiles(period),
         'metadata': {
             'calculation_timestamp': metrics.calculation_timestamp,
             'formula_version': metrics.formula_version,
             'warnings': metrics.warnings,
+            'inputs': inputs,
         }
     }
-    
-    history['last_updated'] = datetime.now().isoformat()
-    
-    with open(history_file, 'w') as f:
-        json.dump(history, f, indent=2, default=str)
+    return record
 
 
 def update_kpi_history(source: str, metrics: dict, filepath: str):
@@ -390,19 +483,25 @@ def update_kpi_history(source: str, metrics: dict, filepath: str):
     Append metrics to legacy KPI history file.
     Uses a list structure for time-series tracking.
     """
+    global _KPI_HISTORY
     history_file = METRICS_DIR / 'kpi_history.json'
     
-    # Load existing history or create new list
-    history = []
-    if history_file.exists():
-        with open(history_file) as f:
-            data = json.load(f)
-            # Handle both old dict format and new list format
-            if isinstance(data, list):
-                history = data
-            elif isinstance(data, dict) and 'entries' in data:
-                history = data['entries']
-            # Otherwise start fresh with empty list
+    # Reuse the in-memory copy unless the file changed since we wrote it
+    mtime = history_file.stat().st_mtime_ns if history_file.exists() else None
+    if _KPI_HISTORY is not None and _KPI_HISTORY[1] == mtime:
+        history = _KPI_HISTORY[0]
+    else:
+        # Load existing history or create new list
+        history = []
+        if history_file.exists():
+            with open(history_file) as f:
+                data = json.load(f)
+                # Handle both old dict format and new list format
+                if isinstance(data, list):
+                    history = data
+                elif isinstance(data, dict) and 'entries' in data:
+                    history = data['entries']
+                # Otherwise start fresh with empty list
     
     entry = {
         'timestamp': datetime.now().isoformat(),
@@ -418,6 +517,7 @@ def update_kpi_history(source: str, metrics: dict, filepath: str):
     
     with open(history_file, 'w') as f:
         json.dump(history, f, indent=2, default=str)
+    _KPI_HISTORY = (history, history_file.stat().st_mtime_ns)
 
 
 def print_validation_results(is_valid: bool, issues: list, statuses: dict):
@@ -518,21 +618,22 @@ def print_ispn_calculations(metrics: ISPNCalculatedMetrics):
     print("="*60)
     
     kpis = [
-        ('FCR', 'fcr_pct', metrics.fcr_pct, '> 70%', lambda x: f"{x:.1%}"),
-        ('Escalation', 'escalation_pct', metrics.escalation_pct, '< 30%', lambda x: f"{x:.1%}"),
-        ('AHT', 'aht_minutes', metrics.aht_minutes, '< 10.7 min', lambda x: f"{x:.2f} min"),
-        ('AWT', 'awt_seconds', metrics.awt_seconds, '< 90 sec', lambda x: f"{x:.1f} sec"),
-        ('Shrinkage', 'shrinkage_pct', metrics.shrinkage_pct, '< 30%', lambda x: f"{x:.1%}"),
-        ('Utilization', 'utilization_pct', metrics.utilization_pct, '> 55%', lambda x: f"{x:.1%}"),
-        ('Occupancy', 'occupancy_pct', metrics.occupancy_pct, '> 65%', lambda x: f"{x:.1%}"),
-        ('Quality', 'quality_score', metrics.quality_score, '> 88', lambda x: f"{x:.1f}"),
-        ('Abandon', 'abandon_pct', metrics.abandon_pct, '< 5%', lambda x: f"{x:.1%}"),
+        ('FCR', 'fcr_pct', metrics.fcr_pct, lambda x: f"{x:.1%}"),
+        ('Escalation', 'escalation_pct', metrics.escalation_pct, lambda x: f"{x:.1%}"),
+        ('AHT', 'aht_minutes', metrics.aht_minutes, lambda x: f"{x:.2f} min"),
+        ('AWT', 'awt_seconds', metrics.awt_seconds, lambda x: f"{x:.1f} sec"),
+        ('Shrinkage', 'shrinkage_pct', metrics.shrinkage_pct, lambda x: f"{x:.1%}"),
+        ('Utilization', 'utilization_pct', metrics.utilization_pct, lambda x: f"{x:.1%}"),
+        ('Occupancy', 'occupancy_pct', metrics.occupancy_pct, lambda x: f"{x:.1%}"),
+        ('Quality', 'quality_score', metrics.quality_score, lambda x: f"{x:.1f}"),
+        ('Abandon', 'abandon_pct', metrics.abandon_pct, lambda x: f"{x:.1%}"),
     ]
     
     print(f"{'KPI':<15} {'Value':<15} {'Target':<12} {'Status':<8}")
     print("-"*50)
     
-    for name, attr, value, target, formatter in kpis:
+    for name, attr, value, formatter in kpis:
+        target = describe_target(attr)
         if value is not None:
             status = CALC_ENGINE.get_status(attr, value)
             icon = '🟢' if status == 'green' else ('🟡' if status == 'yellow' else '🔴')
@@ -550,13 +651,73 @@ def print_ispn_calculations(metrics: ISPNCalculatedMetrics):
 # MAIN PROCESSING
 # =============================================================================
 
-def process_file(filepath: Path, move_after: bool = False) -> dict:
+def parse_and_validate(filepath: Path, content_hash: str = None) -> dict:
     """
-    Process a single file through the pipeline.
+    Identify, parse and validate a single file.
     
-    Args:
-        filepath: Path to the file
-        move_after: Whether to move file to archive after processing
+    This is the worker half of the pipeline: it prints nothing and writes
+    nothing shared, so it is safe to run in a process pool. All console
+    output and all writes to the metrics store happen in store_parsed_file(),
+    which is only ever called from the parent process. The one file it does
+    write is the export's columnar cache copy, which is content-addressed
+    and renamed into place atomically.
+    
+    Exceptions are caught and returned as {'error': ...} so one unreadable
+    export is reported as failed instead of aborting the whole batch (or
+    the watcher).
+    
+    Returns:
+        Dict with 'file_type', 'data', 'validation' (is_valid, issues, statuses)
+        and 'frame_cache' (cached frame path or None), or {'error': message}
+    """
+    from utils.parsers import (
+        parse_file, identify_file_type, sniff_header, read_export,
+        EXPORT_SCHEMAS, STREAMING_THRESHOLD_BYTES,
+    )
+    from utils.frame_cache import cache_available, cache_export, is_cached, SOURCE_ALIASES
+    
+    try:
+        # Sniff the CSV header once; detection and the parser both reuse it
+        header = sniff_header(filepath) if filepath.suffix.lower() == '.csv' else None
+        result = {'file_type': identify_file_type(filepath, header), 'data': None,
+                  'validation': None, 'frame_cache': None}
+        
+        if result['file_type'] == 'unknown':
+            return result
+        
+        # An export that still needs its columnar copy is read once, in full;
+        # the parser takes its columns from that frame and the copy is written
+        # from it. Interactions files big enough to stream are not read whole -
+        # load_export() caches those on first use.
+        source = SOURCE_ALIASES.get(result['file_type'], result['file_type'])
+        frame = None
+        if (header is not None and source in EXPORT_SCHEMAS and cache_available()
+                and not (content_hash and is_cached(content_hash))
+                and not (source == 'genesys_interactions'
+                         and filepath.stat().st_size > STREAMING_THRESHOLD_BYTES)):
+            frame, _ = read_export(filepath, source, prune=False, header=header)
+        
+        data = parse_file(filepath, header, frame)
+        result['data'] = data
+        
+        if 'error' not in data:
+            result['validation'] = validate_data(data)
+            if frame is not None or (content_hash and is_cached(content_hash)):
+                result['frame_cache'] = cache_export(filepath, source, content_hash, frame=frame)
+        
+        return result
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+
+def store_parsed_file(filepath: Path, parsed: dict, move_after: bool = False,
+                      content_hash: str = None) -> dict:
+    """
+    Report and persist the output of parse_and_validate().
+    
+    This is the single-writer half of the pipeline: it updates the raw data
+    store, writes the parsed JSON and appends to the legacy KPI history.
+    content_hash identifies the file's contribution to each period.
     
     Returns:
         Parsed data dictionary
@@ -565,8 +726,12 @@ def process_file(filepath: Path, move_after: bool = False) -> dict:
     print(f"Processing: {filepath.name}")
     print(f"{'='*60}")
     
+    if 'error' in parsed:
+        print(f"  ❌ Error: {parsed['error']}")
+        return {'error': parsed['error']}
+    
     # 1. Identify file type
-    file_type = identify_file_type(filepath)
+    file_type = parsed['file_type']
     print(f"  Detected Type: {file_type}")
     
     if file_type == 'unknown':
@@ -575,7 +740,7 @@ def process_file(filepath: Path, move_after: bool = False) -> dict:
     
     # 2. Parse file
     print("  Parsing...")
-    data = parse_file(filepath)
+    data = parsed['data']
     
     if 'error' in data:
         print(f"  ❌ Parse Error: {data['error']}")
@@ -587,13 +752,26 @@ def process_file(filepath: Path, move_after: bool = False) -> dict:
     # 4. Extract RAW data for ISPN calculations
     source = data.get('source', 'unknown')
     if source.startswith('genesys_'):
-        raw_data = extract_raw_for_ispn(data)
-        period = update_raw_data_store(source, raw_data)
-        print(f"  ✓ Raw data stored for ISPN calculations (period: {period})")
+        stored = [
+            update_raw_data_store(source, raw_data, period, content_hash)
+            for period, raw_data in extract_raw_by_period(data).items()
+        ]
+        label = 'period' if len(stored) == 1 else 'periods'
+        print(f"  ✓ Raw data stored for ISPN calculations ({label}: {', '.join(stored)})")
+        
+        for period, sketches in data.get('sketches', {}).items():
+            get_store().upsert_sketches(period, sketches)
+        
+        if data.get('intervals') and source in INTERVAL_SECTIONS:
+            count = get_store().replace_intervals(
+                INTERVAL_SECTIONS[source], content_hash or filepath.name,
+                data['intervals'], data.get('agent_days')
+            )
+            print(f"  ✓ Interval data stored ({count} 15-minute intervals)")
     
     # 5. Validate (basic validation on raw data)
     print("  Validating...")
-    is_valid, issues, statuses = validate_data(data)
+    is_valid, issues, statuses = parsed['validation']
     print_validation_results(is_valid, issues, statuses)
     
     # 6. Save parsed data
@@ -604,9 +782,12 @@ def process_file(filepath: Path, move_after: bool = False) -> dict:
     output_file = output_dir / f"{filepath.stem}_{timestamp}.json"
     
     with open(output_file, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+        stored_elsewhere = STORE_ONLY_KEYS if source in INTERVAL_SECTIONS else ()
+        json.dump({k: v for k, v in data.items() if k not in stored_elsewhere}, f, indent=2, default=str)
     
     print(f"  Saved: {output_file.relative_to(BASE_DIR)}")
+    if parsed.get('frame_cache'):
+        print(f"  Cached frame: {Path(parsed['frame_cache']).relative_to(BASE_DIR)}")
     
     # 7. Update legacy metrics history (for backwards compatibility)
     metrics_to_track = {}
@@ -629,32 +810,111 @@ def process_file(filepath: Path, move_after: bool = False) -> dict:
     return data
 
 
-def process_directory(directory: Path, move_after: bool = False) -> list:
+def process_file(filepath: Path, move_after: bool = False, force: bool = False) -> dict:
+    """
+    Process a single file through the pipeline.
+    
+    Files whose content hash is already in the ingest manifest are skipped
+    without being parsed.
+    
+    Args:
+        filepath: Path to the file
+        move_after: Whether to move file to archive after processing
+        force: Re-ingest even if the manifest says the file is unchanged
+    
+    Returns:
+        Parsed data dictionary ({'source', 'skipped': True} when skipped)
+    """
+    from utils.manifest import file_content_hash
+    
+    content_hash = file_content_hash(filepath)
+    
+    entry = None if force else find_ingested(content_hash, filepath)
+    if entry:
+        print_skipped(filepath, content_hash, entry)
+        return {'source': entry['source'], 'skipped': True}
+    
+    data = store_parsed_file(filepath, parse_and_validate(filepath, content_hash), move_after, content_hash)
+    if 'error' not in data:
+        record_ingested(content_hash, filepath, data.get('source', 'unknown'))
+    return data
+
+
+def process_directory(directory: Path, move_after: bool = False, workers: int = 1,
+                      force: bool = False) -> list:
     """
     Process all supported files in a directory.
+    
+    Args:
+        directory: Directory to scan for exports
+        move_after: Whether to move files to archive after processing
+        workers: Number of parser processes. With workers > 1, parsing and
+                 validation run in a process pool while this process remains
+                 the only writer to the raw data store and history files.
+                 Results are reported in filename order either way.
+        force: Re-ingest files even if the manifest says they are unchanged
     """
-    results = []
+    from utils.manifest import file_content_hash
     
-    # Supported extensions
-    extensions = ['.csv', '.xlsx', '.xls']
+    results = []
     
     files = [f for f in directory.iterdir() 
-             if f.is_file() and f.suffix.lower() in extensions]
+             if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS]
     
     if not files:
         print(f"No supported files found in {directory}")
         return results
     
-    print(f"Found {len(files)} files to process")
-    
+    # Drop unchanged files before any parsing work is scheduled
+    hashes = {}
+    pending = []
     for filepath in sorted(files):
-        result = process_file(filepath, move_after)
+        hashes[filepath] = file_content_hash(filepath)
+        entry = None if force else find_ingested(hashes[filepath], filepath)
+        if entry:
+            print_skipped(filepath, hashes[filepath], entry)
+            results.append({
+                'file': str(filepath),
+                'source': entry['source'],
+                'success': True,
+                'skipped': True,
+            })
+        else:
+            pending.append(filepath)
+    
+    if not pending:
+        return results
+    
+    workers = max(1, min(workers, len(pending)))
+    
+    if workers > 1:
+        print(f"Found {len(pending)} files to process ({workers} workers)")
+    else:
+        print(f"Found {len(pending)} files to process")
+    
+    def record(filepath: Path, parsed: dict):
+        result = store_parsed_file(filepath, parsed, move_after, hashes[filepath])
+        if 'error' not in result:
+            record_ingested(hashes[filepath], filepath, result.get('source', 'unknown'))
         results.append({
             'file': str(filepath),
             'source': result.get('source', 'unknown'),
             'success': 'error' not in result,
+            'skipped': False,
         })
     
+    if workers == 1:
+        for filepath in pending:
+            record(filepath, parse_and_validate(filepath, hashes[filepath]))
+        return results
+    
+    # Executor.map yields in submission order, so output stays grouped per
+    # file and ordered by name even though parsing finishes out of order.
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for filepath, parsed in zip(pending, executor.map(parse_and_validate, pending,
+                                                          [hashes[f] for f in pending])):
+            record(filepath, parsed)
+    
     return results
 
 
@@ -678,38 +938,273 @@ def add_manual_data(period: str = None, **kwargs):
     if period is None:
         period = datetime.now().strftime('%Y-%m')
     
-    store = load_raw_data_store()
-    
-    if period not in store['periods']:
-        store['periods'][period] = {
-            'interactions': {},
-            'agent_status': {},
-            'helpdesk': {},
-            'quality': {},
-            'manual': {},
-            'metadata': {'files_processed': []}
-        }
-    
-    period_data = store['periods'][period]
-    
     # Map kwargs to appropriate sections
     helpdesk_fields = ['call_tickets', 'escalations', 'alert_tickets']
     quality_fields = ['tech_review_scores', 'efficacy_scores']
     manual_fields = ['training_hours', 'wave_call_count', 'wave_total_minutes', 'wave_awt_seconds']
     
+    sections = {'helpdesk': {}, 'quality': {}, 'manual': {}}
     for key, value in kwargs.items():
         if key in helpdesk_fields:
-            period_data['helpdesk'][key] = value
+            sections['helpdesk'][key] = value
         elif key in quality_fields:
-            period_data['quality'][key] = value
+            sections['quality'][key] = value
         elif key in manual_fields:
-            period_data['manual'][key] = value
+            sections['manual'][key] = value
     
-    save_raw_data_store(store)
+    store = get_store()
+    for section, values in sections.items():
+        if values:
+            store.upsert_raw(period, section, values)
     print(f"✓ Manual data added for period {period}")
     return period
 
 
+# =============================================================================
+# INCREMENTAL RECALCULATION
+# =============================================================================
+
+# Sections feeding the calculation, grouped as they are fingerprinted
+RAW_INPUT_SECTIONS = ('interactions', 'agent_status')
+MANUAL_INPUT_SECTIONS = ('helpdesk', 'quality', 'manual')
+
+
+def input_fingerprint(period_data: dict) -> dict:
+    """
+    Hashes of everything a period's metrics depend on.
+    
+    Returns:
+        {'raw': sha256 of the Interactions/Agent Status values,
+         'manual': sha256 of the helpdesk/quality/manual values,
+         'targets': sha256 of targets.json (statuses are derived from it),
+         'formula_version': calculation engine version}
+    """
+    def digest(sections):
+        payload = json.dumps({s: period_data.get(s) or {} for s in sections}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    return {
+        'raw': digest(RAW_INPUT_SECTIONS),
+        'manual': digest(MANUAL_INPUT_SECTIONS),
+        'targets': hashlib.sha256(json.dumps(load_targets(), sort_keys=True).encode()).hexdigest(),
+        'formula_version': CALC_ENGINE.formula_version,
+    }
+
+
+def stale_reasons(record: Optional[dict], inputs: dict) -> List[str]:
+    """Why a stored metrics record no longer matches its inputs ([] = up to date)."""
+    if record is None:
+        return ['not calculated yet']
+    previous = record.get('metadata', {}).get('inputs')
+    if not previous:
+        return ['no input fingerprint (calculated before tracking)']
+    reasons = []
+    if previous.get('formula_version') != inputs['formula_version']:
+        reasons.append(f"formula_version {previous.get('formula_version')} -> {inputs['formula_version']}")
+    if previous.get('raw') != inputs['raw']:
+        reasons.append('raw inputs changed')
+    if previous.get('manual') != inputs['manual']:
+        reasons.append('manual inputs changed')
+    if previous.get('targets') != inputs['targets']:
+        reasons.append('targets changed')
+    return reasons
+
+
+def calculate_if_stale(period: str, force: bool = False) -> dict:
+    """
+    Recompute one period's metrics record if its inputs changed.
+    
+    Reads the store but never writes it, so it can run in a process pool;
+    the caller saves the returned record.
+    
+    Returns:
+        {'period', 'reasons', 'record' (None when skipped), 'error' (optional)}
+    """
+    store = get_store()
+    period_data = store.get_period(period, rollup=True)
+    if period_data is None:
+        return {'period': period, 'reasons': [], 'record': None, 'error': 'no raw data'}
+    
+    inputs = input_fingerprint(period_data)
+    reasons = stale_reasons(store.get_metrics(period), inputs)
+    if force and not reasons:
+        reasons = ['--force']
+    if not reasons:
+        return {'period': period, 'reasons': [], 'record': None}
+    
+    raw = raw_data_from_period(period_data)
+    metrics = CALC_ENGINE.calculate_all(raw)
+    return {'period': period, 'reasons': reasons,
+            'record': build_metrics_record(period, metrics, raw, inputs)}
+
+
+def _reset_store():
+    """Pool initializer: forked workers open their own SQLite connection."""
+    global _STORE
+    _STORE = None
+
+
+def recalculate_all(workers: int = None, force: bool = False) -> List[dict]:
+    """
+    Bring every period's metrics up to date, recomputing only stale ones.
+    
+    Covers every period with stored raw data plus every period calculated
+    before (weeks, fiscal years, custom ranges). Staleness checks and
+    calculations run in a process pool; this process saves the results.
+    
+    Args:
+        workers: Processes (default: CPU count)
+        force: Recompute even periods whose inputs are unchanged
+    
+    Returns:
+        calculate_if_stale() results, in period order
+    """
+    store = get_store()
+    periods = sorted(set(store.periods()) | set(store.metric_periods()))
+    if not periods:
+        return []
+    workers = max(1, min(workers or os.cpu_count() or 1, len(periods)))
+    
+    if workers == 1:
+        results = [calculate_if_stale(period, force) for period in periods]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_reset_store) as executor:
+            results = list(executor.map(calculate_if_stale, periods, [force] * len(periods)))
+    
+    for result in results:
+        if result['record'] is not None:
+            store.save_metrics(result['period'], result['record'])
+    return results
+
+
+def print_recalculation(results: List[dict]):
+    """Report which periods were recomputed, and why."""
+    recomputed = [r for r in results if r['record'] is not None]
+    failed = [r for r in results if r.get('error')]
+    for r in results:
+        if r['record'] is not None:
+            print(f"  ✓ {r['period']:<24} recomputed: {', '.join(r['reasons'])}")
+        elif r.get('error'):
+            print(f"  ⚠️  {r['period']:<23} skipped: {r['error']}")
+        else:
+            print(f"  ↷ {r['period']:<24} unchanged")
+    print(f"\nRecomputed: {len(recomputed)}  Unchanged: {len(results) - len(recomputed) - len(failed)}"
+          f"  No data: {len(failed)}")
+
+
+# =============================================================================
+# WATCH MODE
+# =============================================================================
+
+def affected_periods(data: dict) -> List[str]:
+    """Periods a successfully stored Genesys export wrote raw data to."""
+    if not data.get('source', '').startswith('genesys_'):
+        return []
+    fallback = datetime.now().strftime('%Y-%m')
+    return sorted({period or fallback for period in extract_raw_by_period(data)})
+
+
+def recalculate_periods(periods: List[str]) -> List[str]:
+    """
+    Recompute ISPN metrics for changed periods only.
+    
+    Besides the periods themselves, any already-calculated period that
+    overlaps one of them (a week, fiscal year or custom range) is redone.
+    
+    Returns:
+        Periods recalculated
+    """
+    changed = [period_bounds(p) for p in periods if period_bounds(p)]
+    targets = set(periods)
+    for stored in get_store().metric_periods():
+        bounds = period_bounds(stored)
+        if bounds and any(bounds[0] < end and start < bounds[1] for start, end in changed):
+            targets.add(stored)
+    
+    done = []
+    for period in sorted(targets):
+        metrics, info = run_ispn_calculations(period)
+        if metrics:
+            print(f"  ✓ Recalculated {period}")
+            done.append(period)
+        else:
+            print(f"  ⚠️  {period}: {info.get('error', 'Unknown error')}")
+    return done
+
+
+def ready_files(directory: Path, candidates: dict, handled: dict, settle: float) -> List[Path]:
+    """
+    Files in directory that have finished being written.
+    
+    A file is ready once its size and mtime have not changed for `settle`
+    seconds; an export still being copied keeps resetting that clock.
+    Files already handled with the same size and mtime are ignored.
+    
+    Args:
+        candidates: path -> (signature, first seen with that signature); updated in place
+        handled: path -> signature of files already processed this session
+    """
+    now = time.monotonic()
+    ready = []
+    present = set()
+    for entry in sorted(directory.iterdir()):
+        if not entry.is_file() or entry.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            continue
+        if entry.name.startswith(('.', '~$')):     # hidden files, Office lock files
+            continue
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        signature = (stat.st_size, stat.st_mtime_ns)
+        present.add(entry)
+        if handled.get(entry) == signature or stat.st_size == 0:
+            continue
+        previous = candidates.get(entry)
+        if previous is None or previous[0] != signature:
+            candidates[entry] = (signature, now)
+        elif now - previous[1] >= settle:
+            ready.append(entry)
+    for gone in set(candidates) - present:
+        del candidates[gone]
+    return ready
+
+
+def watch_directory(directory: Path, poll: float = WATCH_POLL_SECONDS,
+                    settle: float = WATCH_SETTLE_SECONDS, move_after: bool = False):
+    """
+    Ingest exports as they land in directory, until interrupted.
+    
+    Polls the directory (no platform file-event APIs needed), waits for each
+    file to settle, ingests it once - the content-hash manifest skips files
+    already ingested, even across restarts - and then recalculates only the
+    periods the new files touched. The interpreter, pandas, the metrics
+    store and the KPI history stay loaded between files.
+    """
+    candidates = {}
+    handled = {}
+    print("="*60)
+    print(f"Watching {directory} (poll {poll:g}s, settle {settle:g}s) - Ctrl+C to stop")
+    print("="*60)
+    
+    try:
+        while True:
+            dirty = set()
+            for filepath in ready_files(directory, candidates, handled, settle):
+                signature = candidates.pop(filepath)[0]
+                data = process_file(filepath, move_after=move_after)
+                handled[filepath] = signature
+                if 'error' not in data and not data.get('skipped'):
+                    dirty.update(affected_periods(data))
+            if dirty:
+                print(f"\nRecalculating {len(dirty)} changed period(s)...")
+                recalculate_periods(sorted(dirty))
+                print(f"\nWatching {directory}...")
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        print(f"\nStopped watching ({len(handled)} file(s) handled)")
+
+
 # =============================================================================
 # CLI ENTRY POINT
 # =============================================================================
@@ -730,16 +1225,33 @@ def main():
         print("Running ISPN Canonical Calculations")
         print("="*60)
         
+        if '--all' in sys.argv:
+            workers = None
+            for i, arg in enumerate(sys.argv):
+                if arg == '--workers' and i + 1 < len(sys.argv):
+                    workers = int(sys.argv[i + 1])
+            print_recalculation(recalculate_all(workers, force='--force' in sys.argv))
+            print(f"\n✓ Metrics saved to: {STORE_FILE}")
+            return
+        
         metrics, info = run_ispn_calculations(period)
         
         if metrics:
             print_ispn_calculations(metrics)
-            print(f"\n✓ Metrics saved to: {METRICS_DIR / 'ispn_metrics_history.json'}")
+            print(f"\n✓ Metrics saved to: {STORE_FILE}")
         else:
             print(f"\n❌ Error: {info.get('error', 'Unknown error')}")
         
         return
     
+    if '--watch' in sys.argv:
+        options = {}
+        for i, arg in enumerate(sys.argv):
+            if arg in ('--poll', '--settle') and i + 1 < len(sys.argv):
+                options[arg[2:]] = float(sys.argv[i + 1])
+        watch_directory(RAW_DIR, **options)
+        return
+    
     if len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
         # Process specific file
         filepath = Path(sys.argv[1])
@@ -747,7 +1259,7 @@ def main():
             print(f"Error: File not found: {filepath}")
             sys.exit(1)
         
-        process_file(filepath)
+        process_file(filepath, force='--force' in sys.argv)
         
         # Prompt for ISPN calculation
         print("\n" + "="*60)
@@ -756,16 +1268,23 @@ def main():
         print("="*60)
     else:
         # Process all files in raw directory
-        results = process_directory(RAW_DIR)
+        workers = 1
+        for i, arg in enumerate(sys.argv):
+            if arg == '--workers' and i + 1 < len(sys.argv):
+                workers = int(sys.argv[i + 1])
+        
+        results = process_directory(RAW_DIR, workers=workers, force='--force' in sys.argv)
         
         print(f"\n{'='*60}")
         print("SUMMARY")
         print(f"{'='*60}")
         
-        success = sum(1 for r in results if r['success'])
+        skipped = sum(1 for r in results if r.get('skipped'))
+        success = sum(1 for r in results if r['success'] and not r.get('skipped'))
         print(f"Processed: {len(results)} files")
         print(f"Success: {success}")
-        print(f"Failed: {len(results) - success}")
+        print(f"Unchanged: {skipped}")
+        print(f"Failed: {len(results) - success - skipped}")
         
         # Group by source type
         by_source = {}
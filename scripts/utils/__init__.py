@@ -1,4 +1,17 @@
 """ISPN Utils Package"""
-from .thresholds import get_status, get_all_statuses, load_targets
-from .parsers import parse_file, identify_file_type
+from .thresholds import get_status, get_statuses, get_all_statuses, load_targets, describe_target, target_value
 from .validators import validate_data
+
+# Parsers pull in pandas; load them on first use so importing any utils
+# submodule (e.g. utils.store for --calculate) stays cheap.
+_LAZY = {
+    'parse_file': '.parsers',
+    'identify_file_type': '.parsers',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        return getattr(import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,296 @@
+"""
+Mergeable Raw Aggregates
+Raw ISPN inputs as an additive monoid, plus day -> week -> month -> FY rollups.
+
+Every raw field the calculation engine consumes is a count or a millisecond
+total, so two partial exports for the same period combine by adding them.
+The few fields that are not plain sums carry what they need to merge
+exactly:
+
+    agent_ids           distinct agents, merged by set union
+    agent_count         len(agent_ids) when known (else the larger count)
+    avg_adherence_pct   mean weighted by adherence_count
+    avg_conformance_pct mean weighted by conformance_count
+    wave_awt_seconds    mean weighted by wave_call_count
+    *_scores            score lists, concatenated
+
+RawAggregate.empty() is the identity and merge() is associative, so stored
+aggregates can be combined in any grouping: several files into a month,
+days into weeks, months into a fiscal year.
+"""
+
+import re
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+# First calendar month of the fiscal year (1 = FY runs Jan-Dec).
+# FY labels use the calendar year the fiscal year ends in (FY2025).
+FISCAL_YEAR_START_MONTH = 1
+
+# Fields that do not simply add: field -> (rule, helper field)
+MERGE_RULES = {
+    'agent_ids': ('union', None),
+    'agent_count': ('distinct', 'agent_ids'),
+    'avg_adherence_pct': ('mean', 'adherence_count'),
+    'avg_conformance_pct': ('mean', 'conformance_count'),
+    'wave_awt_seconds': ('mean', 'wave_call_count'),
+    'tech_review_scores': ('concat', None),
+    'efficacy_scores': ('concat', None),
+}
+
+GRAINS = ('day', 'week', 'month', 'fy')
+
+# Custom windows are written 'YYYY-MM-DD..YYYY-MM-DD' (both days inclusive)
+RANGE_SEPARATOR = '..'
+
+_GRAIN_PATTERNS = {
+    'day': re.compile(r'^\d{4}-\d{2}-\d{2}$'),
+    'week': re.compile(r'^\d{4}-W\d{2}$'),
+    'month': re.compile(r'^\d{4}-\d{2}$'),
+    'fy': re.compile(r'^FY\d{4}$'),
+    'range': re.compile(r'^\d{4}-\d{2}-\d{2}\.\.\d{4}-\d{2}-\d{2}$'),
+}
+
+
+class RawAggregate:
+    """
+    Raw period values that merge instead of overwrite.
+
+    Usage:
+        month = RawAggregate(first_file_raw).merge(RawAggregate(second_file_raw))
+        month.to_dict()  # {'inbound_call_count': ..., ...}
+    """
+
+    def __init__(self, values: dict = None):
+        self.values = dict(values or {})
+
+    @classmethod
+    def empty(cls) -> 'RawAggregate':
+        return cls()
+
+    def __bool__(self):
+        return bool(self.values)
+
+    def __add__(self, other: 'RawAggregate') -> 'RawAggregate':
+        return RawAggregate(self.values).merge(other)
+
+    def __repr__(self):
+        return f"RawAggregate({self.values!r})"
+
+    def __eq__(self, other):
+        return isinstance(other, RawAggregate) and self.values == other.values
+
+    def merge(self, other: Optional['RawAggregate']) -> 'RawAggregate':
+        """Fold another aggregate into this one (in place) and return self."""
+        if not other:
+            return self
+        ours, theirs = self.values, other.values
+        merged = {}
+
+        for field in sorted(set(ours) | set(theirs)):
+            if field not in ours:
+                merged[field] = _copy(theirs[field])
+                continue
+            if field not in theirs:
+                merged[field] = ours[field]
+                continue
+            a, b = ours[field], theirs[field]
+            rule, helper = MERGE_RULES.get(field, ('sum', None))
+
+            if rule == 'union':
+                merged[field] = sorted(set(a or []) | set(b or []))
+            elif rule == 'concat':
+                merged[field] = list(a or []) + list(b or [])
+            elif rule == 'distinct':
+                merged[field] = max(a or 0, b or 0)
+            elif rule == 'mean':
+                merged[field] = _weighted_mean(a, ours.get(helper), b, theirs.get(helper))
+            else:
+                merged[field] = _add(a, b)
+
+        # Distinct counts follow the merged id sets when both sides have them
+        for field, (rule, helper) in MERGE_RULES.items():
+            if rule == 'distinct' and field in merged and helper in ours and helper in theirs:
+                merged[field] = len(merged[helper])
+
+        self.values = {field: merged[field] for field in _field_order(ours, theirs)}
+        return self
+
+    def to_dict(self) -> dict:
+        return dict(self.values)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'RawAggregate':
+        return cls(data)
+
+
+def merge_aggregates(aggregates: Iterable[Optional[RawAggregate]]) -> RawAggregate:
+    """Merge any number of aggregates (None entries are skipped) into a new one."""
+    merged = RawAggregate.empty()
+    for aggregate in aggregates:
+        merged.merge(aggregate)
+    return merged
+
+
+def _add(a, b):
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return a + b
+    # Non-numeric values (notes, labels) can't be added; keep the newer one
+    return b
+
+
+def _weighted_mean(a, weight_a, b, weight_b):
+    """Mean of two means; a missing weight counts as 1 and a None mean is skipped."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    weight_a = 1 if weight_a is None else weight_a
+    weight_b = 1 if weight_b is None else weight_b
+    if weight_a + weight_b == 0:
+        return (a + b) / 2
+    return (a * weight_a + b * weight_b) / (weight_a + weight_b)
+
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else value
+
+
+def _field_order(ours: dict, theirs: dict) -> list:
+    """Keep the first side's field order, then any new fields from the second."""
+    return list(ours) + [field for field in theirs if field not in ours]
+
+
+# =============================================================================
+# PERIOD KEYS AND ROLLUPS
+# =============================================================================
+
+def grain_of(key: str) -> Optional[str]:
+    """
+    'day' (YYYY-MM-DD), 'week' (YYYY-Www), 'month' (YYYY-MM), 'fy' (FYyyyy),
+    'range' (YYYY-MM-DD..YYYY-MM-DD) or None.
+    """
+    for grain, pattern in _GRAIN_PATTERNS.items():
+        if pattern.match(key):
+            return grain
+    return None
+
+
+def fiscal_year(year: int, month: int) -> str:
+    """FY label for a calendar month, per FISCAL_YEAR_START_MONTH."""
+    if FISCAL_YEAR_START_MONTH > 1 and month >= FISCAL_YEAR_START_MONTH:
+        year += 1
+    return f"FY{year:04d}"
+
+
+def rollup_key(key: str, grain: str) -> Optional[str]:
+    """
+    The key a period rolls up into at a coarser grain.
+
+    Days roll into ISO weeks, months and fiscal years; months roll into
+    fiscal years. Returns None when the period can't be split that way
+    (a month into weeks, a week into months) or isn't coarser.
+
+    Examples:
+        rollup_key('2025-03-14', 'week')  -> '2025-W11'
+        rollup_key('2025-03', 'fy')       -> 'FY2025'
+    """
+    source = grain_of(key)
+    if source is None or grain not in GRAINS:
+        return None
+    if source == grain:
+        return key
+
+    if source == 'day':
+        day = date.fromisoformat(key)
+        if grain == 'week':
+            iso = day.isocalendar()
+            return f"{iso[0]:04d}-W{iso[1]:02d}"
+        if grain == 'month':
+            return key[:7]
+        return fiscal_year(day.year, day.month)
+
+    if source == 'month' and grain == 'fy':
+        return fiscal_year(int(key[:4]), int(key[5:7]))
+
+    return None
+
+
+def rollup(aggregates: Dict[str, RawAggregate], grain: str) -> Dict[str, RawAggregate]:
+    """
+    Merge finer-grained aggregates into grain-level ones.
+
+    Args:
+        aggregates: {period key: RawAggregate}, e.g. days or months
+        grain: 'week', 'month' or 'fy'
+
+    Returns:
+        {rolled-up key: merged RawAggregate}, sorted by key. Periods that
+        can't roll up to the grain are left out.
+    """
+    rolled = {}
+    for key in sorted(aggregates):
+        target = rollup_key(key, grain)
+        if target is None:
+            continue
+        rolled.setdefault(target, RawAggregate.empty()).merge(aggregates[key])
+    return dict(sorted(rolled.items()))
+
+
+def period_bounds(key: str) -> Optional[Tuple[date, date]]:
+    """
+    First day and the day after the last day of a period key.
+
+    Examples:
+        period_bounds('2025-W04')               -> (2025-01-20, 2025-01-27)
+        period_bounds('2025-01')                -> (2025-01-01, 2025-02-01)
+        period_bounds('2025-01-06..2025-01-19') -> (2025-01-06, 2025-01-20)
+    """
+    grain = grain_of(key)
+    if grain == 'day':
+        start = date.fromisoformat(key)
+        return start, start + timedelta(days=1)
+    if grain == 'week':
+        start = date.fromisocalendar(int(key[:4]), int(key[6:]), 1)
+        return start, start + timedelta(days=7)
+    if grain == 'month':
+        start = date(int(key[:4]), int(key[5:7]), 1)
+        return start, _add_months(start, 1)
+    if grain == 'fy':
+        start = date(int(key[2:]), FISCAL_YEAR_START_MONTH, 1)
+        if FISCAL_YEAR_START_MONTH > 1:
+            start = _add_months(start, -12)
+        return start, _add_months(start, 12)
+    if grain == 'range':
+        first, last = key.split(RANGE_SEPARATOR)
+        return date.fromisoformat(first), date.fromisoformat(last) + timedelta(days=1)
+    return None
+
+
+def previous_period(key: str) -> Optional[str]:
+    """The period of the same grain (and length, for ranges) just before key."""
+    grain = grain_of(key)
+    bounds = period_bounds(key)
+    if bounds is None:
+        return None
+    start, end = bounds
+    if grain == 'day':
+        return (start - timedelta(days=1)).isoformat()
+    if grain == 'week':
+        iso = (start - timedelta(days=7)).isocalendar()
+        return f"{iso[0]:04d}-W{iso[1]:02d}"
+    if grain == 'month':
+        return _add_months(start, -1).strftime('%Y-%m')
+    if grain == 'fy':
+        return f"FY{int(key[2:]) - 1:04d}"
+    length = end - start
+    return f"{(start - length).isoformat()}{RANGE_SEPARATOR}{(start - timedelta(days=1)).isoformat()}"
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.year * 12 + day.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
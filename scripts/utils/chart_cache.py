@@ -0,0 +1,139 @@
+"""
+Rendered Chart Cache
+Native PowerPoint line charts, keyed by content hash.
+
+A chart is fully described by its spec (categories, series values and
+styles, number format). add_line_chart() hashes the spec and, on a hit,
+places the cached chart XML and embedded workbook straight onto the slide
+instead of rebuilding and restyling the chart, so regenerating a board pack
+only renders charts whose series actually changed.
+
+Entries live in data/cache/charts as <sha256>.v<N>.xml / .xlsx pairs.
+Needs python-pptx, which is imported on first use.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache" / "charts"
+
+# Bump when _style_chart() changes so stale charts are ignored
+CHART_CACHE_VERSION = 1
+
+
+def chart_key(spec: dict) -> str:
+    """SHA-256 of a chart spec (everything that ends up in the chart XML)."""
+    payload = json.dumps(spec, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def chart_paths(key: str, cache_dir: Path = CACHE_DIR):
+    """(chart XML, embedded workbook) paths for a cache key."""
+    stem = f"{key}.v{CHART_CACHE_VERSION}"
+    return cache_dir / f"{stem}.xml", cache_dir / f"{stem}.xlsx"
+
+
+def _write_bytes(path: Path, blob: bytes):
+    """Write via a temporary sibling so concurrent renderers never read a partial entry."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(blob)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def _style_chart(chart, spec: dict):
+    """Fonts, axis format, legend and per-series line styles."""
+    from pptx.util import Pt
+    from pptx.dml.color import RGBColor
+    from pptx.enum.chart import XL_LEGEND_POSITION, XL_MARKER_STYLE
+    from pptx.enum.dml import MSO_LINE
+
+    chart.font.size = Pt(spec.get('font_size', 12))
+    chart.has_legend = len(spec['series']) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+
+    value_axis = chart.value_axis
+    value_axis.has_major_gridlines = True
+    value_axis.tick_labels.number_format = spec['number_format']
+    value_axis.tick_labels.number_format_is_linked = False
+
+    for plot_series, series in zip(chart.plots[0].series, spec['series']):
+        plot_series.smooth = False
+        line = plot_series.format.line
+        line.color.rgb = RGBColor(*series['color'])
+        line.width = Pt(series.get('width', 2.5))
+        if series.get('dashed'):
+            line.dash_style = MSO_LINE.DASH
+        if not series.get('markers', True):
+            plot_series.marker.style = XL_MARKER_STYLE.NONE
+
+
+def _cached_chart_data(xml: bytes, xlsx: bytes):
+    """ChartData that hands python-pptx pre-rendered XML and workbook bytes."""
+    from pptx.chart.data import CategoryChartData
+
+    class CachedChartData(CategoryChartData):
+        def xml_bytes(self, chart_type):
+            return xml
+
+        @property
+        def xlsx_blob(self):
+            return xlsx
+
+    return CachedChartData()
+
+
+def _detached_xml(chart_part) -> bytes:
+    """Chart XML without its workbook relationship (re-added when the entry is used)."""
+    from copy import deepcopy
+    from lxml import etree
+    from pptx.oxml.ns import qn
+
+    element = deepcopy(chart_part._element)
+    for external in element.findall(qn('c:externalData')):
+        element.remove(external)
+    return etree.tostring(element, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+
+def add_line_chart(slide, spec: dict, x, y, cx, cy, cache_dir: Path = CACHE_DIR) -> bool:
+    """
+    Add a styled line chart to a slide, from the cache when possible.
+
+    Args:
+        slide: python-pptx slide
+        spec: {'categories': [...], 'number_format': '0%', 'font_size': 12,
+               'series': [{'name', 'values', 'color': (r, g, b),
+                           'width', 'dashed', 'markers'}, ...]}
+        x, y, cx, cy: Position and size (python-pptx Length)
+        cache_dir: Cache location (default data/cache/charts)
+
+    Returns:
+        True if the chart came from the cache
+    """
+    from pptx.chart.data import CategoryChartData
+    from pptx.enum.chart import XL_CHART_TYPE
+
+    xml_path, xlsx_path = chart_paths(chart_key(spec), cache_dir)
+    if xml_path.exists() and xlsx_path.exists():
+        chart_data = _cached_chart_data(xml_path.read_bytes(), xlsx_path.read_bytes())
+        slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, x, y, cx, cy, chart_data)
+        return True
+
+    chart_data = CategoryChartData(number_format=spec['number_format'])
+    chart_data.categories = spec['categories']
+    for series in spec['series']:
+        chart_data.add_series(series['name'], series['values'])
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, x, y, cx, cy, chart_data).chart
+    _style_chart(chart, spec)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_bytes(xlsx_path, chart.part.chart_workbook.xlsx_part.blob)
+    _write_bytes(xml_path, _detached_xml(chart.part))
+    return False
@@ -0,0 +1,451 @@
+"""
+ISPN Erlang Staffing Engine
+Erlang C / Erlang A queueing models, service-level solvers and
+required-agent searches for 15-minute staffing intervals.
+
+Erlang C (M/M/N) assumes callers wait forever; Erlang A (M/M/N+M) adds
+exponential caller patience, so some callers abandon. Both are computed
+without factorials or powers of the load: Erlang B by its stable recursion
+(Erlang C follows from it) and the Erlang A state probabilities in log
+space, so 500+ agent intervals are as accurate as 5-agent ones.
+
+All Erlang C functions accept scalars or NumPy arrays and broadcast, so a
+week of intervals (672 rows) is one call:
+
+    frame = interactions_workload(parse_interactions(path))
+    plan = week_requirements(frame, target_sl=0.80, target_sec=120)
+
+Units: load in Erlangs, times in seconds, service level and occupancy as
+0..1 fractions.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import period_bounds
+
+# Staffing interval used by Genesys WFM
+INTERVAL_SECONDS = 900
+
+# Service goal defaults (ISPN workforce targets: 80% answered in 120s)
+DEFAULT_SERVICE_LEVEL = 0.80
+DEFAULT_TARGET_SECONDS = 120
+
+# Upper bound for required-agent searches
+MAX_AGENTS = 2000
+
+# Erlang A state truncation: drop states less likely than e^-40 of the mode
+_LOG_CUTOFF = 40.0
+
+
+# =============================================================================
+# LOAD
+# =============================================================================
+
+def offered_load(calls, aht_sec, interval_sec: float = INTERVAL_SECONDS):
+    """
+    Offered traffic in Erlangs: calls x AHT / interval length.
+
+    Args:
+        calls: Calls offered in the interval
+        aht_sec: Average handle time (seconds)
+        interval_sec: Interval length (default 15 minutes)
+    """
+    return np.asarray(calls, dtype='float64') * np.asarray(aht_sec, dtype='float64') / interval_sec
+
+
+# =============================================================================
+# ERLANG C (vectorized)
+# =============================================================================
+
+def erlang_b(agents, load):
+    """
+    Erlang B blocking probability, by the recursion
+    B(0) = 1, B(n) = A·B(n-1) / (n + A·B(n-1)).
+
+    Args:
+        agents: Number of agents (int or int array)
+        load: Offered load in Erlangs (float or array)
+    """
+    agents, load = np.broadcast_arrays(np.asarray(agents, dtype='int64'), np.asarray(load, dtype='float64'))
+    b = np.ones(load.shape)
+    result = np.ones(load.shape)
+    for n in range(1, int(agents.max(initial=0)) + 1):
+        b = load * b / (n + load * b)
+        result = np.where(agents == n, b, result)
+    return result[()] if result.ndim == 0 else result
+
+
+def erlang_c(agents, load):
+    """
+    Probability an arriving call waits (Erlang C).
+
+    Returns 1 where the load meets or exceeds the agents (the queue grows
+    without bound).
+    """
+    agents, load = np.broadcast_arrays(np.asarray(agents, dtype='float64'), np.asarray(load, dtype='float64'))
+    b = erlang_b(agents.astype('int64'), load)
+    stable = agents > load
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c = np.where(stable, agents * b / (agents - load * (1 - b)), 1.0)
+    return c[()] if np.ndim(c) == 0 else c
+
+
+def service_level(agents, load, aht_sec, target_sec=DEFAULT_TARGET_SECONDS):
+    """
+    Fraction of calls answered within target_sec (Erlang C):
+    1 - C · exp(-(N - A) · t / AHT). 0 for unstable intervals.
+    """
+    agents = np.asarray(agents, dtype='float64')
+    load = np.asarray(load, dtype='float64')
+    c = erlang_c(agents, load)
+    with np.errstate(over='ignore', invalid='ignore'):
+        sl = 1 - c * np.exp(-(agents - load) * np.asarray(target_sec, dtype='float64') / aht_sec)
+    sl = np.where(agents > load, sl, 0.0)
+    return sl[()] if np.ndim(sl) == 0 else sl
+
+
+def average_speed_of_answer(agents, load, aht_sec):
+    """Mean wait over all calls, in seconds (Erlang C): C · AHT / (N - A). inf if unstable."""
+    agents = np.asarray(agents, dtype='float64')
+    load = np.asarray(load, dtype='float64')
+    c = erlang_c(agents, load)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        asa = np.where(agents > load, c * np.asarray(aht_sec, dtype='float64') / (agents - load), np.inf)
+    return asa[()] if np.ndim(asa) == 0 else asa
+
+
+def occupancy(agents, load):
+    """Agent occupancy A / N, capped at 1 (0 with no agents)."""
+    agents = np.asarray(agents, dtype='float64')
+    load = np.asarray(load, dtype='float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        occ = np.where(agents > 0, np.minimum(load / agents, 1.0), 0.0)
+    return occ[()] if np.ndim(occ) == 0 else occ
+
+
+def required_agents(load, aht_sec, target_sl: float = DEFAULT_SERVICE_LEVEL,
+                    target_sec: float = DEFAULT_TARGET_SECONDS, max_asa_sec: float = None,
+                    max_occupancy: float = None, max_agents: int = MAX_AGENTS):
+    """
+    Fewest agents meeting every given goal (Erlang C).
+
+    Walks n = 1, 2, ... once for all intervals together, carrying the
+    Erlang B recursion forward, so a whole week costs one pass up to the
+    busiest interval's answer.
+
+    Args:
+        load: Offered load in Erlangs (scalar or array)
+        aht_sec: Average handle time in seconds (scalar or array)
+        target_sl: Required fraction answered within target_sec
+        target_sec: Service level threshold (seconds)
+        max_asa_sec: Optional ceiling on average speed of answer
+        max_occupancy: Optional ceiling on occupancy (e.g. 0.85)
+        max_agents: Search limit
+
+    Returns:
+        int (or int array): 0 for intervals with no load
+
+    Raises:
+        ValueError: If an interval needs more than max_agents
+    """
+    load, aht = np.broadcast_arrays(np.asarray(load, dtype='float64'), np.asarray(aht_sec, dtype='float64'))
+    shape = load.shape
+    load, aht = load.ravel(), aht.ravel()
+
+    required = np.zeros(load.size, dtype='int64')
+    pending = load > 0
+    b = np.ones(load.size)
+    for n in range(1, max_agents + 1):
+        if not pending.any():
+            break
+        b = load * b / (n + load * b)
+        idx = np.flatnonzero(pending & (n > load))
+        if idx.size == 0:
+            continue
+        a, bn, h = load[idx], b[idx], aht[idx]
+        c = n * bn / (n - a * (1 - bn))
+        meets = 1 - c * np.exp(-(n - a) * target_sec / h) >= target_sl
+        if max_asa_sec is not None:
+            meets &= c * h / (n - a) <= max_asa_sec
+        if max_occupancy is not None:
+            meets &= a / n <= max_occupancy
+        required[idx[meets]] = n
+        pending[idx[meets]] = False
+
+    if pending.any():
+        raise ValueError(f"{int(pending.sum())} interval(s) need more than {max_agents} agents")
+    return int(required[0]) if shape == () else required.reshape(shape)
+
+
+# =============================================================================
+# ERLANG A (abandonment)
+# =============================================================================
+
+def erlang_a(agents: int, load: float, aht_sec: float, patience_sec: float,
+             target_sec: float = DEFAULT_TARGET_SECONDS) -> dict:
+    """
+    Erlang A (M/M/N+M) performance for one interval.
+
+    Callers abandon after an exponential patience with mean patience_sec.
+    State probabilities are computed in log space and truncated where they
+    fall below e^-40 of the largest; service level integrates each queued
+    caller's race between reaching an agent and abandoning (uniformized
+    Markov chain), so no closed-form approximation is involved.
+
+    Args:
+        agents: Agents on queue
+        load: Offered load in Erlangs
+        aht_sec: Average handle time (seconds)
+        patience_sec: Mean time callers wait before abandoning (seconds)
+        target_sec: Service level threshold (seconds)
+
+    Returns:
+        Dict with p_wait, p_abandon, avg_wait_sec (over all offered calls),
+        service_level (answered within target_sec / offered, so abandons
+        count against it) and occupancy
+    """
+    agents = int(agents)
+    if load <= 0:
+        return {'p_wait': 0.0, 'p_abandon': 0.0, 'avg_wait_sec': 0.0, 'service_level': 1.0, 'occupancy': 0.0}
+    if agents <= 0:
+        return {'p_wait': 1.0, 'p_abandon': 1.0, 'avg_wait_sec': patience_sec, 'service_level': 0.0,
+                'occupancy': 0.0}
+
+    mu = 1.0 / aht_sec
+    theta = 1.0 / patience_sec
+    arrival = load * mu
+    probs, queued = _erlang_a_states(agents, load, mu, theta)
+
+    p_wait = float(queued.sum())
+    waiting = float((np.arange(queued.size) * queued).sum())
+    p_abandon = theta * waiting / arrival
+    answered_in_time = (1 - p_wait) + _answered_within(queued, agents * mu, theta, target_sec)
+
+    return {
+        'p_wait': p_wait,
+        'p_abandon': p_abandon,
+        'avg_wait_sec': waiting / arrival,
+        'service_level': float(min(1.0, answered_in_time)),
+        'occupancy': min(1.0, load * (1 - p_abandon) / agents),
+    }
+
+
+def _erlang_a_states(agents: int, load: float, mu: float, theta: float):
+    """
+    Stationary probabilities of the M/M/N+M birth-death chain.
+
+    Returns:
+        (probabilities of n = 0..N-1 busy agents with nobody queued,
+         probabilities of k = 0.. callers queued with all N busy)
+    """
+    n = np.arange(agents + 1)
+    log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, agents + 1)))])
+    log_low = n * math.log(load) - log_fact
+
+    # Queue states: each extra caller multiplies by λ / (Nμ + kθ)
+    arrival = load * mu
+    peak = max(0.0, (arrival - agents * mu) / theta)
+    limit = int(peak + 12 * math.sqrt(arrival / theta + 1) + 50)
+    limit = min(limit, 200000)
+    k = np.arange(1, limit + 1)
+    log_queue = log_low[-1] + np.cumsum(math.log(arrival) - np.log(agents * mu + k * theta))
+
+    log_all = np.concatenate([log_low, log_queue])
+    top = log_all.max()
+    keep = log_all >= top - _LOG_CUTOFF
+    last = np.flatnonzero(keep)[-1]
+    log_all = log_all[:last + 1]
+    probs = np.exp(log_all - top)
+    probs /= probs.sum()
+    return probs[:agents], probs[agents:]
+
+
+def _answered_within(queued: np.ndarray, service_rate: float, theta: float, target_sec: float) -> float:
+    """
+    P(a caller who must queue is answered within target_sec), summed over
+    the queue length they find (queued[k] = P(arrive to find k waiting)).
+
+    With k callers ahead, the caller moves up at rate Nμ + kθ (a service or
+    an abandonment ahead) and abandons at rate θ; reaching the front and
+    then the next service completion means answered.
+    """
+    if queued.size == 0 or target_sec <= 0:
+        return 0.0
+    k = np.arange(queued.size)
+    advance = service_rate + k * theta
+    rate = advance[-1] + theta                  # uniformization rate
+    stay = 1 - (advance + theta) / rate
+    move = advance / rate
+
+    # P(answered by t) = sum over m of Poisson(m; rate·t) x P(answered within m steps)
+    mean = rate * target_sec
+    steps = int(mean + 10 * math.sqrt(mean) + 20)
+    q = queued.astype('float64').copy()
+    answered = 0.0
+    total = 0.0
+    used = 0.0
+    log_weight = -mean                          # log Poisson(0; mean)
+    for m in range(steps + 1):
+        weight = math.exp(log_weight)
+        total += weight * answered
+        used += weight
+        answered += q[0] * move[0]
+        q = np.append(q[1:] * move[1:], 0.0) + q * stay
+        log_weight += math.log(mean) - math.log(m + 1)
+    # Poisson mass past the last step counts at the final value
+    return total + max(0.0, 1 - used) * answered
+
+
+def required_agents_erlang_a(load: float, aht_sec: float, patience_sec: float,
+                             target_sl: float = DEFAULT_SERVICE_LEVEL,
+                             target_sec: float = DEFAULT_TARGET_SECONDS,
+                             max_abandon: float = None, max_agents: int = MAX_AGENTS) -> int:
+    """
+    Fewest agents meeting the service level (and abandon ceiling) under Erlang A.
+
+    Service level only improves with more agents, so this bisects between
+    1 and a doubling upper bound instead of trying every count.
+
+    Raises:
+        ValueError: If max_agents is not enough
+    """
+    if load <= 0:
+        return 0
+
+    def meets(n):
+        perf = erlang_a(n, load, aht_sec, patience_sec, target_sec)
+        return perf['service_level'] >= target_sl and (max_abandon is None or perf['p_abandon'] <= max_abandon)
+
+    hi = max(1, int(math.ceil(load)))
+    while not meets(hi):
+        if hi >= max_agents:
+            raise ValueError(f"Load of {load:.1f} Erlangs needs more than {max_agents} agents")
+        hi = min(max_agents, hi * 2)
+    lo = 0
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if meets(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi
+
+
+# =============================================================================
+# INTERVAL FEEDS (parser output -> per-interval frames)
+# =============================================================================
+
+def interactions_workload(parsed: dict) -> pd.DataFrame:
+    """
+    Per-interval workload from parse_interactions() output.
+
+    Calls offered = valid inbound calls + abandons (after 60s). AHT is the
+    interval's own handle time; intervals with no handled calls use the
+    overall AHT.
+
+    Returns:
+        DataFrame with start (Timestamp), calls, aht_sec
+    """
+    intervals = parsed.get('intervals') or {}
+    frame = pd.DataFrame({
+        'start': pd.to_datetime(intervals.get('start', []), format='%Y-%m-%d %H:%M'),
+        'handled': np.asarray(intervals.get('inbound_call_count', []), dtype='float64'),
+        'handle_ms': np.asarray(intervals.get('inbound_total_handle_ms', []), dtype='float64'),
+        'abandoned': np.asarray(intervals.get('abandoned_call_count', []), dtype='float64'),
+    })
+    overall = frame['handle_ms'].sum() / frame['handled'].sum() / 1000 if frame['handled'].sum() else np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        aht = np.where(frame['handled'] > 0, frame['handle_ms'] / frame['handled'] / 1000, overall)
+    return pd.DataFrame({
+        'start': frame['start'],
+        'calls': frame['handled'] + frame['abandoned'],
+        'aht_sec': aht,
+    })
+
+
+def wfm_staffing(parsed: dict) -> pd.DataFrame:
+    """
+    Per-interval scheduled/required staff from parse_wfm_scheduled() output.
+
+    Returns:
+        DataFrame with start (Timestamp), scheduled, wfm_required,
+        wfm_required_with_shrinkage (whichever the export had)
+    """
+    intervals = parsed.get('intervals') or {}
+    frame = pd.DataFrame({'start': pd.to_datetime(intervals.get('start', []), format='%Y-%m-%d %H:%M')})
+    for key, name in (('scheduled', 'scheduled'), ('required', 'wfm_required'),
+                      ('required_with_shrinkage', 'wfm_required_with_shrinkage')):
+        if key in intervals:
+            frame[name] = pd.to_numeric(pd.Series(intervals[key], dtype='object'), errors='coerce')
+    return frame
+
+
+def week_requirements(workload: pd.DataFrame, staffing: pd.DataFrame = None, week: str = None,
+                      target_sl: float = DEFAULT_SERVICE_LEVEL,
+                      target_sec: float = DEFAULT_TARGET_SECONDS,
+                      max_asa_sec: float = None, max_occupancy: float = None,
+                      patience_sec: float = None, shrinkage: float = None,
+                      interval_sec: float = INTERVAL_SECONDS) -> pd.DataFrame:
+    """
+    Required agents for every interval of a week (or whatever the frames hold).
+
+    Erlang C runs vectorized over all intervals at once. With patience_sec
+    the Erlang A model is used instead, one interval at a time.
+
+    Args:
+        workload: start, calls, aht_sec per interval (interactions_workload())
+        staffing: Optional start, scheduled, ... per interval (wfm_staffing());
+                  adds scheduled and gap (scheduled - required) columns
+        week: Optional ISO week (YYYY-Www) to restrict both frames to
+        target_sl / target_sec / max_asa_sec / max_occupancy: Service goals
+        patience_sec: Mean caller patience; switches to Erlang A
+        shrinkage: Optional fraction (e.g. 0.30) to gross up required agents
+        interval_sec: Interval length in seconds
+
+    Returns:
+        DataFrame per interval: start, calls, aht_sec, load_erlangs,
+        required_agents, service_level, asa_sec (Erlang C) or
+        abandon_pct (Erlang A), occupancy [, required_with_shrinkage]
+        [, scheduled, gap]
+    """
+    plan = workload.copy()
+    if staffing is not None and len(staffing):
+        plan = plan.merge(staffing, on='start', how='outer')
+    if week:
+        first, end = (pd.Timestamp(d) for d in period_bounds(week))
+        plan = plan[(plan['start'] >= first) & (plan['start'] < end)]
+    plan = plan.sort_values('start').reset_index(drop=True)
+
+    plan['calls'] = plan['calls'].fillna(0) if 'calls' in plan else 0.0
+    overall_aht = plan['aht_sec'].mean() if 'aht_sec' in plan else np.nan
+    plan['aht_sec'] = plan['aht_sec'].fillna(overall_aht) if 'aht_sec' in plan else np.nan
+    plan['load_erlangs'] = offered_load(plan['calls'], plan['aht_sec'].fillna(0), interval_sec)
+
+    load = plan['load_erlangs'].to_numpy()
+    aht = plan['aht_sec'].fillna(1).to_numpy()
+    if patience_sec is None:
+        agents = required_agents(load, aht, target_sl, target_sec, max_asa_sec, max_occupancy)
+        plan['required_agents'] = agents
+        plan['service_level'] = np.where(load > 0, service_level(agents, load, aht, target_sec), 1.0)
+        plan['asa_sec'] = np.where(load > 0, average_speed_of_answer(agents, load, aht), 0.0)
+        plan['occupancy'] = occupancy(agents, load)
+    else:
+        agents, perf = [], []
+        for a, h in zip(load, aht):
+            n = required_agents_erlang_a(a, h, patience_sec, target_sl, target_sec)
+            agents.append(n)
+            perf.append(erlang_a(n, a, h, patience_sec, target_sec))
+        plan['required_agents'] = np.asarray(agents, dtype='int64')
+        plan['service_level'] = [p['service_level'] for p in perf]
+        plan['abandon_pct'] = [p['p_abandon'] for p in perf]
+        plan['occupancy'] = [p['occupancy'] for p in perf]
+
+    if shrinkage is not None:
+        plan['required_with_shrinkage'] = np.ceil(plan['required_agents'] / (1 - shrinkage)).astype('int64')
+    if 'scheduled' in plan:
+        plan['gap'] = plan['scheduled'] - plan['required_agents']
+    return plan
@@ -0,0 +1,167 @@
+"""
+Columnar Frame Cache
+Typed Feather copies of exports, keyed by content hash.
+
+ingest.py writes one for every export it accepts, from the same full read
+the parser takes its columns from; load_export() is the
+reader the skill scripts use instead of pd.read_csv. A file whose bytes
+were seen before (same SHA-256, any name or location) comes back from an
+uncompressed Arrow file instead of being re-parsed. The file is memory-mapped,
+but the DataFrame is not a zero-copy view of it: only null-free numeric
+columns map straight through, while strings, nullable integers and
+categoricals are converted into pandas memory.
+
+Frames are "normalized": column names have BOMs/quotes stripped and known
+Genesys exports carry their EXPORT_SCHEMAS dtypes (Int64 milliseconds,
+categorical Direction/Queue/...). Every column is kept.
+
+Needs pyarrow; without it load_export() simply reads the CSV.
+"""
+
+import os
+import tempfile
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from .manifest import file_content_hash
+from .parsers import (
+    EXPORT_SCHEMAS, CsvHeader, read_export, sniff_header, identify_file_type, _clean_column,
+)
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "cache" / "frames"
+
+# Bump when EXPORT_SCHEMAS typing changes so stale frames are ignored
+FRAME_CACHE_VERSION = 1
+
+# identify_file_type() names that differ from the parser source names
+SOURCE_ALIASES = {'wfm_scheduled': 'wfm_scheduled_required'}
+
+
+def cache_available() -> bool:
+    """True if pyarrow is installed (Feather read/write)."""
+    return find_spec('pyarrow') is not None
+
+
+def frame_path(content_hash: str, cache_dir: Path = CACHE_DIR) -> Path:
+    return cache_dir / f"{content_hash}.v{FRAME_CACHE_VERSION}.feather"
+
+
+def export_source(filepath: Path, header: CsvHeader = None) -> Optional[str]:
+    """EXPORT_SCHEMAS key for a file, or None if it isn't a known export."""
+    source = identify_file_type(Path(filepath), header)
+    source = SOURCE_ALIASES.get(source, source)
+    return source if source in EXPORT_SCHEMAS else None
+
+
+def read_normalized(filepath: Path, source: str = None) -> pd.DataFrame:
+    """
+    Read a CSV into the normalized frame (no cache involved).
+
+    Args:
+        filepath: CSV file
+        source: EXPORT_SCHEMAS key; None = detect, plain read if unknown
+    """
+    header = sniff_header(filepath)
+    source = source or export_source(filepath, header)
+    if source in EXPORT_SCHEMAS:
+        df, _ = read_export(filepath, source, prune=False, header=header)
+    else:
+        df = pd.read_csv(filepath, **(header.read_csv_args() if header else {}))
+    df.columns = [_clean_column(str(c)) for c in df.columns]
+    return df
+
+
+def write_frame(df: pd.DataFrame, path: Path):
+    """
+    Write a frame as uncompressed Feather (memory-mappable).
+
+    Written to a temp file and renamed into place, so readers (and parallel
+    ingest workers) never see a partial file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    os.close(fd)
+    try:
+        df.reset_index(drop=True).to_feather(tmp, compression='uncompressed')
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def read_frame(path: Path) -> pd.DataFrame:
+    """
+    Load a cached Feather file as a DataFrame.
+
+    split_blocks keeps one block per column so nothing is consolidated into
+    2-D blocks (an extra copy), and self_destruct releases each Arrow column
+    once it has been converted instead of keeping the whole table alive
+    alongside the frame.
+    """
+    from pyarrow import feather
+    table = feather.read_table(str(path), memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def is_cached(content_hash: str, cache_dir: Path = CACHE_DIR) -> bool:
+    """True if the columnar copy for this content hash already exists."""
+    return frame_path(content_hash, cache_dir).exists()
+
+
+def cache_export(filepath: Path, source: str = None, content_hash: str = None,
+                 cache_dir: Path = CACHE_DIR, frame: pd.DataFrame = None) -> Optional[Path]:
+    """
+    Ensure the columnar copy of an export exists.
+
+    Args:
+        frame: The export's full typed frame (read_export(..., prune=False))
+               if the caller already has it; otherwise the CSV is read
+
+    Returns:
+        Path of the cached frame, or None if pyarrow is missing or the
+        frame can't be stored as Arrow (mixed-type object columns)
+    """
+    if not cache_available():
+        return None
+    path = frame_path(content_hash or file_content_hash(filepath), cache_dir)
+    if path.exists():
+        return path
+    if frame is None:
+        frame = read_normalized(filepath, source)
+    else:
+        frame = frame.rename(columns=lambda c: _clean_column(str(c)))
+    try:
+        write_frame(frame, path)
+    except (ValueError, TypeError):
+        return None
+    return path
+
+
+def load_export(filepath: Path, source: str = None, cache_dir: Path = CACHE_DIR) -> pd.DataFrame:
+    """
+    Normalized frame for a CSV export, from the cache when possible.
+
+    On a miss the CSV is read once and its frame cached for next time, so
+    this is a drop-in replacement for pd.read_csv in analysis scripts.
+
+    Args:
+        filepath: CSV file
+        source: EXPORT_SCHEMAS key; None = detect from name/header
+        cache_dir: Cache location (default data/cache/frames)
+    """
+    if not cache_available():
+        return read_normalized(filepath, source)
+
+    path = frame_path(file_content_hash(filepath), cache_dir)
+    if path.exists():
+        return read_frame(path)
+
+    df = read_normalized(filepath, source)
+    try:
+        write_frame(df, path)
+    except (ValueError, TypeError):
+        pass
+    return df
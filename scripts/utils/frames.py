@@ -0,0 +1,100 @@
+"""
+ISPN Frame Helpers
+Vectorized DataFrame -> nested dict conversion for parser output.
+
+Parsers emit per-agent / per-queue dicts such as
+    {'Agent A': {'call_count': 520, 'avg_handle_min': 10.5, ...}, ...}
+Building them row by row with iterrows() boxes every cell into a Series;
+frame_to_dict() does the unit conversion and NaN handling as whole-column
+operations and only zips plain Python lists at the end.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Col:
+    """
+    How one output field is derived from a frame column.
+
+    Attributes:
+        name: Source column
+        divisor: Unit conversion, value / divisor (e.g. 60000 for ms -> min)
+        multiplier: Unit conversion, value * multiplier (e.g. 100 for decimal -> %)
+        cast: Applied after conversion (int truncates, as int() does)
+        missing: Emitted for NaN/NA cells
+        absent: Emitted when the column is not in the frame (defaults to missing)
+        zero: If set, emitted when the source value is exactly 0
+        keep_missing: Pass NaN cells through untouched instead of using missing
+    """
+    name: str
+    divisor: float = None
+    multiplier: float = None
+    cast: type = None
+    missing: Any = None
+    absent: Any = ...
+    zero: Any = ...
+    keep_missing: bool = False
+
+
+def column_values(df: pd.DataFrame, col: Col) -> List[Any]:
+    """Convert one column to a list of plain Python values per a Col spec."""
+    if col.name not in df.columns:
+        return [col.missing if col.absent is ... else col.absent] * len(df)
+
+    series = df[col.name]
+    missing = series.isna().to_numpy()
+    if col.keep_missing and col.divisor is None and col.multiplier is None and col.cast is None:
+        return series.tolist()
+
+    values = series
+    if col.divisor is not None:
+        values = values / col.divisor
+    if col.multiplier is not None:
+        values = values.astype('float64') * col.multiplier
+    if col.cast is not None:
+        values = values.where(~missing, 0).astype('int64' if col.cast is int else col.cast)
+
+    out = np.array(values.tolist(), dtype=object)
+    if col.zero is not ...:
+        out[(series == 0).fillna(False).to_numpy(dtype=bool)] = col.zero
+    if not col.keep_missing:
+        out[missing] = col.missing
+    elif missing.any():
+        out[missing] = series[missing].tolist()
+    return out.tolist()
+
+
+def frame_to_dict(df: pd.DataFrame, key: str, fields: Dict[str, Col],
+                  skip_blank_keys: bool = True) -> Dict[Any, dict]:
+    """
+    Build {key value: {field: value}} from a frame, one entry per row.
+
+    Rows with a missing key are skipped (and empty-string keys too, unless
+    skip_blank_keys is False). Duplicate keys keep the last row, in the
+    position of the first, exactly like assigning in a row loop.
+
+    Args:
+        df: Source frame
+        key: Column holding the dict keys
+        fields: Output field name -> Col spec, in output order
+
+    Returns:
+        Nested dict of plain Python values (NaN -> None unless the spec says otherwise)
+    """
+    keys = df[key].tolist()
+    keep = df[key].notna().tolist()
+    if skip_blank_keys:
+        keep = [ok and bool(k) for k, ok in zip(keys, keep)]
+
+    names = list(fields)
+    columns = [column_values(df, fields[name]) for name in names]
+    return {
+        k: dict(zip(names, values))
+        for k, ok, *values in zip(keys, keep, *columns)
+        if ok
+    }
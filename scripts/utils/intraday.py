@@ -0,0 +1,321 @@
+"""
+ISPN Intraday Staffing Engine
+Interval-by-interval OVERSTAFFED / UNDERSTAFFED assessment (ispn-intraday-staffing).
+
+Feed 15-minute interval rows in time order; each push() returns a verdict
+for that interval. "Sustained" triggers ("AWT > 180 seconds sustained 15+
+minutes") keep a run length per trigger and the forecast variance keeps
+running sums over a fixed trailing window, so each interval costs O(1)
+however long the replay.
+
+    engine = IntradayEngine()
+    for row in interval_rows(interactions, agent_status, wfm):
+        verdict = engine.push(row)
+
+Row fields (all optional except start; missing values never fire a trigger):
+    start             'YYYY-MM-DD HH:MM'
+    staff             Agents available (average on queue)
+    scheduled         WFM scheduled agents (used as staff when staff is missing)
+    required          WFM required agents (used when no live workload)
+    offered, aht_sec  Live workload -> required agents at target occupancy
+    awt_sec           Average wait of answered calls (seconds)
+    abandon_rate      Abandoned / offered (0..1)
+    occupancy         Call time / on-queue time (0..1)
+    utilization       Call time / logged-in time (0..1)
+    calls_in_queue    Average queue depth
+    forecast          Forecast calls (for forecast variance)
+    outage            True when an outage is declared
+    remaining_hours   Hours left in the shift (VTO/OT hours; default one interval)
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+
+INTERVAL_MINUTES = 15
+INTERVAL_FORMAT = '%Y-%m-%d %H:%M'
+
+# Occupancy used to turn live workload into required agents (calculate_staff_gap)
+TARGET_OCCUPANCY = 0.85
+
+# Trailing intervals in the forecast variance
+VARIANCE_WINDOW = 4
+
+# Overstaffed triggers: name -> (field, op, threshold, sustained minutes, points)
+OVERSTAFFED_TRIGGERS = {
+    'awt_under_30s': ('awt_sec', '<', 30, 30, 3),
+    'occupancy_under_65pct': ('occupancy', '<', 0.65, 30, 3),
+    'queue_empty': ('calls_in_queue', '==', 0, 15, 2),
+    'utilization_under_50pct': ('utilization', '<', 0.50, 0, 3),
+    'forecast_variance_under_-15pct': ('forecast_variance', '<', -0.15, 0, 2),
+}
+
+# Score -> status, highest first
+OVERSTAFFED_LEVELS = ((8, 'CRITICAL_OVERSTAFFED'), (5, 'OVERSTAFFED'))
+
+# Understaffed triggers: name -> (field, op, threshold, sustained minutes, severity)
+# Severity None: only counts as part of UNDERSTAFFED_COMBINED
+UNDERSTAFFED_TRIGGERS = {
+    'awt_over_300s': ('awt_sec', '>', 300, 0, 'CRITICAL'),
+    'abandon_over_10pct': ('abandon_rate', '>', 0.10, 0, 'CRITICAL'),
+    'outage': ('outage', '==', True, 0, 'CRITICAL'),
+    'awt_over_180s': ('awt_sec', '>', 180, 15, 'WARNING'),
+    'abandon_over_5pct': ('abandon_rate', '>', 0.05, 0, 'WARNING'),
+    'occupancy_over_90pct': ('occupancy', '>', 0.90, 30, None),
+    'queue_over_20': ('calls_in_queue', '>', 20, 10, None),
+}
+
+# Triggers that are a WARNING only when all fire together
+UNDERSTAFFED_COMBINED = (('occupancy_over_90pct', 'queue_over_20'), 'WARNING')
+
+ACTIONS = {
+    'CRITICAL_OVERSTAFFED': 'Mandatory early release (lowest seniority first)',
+    'OVERSTAFFED': 'Offer VTO, reassign to projects, cancel scheduled OT',
+    'WITHIN_TOLERANCE': 'Monitor, no action',
+    'WARNING': 'Recall breaks, activate on-call, request voluntary OT',
+    'CRITICAL': 'Mandatory OT, cancel non-critical off-queue activities, enable callback',
+}
+
+_OPS = {
+    '<': lambda value, threshold: value < threshold,
+    '>': lambda value, threshold: value > threshold,
+    '==': lambda value, threshold: value == threshold,
+}
+
+
+@dataclass
+class IntervalVerdict:
+    """Assessment of one interval."""
+    start: str
+    verdict: str                # UNDERSTAFFED, OVERSTAFFED or WITHIN_TOLERANCE
+    status: str                 # CRITICAL / WARNING, CRITICAL_OVERSTAFFED / OVERSTAFFED, WITHIN_TOLERANCE
+    score: int                  # Overstaffed score (0-13)
+    triggers: List[str]
+    staff: Optional[float]
+    required: Optional[float]
+    gap: Optional[float]        # required - staff (positive = short)
+    magnitude_pct: Optional[float]
+    vto_hours: float
+    ot_hours: float
+    action: str
+
+
+class IntradayEngine:
+    """
+    Incremental intraday staffing assessment.
+
+    Usage:
+        engine = IntradayEngine(target_occupancy=0.85)
+        verdicts = engine.replay(rows)
+        summarize(verdicts)
+    """
+
+    def __init__(self, interval_minutes: int = INTERVAL_MINUTES,
+                 target_occupancy: float = TARGET_OCCUPANCY,
+                 variance_window: int = VARIANCE_WINDOW):
+        self.interval_minutes = interval_minutes
+        self.target_occupancy = target_occupancy
+        self.variance_window = variance_window
+        self._needed = {
+            name: max(1, math.ceil(spec[3] / interval_minutes))
+            for name, spec in {**OVERSTAFFED_TRIGGERS, **UNDERSTAFFED_TRIGGERS}.items()
+        }
+        self.reset()
+
+    def reset(self):
+        """Forget all rolling state (e.g. at the start of a new day)."""
+        self._runs = dict.fromkeys(self._needed, 0)
+        self._window = deque()
+        self._offered_sum = 0.0
+        self._forecast_sum = 0.0
+        self._last_start = None
+
+    def _roll_variance(self, row: dict) -> Optional[float]:
+        """Trailing-window (actual - forecast) / forecast, kept as running sums."""
+        offered, forecast = row.get('offered'), row.get('forecast')
+        if _missing(offered) or _missing(forecast):
+            return None
+        self._window.append((offered, forecast))
+        self._offered_sum += offered
+        self._forecast_sum += forecast
+        if len(self._window) > self.variance_window:
+            old_offered, old_forecast = self._window.popleft()
+            self._offered_sum -= old_offered
+            self._forecast_sum -= old_forecast
+        if self._forecast_sum <= 0:
+            return None
+        return (self._offered_sum - self._forecast_sum) / self._forecast_sum
+
+    def _check_continuity(self, start: str):
+        """A missing interval breaks every sustained run."""
+        current = datetime.strptime(start, INTERVAL_FORMAT)
+        if self._last_start is not None and current - self._last_start != timedelta(minutes=self.interval_minutes):
+            self.reset()
+        self._last_start = current
+
+    def _fired(self, triggers: dict, values: dict) -> List[str]:
+        fired = []
+        for name, (field, op, threshold, _, _) in triggers.items():
+            value = values.get(field)
+            if not _missing(value) and _OPS[op](value, threshold):
+                self._runs[name] += 1
+            else:
+                self._runs[name] = 0
+            if self._runs[name] >= self._needed[name]:
+                fired.append(name)
+        return fired
+
+    def _required(self, row: dict) -> Optional[float]:
+        """Live workload at target occupancy, else the WFM requirement."""
+        offered, aht = row.get('offered'), row.get('aht_sec')
+        if not _missing(offered) and not _missing(aht):
+            calls_per_hour = offered * 60 / self.interval_minutes
+            return calls_per_hour * aht / 3600 / self.target_occupancy
+        required = row.get('required')
+        return None if _missing(required) else required
+
+    def push(self, row: dict) -> IntervalVerdict:
+        """Assess the next interval (rows must arrive in time order)."""
+        start = row['start']
+        self._check_continuity(start)
+
+        values = dict(row)
+        values['forecast_variance'] = self._roll_variance(row)
+        over = self._fired(OVERSTAFFED_TRIGGERS, values)
+        under = self._fired(UNDERSTAFFED_TRIGGERS, values)
+
+        staff = row.get('staff')
+        if _missing(staff):
+            staff = row.get('scheduled')
+        staff = None if _missing(staff) else staff
+        required = self._required(row)
+        gap = required - staff if staff is not None and required is not None else None
+        hours = row.get('remaining_hours')
+        hours = self.interval_minutes / 60 if _missing(hours) else hours
+
+        # Severity-None triggers only count through UNDERSTAFFED_COMBINED
+        severities = [UNDERSTAFFED_TRIGGERS[name][4] for name in under if UNDERSTAFFED_TRIGGERS[name][4]]
+        combined, combined_severity = UNDERSTAFFED_COMBINED
+        if all(name in under for name in combined):
+            severities.append(combined_severity)
+        score = sum(OVERSTAFFED_TRIGGERS[name][4] for name in over)
+
+        vto_hours = ot_hours = 0.0
+        magnitude = None
+        if severities:
+            verdict = 'UNDERSTAFFED'
+            status = 'CRITICAL' if 'CRITICAL' in severities else 'WARNING'
+            triggers = under
+            if gap is not None:
+                ot_hours = max(0.0, gap) * hours
+                magnitude = gap / staff * 100 if staff else None
+        else:
+            status = next((level for floor, level in OVERSTAFFED_LEVELS if score >= floor), 'WITHIN_TOLERANCE')
+            verdict = 'OVERSTAFFED' if status != 'WITHIN_TOLERANCE' else status
+            triggers = over
+            if verdict == 'OVERSTAFFED' and gap is not None:
+                vto_hours = max(0.0, -gap) * hours
+                magnitude = -gap / required * 100 if required else None
+
+        return IntervalVerdict(
+            start=start, verdict=verdict, status=status, score=score, triggers=triggers,
+            staff=staff, required=required, gap=gap, magnitude_pct=magnitude,
+            vto_hours=vto_hours, ot_hours=ot_hours, action=ACTIONS[status],
+        )
+
+    def replay(self, rows: Iterable[dict]) -> List[IntervalVerdict]:
+        """Push every row in order and return the verdicts."""
+        return [self.push(row) for row in rows]
+
+
+def _missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+# =============================================================================
+# INTERVAL ROWS (parser output or store -> engine rows)
+# =============================================================================
+
+def interval_rows(interactions: dict = None, agent_status: dict = None, wfm: dict = None,
+                  interval_minutes: int = INTERVAL_MINUTES) -> List[dict]:
+    """
+    Join columnar interval data into engine rows, ordered by start.
+
+    Accepts the 'intervals' of parse_interactions(), parse_agent_status()
+    and parse_wfm_scheduled(), or MetricsStore.get_intervals() output.
+    Intervals missing from a source simply lack its fields. Agent status
+    only yields interval staff from interval-grain exports; a daily summary
+    lands on the 00:00 interval as one day-long total.
+
+    Derived per interval:
+        offered        inbound + abandoned (after 60s) calls
+        aht_sec        inbound handle / inbound calls
+        awt_sec        inbound queue time / inbound calls
+        abandon_rate   abandoned / offered
+        calls_in_queue inbound queue time / interval length (Little's law)
+        staff          on-queue time / interval length
+        occupancy      inbound + outbound handle / on-queue time (ISPN occupancy)
+        utilization    inbound + outbound handle / logged-in time
+    """
+    interval_ms = interval_minutes * 60000
+    rows = {}
+
+    def columns(source):
+        source = source or {}
+        starts = source.get('start', [])
+        for i, start in enumerate(starts):
+            yield rows.setdefault(start, {'start': start}), {k: v[i] for k, v in source.items() if k != 'start'}
+
+    for row, values in columns(interactions):
+        handled = values.get('inbound_call_count', 0)
+        abandoned = values.get('abandoned_call_count', 0)
+        queue_ms = values.get('inbound_total_queue_ms', 0)
+        row['offered'] = handled + abandoned
+        row['abandon_rate'] = abandoned / row['offered'] if row['offered'] else None
+        row['aht_sec'] = values.get('inbound_total_handle_ms', 0) / handled / 1000 if handled else None
+        row['awt_sec'] = queue_ms / handled / 1000 if handled else None
+        row['calls_in_queue'] = queue_ms / interval_ms
+        row['_call_ms'] = values.get('inbound_total_handle_ms', 0) + values.get('outbound_total_handle_ms', 0)
+
+    for row, values in columns(agent_status):
+        on_queue = values.get('total_on_queue_ms', 0)
+        logged_in = values.get('total_logged_in_ms', 0)
+        row['staff'] = on_queue / interval_ms
+        row['_on_queue_ms'] = on_queue
+        row['_logged_in_ms'] = logged_in
+
+    for row, values in columns(wfm):
+        for key in ('scheduled', 'required'):
+            if values.get(key) is not None:
+                row[key] = values[key]
+
+    ordered = [rows[start] for start in sorted(rows)]
+    for row in ordered:
+        call_ms = row.pop('_call_ms', None)
+        on_queue = row.pop('_on_queue_ms', None)
+        logged_in = row.pop('_logged_in_ms', None)
+        if call_ms is not None and on_queue:
+            row['occupancy'] = call_ms / on_queue
+        if call_ms is not None and logged_in:
+            row['utilization'] = call_ms / logged_in
+    return ordered
+
+
+def summarize(verdicts: List[IntervalVerdict]) -> dict:
+    """Interval counts per status plus total VTO and OT hours."""
+    counts = {}
+    for verdict in verdicts:
+        counts[verdict.status] = counts.get(verdict.status, 0) + 1
+    return {
+        'intervals': len(verdicts),
+        'by_status': counts,
+        'vto_hours': sum(v.vto_hours for v in verdicts),
+        'ot_hours': sum(v.ot_hours for v in verdicts),
+    }
+
+
+def to_records(verdicts: List[IntervalVerdict]) -> List[dict]:
+    """Verdicts as plain dicts (for JSON or pd.DataFrame)."""
+    return [asdict(verdict) for verdict in verdicts]
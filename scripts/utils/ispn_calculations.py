@@ -15,11 +15,16 @@ Author: Pete Connor (Director, Technical Center Operations)
 Date: 2026-01-30
 """
 
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from dataclasses import dataclass, field, fields, asdict
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime
 import json
 
+try:
+    from . import thresholds
+except ImportError:     # run directly: python scripts/utils/ispn_calculations.py
+    import thresholds
+
 
 # =============================================================================
 # CONSTANTS - DO NOT MODIFY
@@ -38,18 +43,19 @@ MINUTES_TO_HOURS = 1 / 60
 # Minimum call duration to count (Genesys standard: >20 seconds)
 MIN_CALL_DURATION_SECONDS = 20
 
-# FY25 KPI Targets (from 9 KPIs-Monthly sheet)
-TARGETS = {
-    'fcr_pct': {'target': 0.70, 'direction': 'above'},
-    'escalation_pct': {'target': 0.30, 'direction': 'below'},
-    'aht_minutes': {'target': 10.7, 'direction': 'below'},
-    'awt_seconds': {'target': 90, 'direction': 'below'},
-    'utilization_pct': {'target': 0.55, 'direction': 'above'},
-    'occupancy_pct': {'target': 0.65, 'direction': 'above'},  # Implicit from utilization
-    'shrinkage_pct': {'target': 0.30, 'direction': 'below'},
-    'quality_score': {'target': 88.0, 'direction': 'above'},
-    'abandon_pct': {'target': 0.05, 'direction': 'below'},
-    'adherence_pct': {'target': 0.90, 'direction': 'above'},
+# Units of ISPNCalculatedMetrics values (rates are fractions, 0.70 = 70%).
+# RAG thresholds live in data/metrics/targets.json; see utils.thresholds.
+METRIC_UNITS = {
+    'fcr_pct': 'fraction',
+    'escalation_pct': 'fraction',
+    'aht_minutes': 'minutes',
+    'awt_seconds': 'seconds',
+    'utilization_pct': 'fraction',
+    'occupancy_pct': 'fraction',
+    'shrinkage_pct': 'fraction',
+    'quality_score': 'score',
+    'abandon_pct': 'fraction',
+    'adherence_pct': 'fraction',
 }
 
 
@@ -412,6 +418,146 @@ class ISPNCalculationEngine:
         
         return metrics
     
+    def calculate_batch(self, table):
+        """
+        Calculate all ISPN metrics for many rows of raw data at once.
+
+        Same formulas, guards and warnings as calculate_all(), evaluated as
+        NumPy array operations - one row per period / queue / agent / day.
+
+        Args:
+            table: DataFrame (or anything pd.DataFrame() accepts) whose columns
+                are GenesysRawData field names. Missing columns and NaN cells
+                take the GenesysRawData defaults. tech_review_scores /
+                efficacy_scores, if present, hold one list of scores per row.
+
+        Returns:
+            DataFrame indexed like the input, one column per
+            ISPNCalculatedMetrics field. KPIs that cannot be calculated are
+            NaN (None in calculate_all); 'warnings' holds a list per row.
+        """
+        import numpy as np
+        import pandas as pd
+
+        table = table if isinstance(table, pd.DataFrame) else pd.DataFrame(table)
+        n = len(table)
+        defaults = GenesysRawData()
+
+        def col(name):
+            if name not in table.columns:
+                return np.full(n, float(getattr(defaults, name)))
+            return table[name].fillna(getattr(defaults, name)).to_numpy(dtype='float64')
+
+        def divide(num, den, mask):
+            # Only where the scalar path's guard holds; NaN (None) elsewhere
+            return np.divide(num, den, out=np.full(n, np.nan), where=mask)
+
+        out = {}
+
+        # STEP 1: Convert raw milliseconds to hours/minutes
+        inbound_count = col('inbound_call_count')
+        has_inbound = inbound_count > 0
+        genesys_inbound_minutes = col('inbound_total_handle_ms') * MS_TO_MINUTES
+        genesys_inbound_hours = col('inbound_total_handle_ms') * MS_TO_HOURS
+        genesys_inbound_awt_seconds = np.where(
+            has_inbound, divide(col('inbound_total_queue_ms'), inbound_count, has_inbound) * MS_TO_SECONDS, 0
+        )
+        genesys_outbound_hours = col('outbound_total_handle_ms') * MS_TO_HOURS
+        genesys_callback_hours = col('callback_total_handle_ms') * MS_TO_HOURS
+        total_logged_in_hours = col('total_logged_in_ms') * MS_TO_HOURS
+        total_on_queue_hours = col('total_on_queue_ms') * MS_TO_HOURS
+
+        # STEP 2: Derived values
+        total_inbound_count = inbound_count + col('wave_call_count')
+        total_inbound_minutes = genesys_inbound_minutes + col('wave_total_minutes')
+        out['total_inbound_call_count'] = total_inbound_count
+        out['total_inbound_call_minutes'] = total_inbound_minutes
+        out['total_inbound_call_hours'] = total_inbound_minutes * MINUTES_TO_HOURS
+        out['acw_hours'] = (ISPN_ACW_SECONDS_PER_CALL * SECONDS_TO_HOURS) * total_inbound_count
+        total_call_hours = genesys_inbound_hours + genesys_outbound_hours
+        out['total_outbound_call_count'] = col('outbound_call_count')
+        out['total_outbound_call_hours'] = genesys_outbound_hours
+        out['total_callback_count'] = col('callback_call_count')
+        out['total_callback_hours'] = genesys_callback_hours
+
+        # STEP 3: Agent hours
+        out['total_hours_worked'] = total_logged_in_hours
+        hours_worked_no_training = total_logged_in_hours - col('training_hours')
+        out['on_queue_hours'] = total_on_queue_hours
+        out['hours_unavailable'] = total_logged_in_hours - total_on_queue_hours
+
+        # STEP 4: KPIs (guards mirror calculate_all, row by row)
+        call_tickets = col('call_tickets')
+        has_tickets = call_tickets > 0
+        has_total_inbound = total_inbound_count > 0
+        has_hours = out['total_hours_worked'] > 0
+        has_hours_no_training = hours_worked_no_training > 0
+        has_on_queue = out['on_queue_hours'] > 0
+
+        out['escalation_pct'] = divide(col('escalations'), call_tickets, has_tickets)
+        out['fcr_pct'] = 1 - out['escalation_pct']
+        out['alert_ticket_pct'] = divide(col('alert_tickets'), call_tickets, has_tickets)
+        out['aht_minutes'] = divide(total_inbound_minutes, total_inbound_count, has_total_inbound)
+        out['awt_seconds'] = (
+            (divide(inbound_count, total_inbound_count, has_total_inbound) * genesys_inbound_awt_seconds) +
+            (divide(col('wave_call_count'), total_inbound_count, has_total_inbound) * col('wave_awt_seconds'))
+        )
+        out['shrinkage_pct'] = divide(out['hours_unavailable'], out['total_hours_worked'], has_hours)
+        out['utilization_pct'] = divide(
+            out['total_inbound_call_hours'] + out['acw_hours'], hours_worked_no_training, has_hours_no_training
+        )
+        out['occupancy_pct'] = divide(total_call_hours, out['on_queue_hours'], has_on_queue)
+
+        # Quality: per-row score lists (tech review first, efficacy fallback)
+        quality = np.full(n, np.nan)
+        for name in ('efficacy_scores', 'tech_review_scores'):
+            if name in table.columns:
+                scores = [s if isinstance(s, (list, tuple)) else [] for s in table[name]]
+                found = np.array([bool(s) for s in scores], dtype=bool)
+                values = np.array([sum(s) / len(s) if s else np.nan for s in scores], dtype='float64')
+                quality = np.where(found, values, quality)
+        out['quality_score'] = quality
+
+        abandoned = col('abandoned_call_count')
+        total_offered = total_inbound_count + abandoned
+        out['abandon_pct'] = divide(abandoned, total_offered, total_offered > 0)
+
+        for seconds in (30, 60, 90, 120):
+            out[f'pct_answered_{seconds}s'] = divide(col(f'answered_under_{seconds}s'), inbound_count, has_inbound)
+
+        total_calls = col('outbound_call_count') + total_inbound_count
+        out['ticket_call_variance'] = divide(call_tickets, total_calls, (total_calls > 0) & has_tickets)
+        out['headcount'] = col('agent_count')
+        # Not derived from Genesys raw data (left None by calculate_all too)
+        out['adherence_pct'] = np.full(n, np.nan)
+
+        # Per-row warnings, in calculate_all's order
+        checks = [
+            (has_tickets, "FCR: No call tickets - cannot calculate"),
+            (has_total_inbound, "AHT: No inbound calls - cannot calculate"),
+            (has_total_inbound, "AWT: No inbound calls - cannot calculate"),
+            (has_hours, "Shrinkage: No hours worked - cannot calculate"),
+            (has_hours_no_training, "Utilization: No hours (excl training) - cannot calculate"),
+            (has_on_queue, "Occupancy: No on-queue hours - cannot calculate"),
+        ]
+        failed = [~ok for ok, _ in checks]
+        out['warnings'] = [
+            [message for (_, message), bad in zip(checks, row) if bad]
+            for row in zip(*failed)
+        ]
+
+        out['calculation_timestamp'] = datetime.now().isoformat()
+        out['formula_version'] = self.formula_version
+
+        result = pd.DataFrame(out, index=table.index)
+        for name in BATCH_INT_COLUMNS:
+            result[name] = result[name].astype('int64')
+        return result[[f.name for f in fields(ISPNCalculatedMetrics)]]
+
+    def calculate_many(self, raws: Iterable[GenesysRawData]) -> List[ISPNCalculatedMetrics]:
+        """calculate_all() for a sequence of GenesysRawData, via calculate_batch()."""
+        return metrics_from_batch(self.calculate_batch(raw_table(raws)))
+
     def to_dict(self, metrics: ISPNCalculatedMetrics) -> dict:
         """Convert metrics to dictionary for JSON serialization."""
         return {
@@ -456,30 +602,51 @@ class ISPNCalculationEngine:
     
     def get_status(self, metric_name: str, value: float) -> str:
         """
-        Get RAG status for a metric based on ISPN targets.
+        Get RAG status for a metric based on ISPN targets (targets.json).
         
-        Returns: 'green', 'yellow', or 'red'
+        Returns: 'green', 'yellow', 'red' or 'unknown'
         """
-        if metric_name not in TARGETS or value is None:
+        if metric_name not in METRIC_UNITS:
             return 'unknown'
-        
-        target = TARGETS[metric_name]['target']
-        direction = TARGETS[metric_name]['direction']
-        
-        if direction == 'above':
-            if value >= target:
-                return 'green'
-            elif value >= target * 0.9:  # Within 10%
-                return 'yellow'
-            else:
-                return 'red'
-        else:  # below
-            if value <= target:
-                return 'green'
-            elif value <= target * 1.1:  # Within 10%
-                return 'yellow'
-            else:
-                return 'red'
+        return thresholds.get_status(metric_name, value, unit=METRIC_UNITS[metric_name]).lower()
+
+
+# =============================================================================
+# BATCH HELPERS - Columnar tables for calculate_batch()
+# =============================================================================
+
+# ISPNCalculatedMetrics fields that calculate_all() leaves as ints
+BATCH_INT_COLUMNS = [
+    'total_inbound_call_count', 'total_outbound_call_count', 'total_callback_count', 'headcount',
+]
+
+
+def raw_table(raws: Iterable[GenesysRawData]):
+    """Columnar DataFrame (one row per GenesysRawData) for calculate_batch()."""
+    import pandas as pd
+
+    rows = [asdict(raw) for raw in raws]
+    return pd.DataFrame(rows, columns=[f.name for f in fields(GenesysRawData)])
+
+
+def metrics_from_batch(frame) -> List[ISPNCalculatedMetrics]:
+    """Turn calculate_batch() rows back into ISPNCalculatedMetrics (NaN -> None)."""
+    import math
+
+    results = []
+    for record in frame.to_dict('records'):
+        values = {}
+        for name, value in record.items():
+            if isinstance(value, float) and math.isnan(value):
+                value = None
+            elif name in BATCH_INT_COLUMNS:
+                value = int(value)
+            elif hasattr(value, 'item'):
+                value = value.item()
+            values[name] = value
+        values['warnings'] = list(values['warnings'])
+        results.append(ISPNCalculatedMetrics(**values))
+    return results
 
 
 # =============================================================================
@@ -617,6 +784,31 @@ def compare_calculations(ispn_metrics: ISPNCalculatedMetrics, genesys_values: di
     return comparisons
 
 
+def compare_batch_to_scalar(raws: Iterable[GenesysRawData]) -> List[str]:
+    """
+    Check calculate_batch() against calculate_all(), row by row.
+
+    Every numeric field and the warning list must match exactly (floats
+    bit-for-bit, None for None). Returns a description of each mismatch;
+    an empty list means the two paths agree.
+    """
+    raws = list(raws)
+    engine = ISPNCalculationEngine()
+    batch = engine.calculate_many(raws)
+    skip = {'calculation_timestamp'}
+
+    mismatches = []
+    for i, (raw, got) in enumerate(zip(raws, batch)):
+        expected = engine.calculate_all(raw)
+        for f in fields(ISPNCalculatedMetrics):
+            if f.name in skip:
+                continue
+            a, b = getattr(expected, f.name), getattr(got, f.name)
+            if a != b or (a is None) != (b is None):
+                mismatches.append(f"row {i} {f.name}: scalar={a!r} batch={b!r}")
+    return mismatches
+
+
 # =============================================================================
 # EXAMPLE USAGE
 # =============================================================================
@@ -671,3 +863,7 @@ if __name__ == "__main__":
         print("\nWarnings:")
         for w in metrics.warnings:
             print(f"  ⚠️  {w}")
+
+    # Batch path must agree with calculate_all(), including empty periods
+    mismatches = compare_batch_to_scalar([raw, GenesysRawData()])
+    print(f"\nBatch vs scalar: {'identical' if not mismatches else mismatches}")
@@ -0,0 +1,24 @@
+"""
+Ingest Manifest Keys
+What identifies an ingested export: its content hash and the parser
+version that read it.
+
+Kept free of pandas so ingest.py can recognise unchanged files (and skip
+them) without loading the parsers.
+"""
+
+import hashlib
+from pathlib import Path
+
+# Bump whenever parser output changes; the ingest manifest re-ingests files
+# that were parsed by an older version.
+PARSER_VERSION = "2.6.1"
+
+
+def file_content_hash(filepath: Path) -> str:
+    """SHA-256 of the file contents, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
@@ -13,11 +13,20 @@ VALIDATED AGAINST ACTUAL GENESYS EXPORTS (Jan 2026):
 - Agent Schedules: 11 columns, agent configuration
 """
 
+import csv
+import numpy as np
 import pandas as pd
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
+from importlib.util import find_spec
+from typing import Iterator, List, Optional, Tuple
 import re
 
+from .sketch import QuantileSketch
+from .frames import Col, frame_to_dict
+from .manifest import PARSER_VERSION
+
 
 # =============================================================================
 # GENESYS FIELD MAPPINGS (VALIDATED FROM ACTUAL EXPORTS)
@@ -139,6 +148,9 @@ ADHERENCE_COLUMNS = {
     'work_time_on_queue': 'Work Time On Queue',           # MINUTES
 }
 
+# Date columns that may appear on dated Historical Adherence exports
+ADHERENCE_DATE_COLUMNS = ['Date', 'Interval Start', 'Start Date']
+
 # WFM Scheduled and Required
 WFM_SCHEDULED_COLUMNS = {
     'time_utc': 'Time (UTC)',
@@ -160,6 +172,52 @@ WFM_ACTIVITIES_COLUMNS = {
     'length_minutes': 'Length In Minutes',
 }
 
+# Agents Permanent Schedules (columns the parser summarizes)
+AGENT_SCHEDULE_COLUMNS = {
+    'schedulable': 'Schedulable',
+    'skills': 'Skills',
+    'planning_groups': 'Planning Groups',
+    'work_team': 'Work Team',
+}
+
+# Header signatures for content-based detection. An export is a candidate
+# when every 'required' token appears in some column name (case-insensitive);
+# the candidate whose known columns cover most of the header wins.
+EXPORT_SIGNATURES = {
+    'genesys_interactions': {
+        'required': ['total handle', 'conversation id'],
+        'columns': INTERACTIONS_COLUMNS,
+    },
+    'genesys_agent_performance': {
+        'required': ['avg handle', 'agent name', 'handle'],
+        'columns': AGENT_PERF_COLUMNS,
+    },
+    'genesys_agent_status': {
+        'required': ['logged in', 'on queue', 'occupancy'],
+        'columns': AGENT_STATUS_COLUMNS,
+    },
+    'genesys_skills_performance': {
+        'required': ['skill name', 'queue name'],
+        'columns': SKILLS_PERF_COLUMNS,
+    },
+    'genesys_adherence': {
+        'required': ['adherence', 'conformance'],
+        'columns': ADHERENCE_COLUMNS,
+    },
+    'wfm_scheduled': {
+        'required': ['required staff', 'scheduled'],
+        'columns': WFM_SCHEDULED_COLUMNS,
+    },
+    'wfm_activities': {
+        'required': ['activity code'],
+        'columns': WFM_ACTIVITIES_COLUMNS,
+    },
+    'agent_schedules': {
+        'required': ['planning groups', 'skills'],
+        'columns': AGENT_SCHEDULE_COLUMNS,
+    },
+}
+
 
 # =============================================================================
 # ISPN CALCULATION STANDARDS
@@ -171,12 +229,608 @@ ISPN_STANDARDS = {
     'acw_timeout_ms': 15000,           # Standard ACW timeout (confirmed!)
 }
 
+# Interactions exports larger than this are parsed in chunks
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+INTERACTIONS_CHUNK_ROWS = 250_000
+
+
+# =============================================================================
+# EXPORT SCHEMAS (columns each parser reads, with declared dtypes)
+# =============================================================================
+
+# Kind -> pandas dtype. Millisecond durations and counts are nullable
+# integers (blank cells stay NA); 'text' columns are kept as strings so no
+# engine guesses dates or booleans out of them.
+SCHEMA_DTYPES = {
+    'ms': 'Int64',
+    'count': 'Int64',
+    'float': 'float64',
+    'category': 'category',
+    'text': str,
+}
+
+# Per-export column declarations, keyed by parser source name. Only these
+# columns are read; everything else in the export is skipped at the reader.
+EXPORT_SCHEMAS = {
+    'genesys_interactions': {
+        'ms': [INTERACTIONS_COLUMNS[k] for k in (
+            'total_queue', 'total_alert', 'total_talk', 'total_hold', 'total_acw', 'total_handle')],
+        'category': [INTERACTIONS_COLUMNS[k] for k in (
+            'direction', 'media_type', 'abandoned', 'non_acd', 'queue')],
+        'text': [INTERACTIONS_COLUMNS[k] for k in ('agent', 'date')],
+    },
+    'genesys_agent_performance': {
+        'ms': [AGENT_PERF_COLUMNS[k] for k in ('total_handle', 'total_talk', 'total_hold', 'total_acw')],
+        'count': [AGENT_PERF_COLUMNS['handle_count']],
+        # Averages can carry fractional milliseconds
+        'float': [AGENT_PERF_COLUMNS[k] for k in ('avg_handle', 'avg_talk', 'avg_hold', 'avg_acw', 'asa')],
+        'text': [AGENT_PERF_COLUMNS[k] for k in ('agent_name', 'title', 'department')],
+    },
+    'genesys_agent_status': {
+        'ms': [AGENT_STATUS_COLUMNS[k] for k in (
+            'logged_in', 'on_queue', 'idle', 'available', 'away', 'break', 'meal',
+            'not_responding', 'off_queue', 'interacting')] + ['Training'],
+        'float': [AGENT_STATUS_COLUMNS[k] for k in ('on_queue_pct', 'occupancy', 'idle_pct')],
+        'text': [AGENT_STATUS_COLUMNS[k] for k in (
+            'interval_start', 'interval_end', 'agent_id', 'agent_name', 'title', 'department')],
+    },
+    'genesys_skills_performance': {
+        'count': [SKILLS_PERF_COLUMNS[k] for k in ('offer', 'answer', 'abandon')],
+        'float': [SKILLS_PERF_COLUMNS[k] for k in ('asa', 'avg_handle', 'avg_talk', 'avg_hold', 'avg_acw')],
+        'category': [SKILLS_PERF_COLUMNS[k] for k in ('aggregate_detail', 'queue_name')],
+    },
+    'genesys_adherence': {
+        'count': [ADHERENCE_COLUMNS['exceptions']],
+        # Minutes, often fractional
+        'float': [ADHERENCE_COLUMNS[k] for k in ('scheduled_minutes', 'work_time_on_queue')],
+        'text': [ADHERENCE_COLUMNS[k] for k in ('agent', 'adherence_pct', 'conformance_pct')]
+                + ADHERENCE_DATE_COLUMNS,
+    },
+    'wfm_scheduled_required': {
+        'float': [WFM_SCHEDULED_COLUMNS[k] for k in (
+            'scheduled', 'required', 'difference', 'required_shrinkage', 'diff_shrinkage')],
+        'text': [WFM_SCHEDULED_COLUMNS[k] for k in ('time_utc', 'time_local')],
+    },
+    'wfm_activities': {
+        'float': [WFM_ACTIVITIES_COLUMNS['length_minutes']],
+        'category': [WFM_ACTIVITIES_COLUMNS[k] for k in ('agent_name', 'activity_code')],
+    },
+    'agent_schedules': {
+        'text': list(AGENT_SCHEDULE_COLUMNS.values()),
+    },
+}
+
+# Fastest reader available: pyarrow's multithreaded parser when installed.
+# Chunked reads always use the C engine (pyarrow cannot stream chunks).
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') else 'c'
+
+
+def _clean_column(name: str) -> str:
+    """Header name without BOM, quotes or padding (as some exports write them)."""
+    return name.strip().replace('\ufeff', '').replace('"', '')
+
+
+def _export_read_args(header: List[str], source: str) -> Tuple[List[str], dict]:
+    """usecols and dtype for an export, matched against its actual header."""
+    kinds = {
+        name: kind
+        for kind, names in EXPORT_SCHEMAS[source].items()
+        for name in names
+    }
+    usecols = [c for c in header if _clean_column(c) in kinds]
+    dtype = {c: SCHEMA_DTYPES[kinds[_clean_column(c)]] for c in usecols}
+    return usecols, dtype
+
+
+def _coerce_export(df: pd.DataFrame, dtype: dict) -> pd.DataFrame:
+    """
+    Fallback typing for exports whose cells don't fit the declared dtypes
+    (stray text or decimals in a millisecond column): numerics are coerced
+    as the parsers always did, bad cells becoming NaN.
+    """
+    for col, kind in dtype.items():
+        if kind == 'category':
+            df[col] = df[col].astype('category')
+        elif kind is not str:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df
+
+
+def _header_or_sniff(filepath: Path, header: 'CsvHeader' = None) -> Tuple[List[str], dict]:
+    """Header columns and read_csv dialect args, sniffing only if not given."""
+    header = header or sniff_header(filepath)
+    if header is None:
+        return pd.read_csv(filepath, nrows=0).columns.tolist(), {}
+    return header.columns, header.read_csv_args()
+
+
+def read_export(filepath: Path, source: str, prune: bool = True,
+                header: 'CsvHeader' = None, frame: pd.DataFrame = None) -> Tuple[pd.DataFrame, List[str]]:
+    """
+    Read a Genesys export using its schema: only the declared columns,
+    already typed, through the fastest available engine.
+    
+    Args:
+        filepath: Export CSV
+        source: EXPORT_SCHEMAS key
+        prune: False reads every column (declared ones typed, the rest
+               inferred by the C engine as a plain read_csv would)
+        header: Result of sniff_header() if the caller already has it
+        frame: The file's full typed frame (an earlier prune=False read);
+               the declared columns are taken from it instead of the file
+    
+    Returns:
+        (frame, full header) - the header lists every column in the file,
+        including those that were not read.
+    """
+    columns, read_args = _header_or_sniff(filepath, header)
+    usecols, dtype = _export_read_args(columns, source)
+    if frame is not None:
+        return (frame[usecols] if prune else frame), columns
+    engine = CSV_ENGINE if prune else 'c'
+    select = usecols if prune else None
+    try:
+        df = pd.read_csv(filepath, usecols=select, dtype=dtype, engine=engine, **read_args)
+    except (ValueError, TypeError):
+        df = _coerce_export(pd.read_csv(filepath, usecols=select, **read_args), dtype)
+    
+    # Engines differ in category order; keep it lexical so groupby output
+    # comes back in the same order as it did for plain string columns
+    for col, kind in dtype.items():
+        if kind == 'category':
+            df[col] = df[col].cat.set_categories(sorted(df[col].cat.categories))
+    return (df[usecols] if prune else df), columns
+
+
+def iter_export(filepath: Path, source: str, chunksize: int,
+                header: 'CsvHeader' = None) -> Tuple[Iterator[pd.DataFrame], List[str]]:
+    """
+    Chunked read_export(). If a chunk doesn't fit the declared dtypes, the
+    rest of the file is re-read from that row with fallback typing.
+    """
+    columns, read_args = _header_or_sniff(filepath, header)
+    usecols, dtype = _export_read_args(columns, source)
+    
+    def chunks():
+        consumed = 0
+        try:
+            for chunk in pd.read_csv(filepath, usecols=usecols, dtype=dtype,
+                                     chunksize=chunksize, **read_args):
+                consumed += len(chunk)
+                yield chunk[usecols]
+        except (ValueError, TypeError):
+            for chunk in pd.read_csv(filepath, usecols=usecols, chunksize=chunksize,
+                                     skiprows=range(1, consumed + 1), **read_args):
+                yield _coerce_export(chunk, dtype)[usecols]
+    
+    return chunks(), columns
+
+
+# =============================================================================
+# HEADER SNIFFING
+# =============================================================================
+
+# Bytes of the first line handed to csv.Sniffer, and delimiters it may pick
+SNIFF_BYTES = 64 * 1024
+SNIFF_DELIMITERS = ',;\t|'
+
+
+@dataclass(frozen=True)
+class CsvHeader:
+    """First row of a CSV export and the dialect it is written in."""
+    columns: List[str]
+    delimiter: str = ','
+    quotechar: str = '"'
+    encoding: str = 'utf-8-sig'     # also reads BOM-less UTF-8
+    
+    def read_csv_args(self) -> dict:
+        """Dialect keyword arguments for pd.read_csv."""
+        return {'sep': self.delimiter, 'quotechar': self.quotechar, 'encoding': self.encoding}
+
+
+def sniff_header(filepath: Path) -> Optional[CsvHeader]:
+    """
+    Read just the header row of a CSV with the csv module.
+    
+    Strips a UTF-8 BOM, honours quoted names (including embedded delimiters
+    and newlines) and detects the delimiter from the first line.
+    
+    Returns:
+        CsvHeader, or None if the file is empty or not readable as UTF-8 text
+    """
+    try:
+        with open(filepath, 'r', encoding='utf-8-sig', newline='') as f:
+            first = f.readline(SNIFF_BYTES)
+            try:
+                dialect = csv.Sniffer().sniff(first, delimiters=SNIFF_DELIMITERS)
+                delimiter, quotechar = dialect.delimiter, dialect.quotechar or '"'
+            except csv.Error:
+                delimiter, quotechar = ',', '"'
+            f.seek(0)
+            columns = next(csv.reader(f, delimiter=delimiter, quotechar=quotechar))
+    except (OSError, UnicodeDecodeError, StopIteration, csv.Error):
+        return None
+    return CsvHeader(columns, delimiter, quotechar)
+
+
+def signature_score(columns: List[str], file_type: str) -> float:
+    """
+    How well a header matches an export signature.
+    
+    Returns:
+        0.0 if a required token is missing, otherwise the share of the
+        signature's known columns present in the header (0 < score <= 1)
+    """
+    signature = EXPORT_SIGNATURES[file_type]
+    lowered = [_clean_column(c).lower() for c in columns]
+    if not all(any(token in c for c in lowered) for token in signature['required']):
+        return 0.0
+    known = {c.lower() for c in signature['columns'].values()}
+    return max(len(known.intersection(lowered)) / len(known), 1e-6)
+
+
+def match_signature(columns: List[str]) -> Optional[str]:
+    """Best-scoring export type for a header, or None if nothing matches."""
+    scores = {file_type: signature_score(columns, file_type) for file_type in EXPORT_SIGNATURES}
+    best = max(scores, key=scores.get)
+    return best if scores[best] > 0 else None
+
+
+# =============================================================================
+# REPORTING PERIOD HELPERS
+# =============================================================================
+
+# Genesys Performance exports write dates as "1/1/26 9:00 AM"
+GENESYS_DATE_FORMAT = '%m/%d/%y %I:%M %p'
+
+
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """
+    Parse a date column in one vectorized pass.
+    
+    Tries the Genesys export format first and falls back to per-element
+    inference (ISO timestamps, other locales) only if nothing matched.
+    """
+    dates = pd.to_datetime(series, format=GENESYS_DATE_FORMAT, errors='coerce')
+    if dates.isna().all() and series.notna().any():
+        dates = pd.to_datetime(series, format='mixed', errors='coerce')
+    return dates
+
+
+def _period_keys(series: pd.Series) -> pd.Series:
+    """
+    Map a date column to reporting periods (YYYY-MM).
+    
+    Rows with unparseable dates map to NaN and are dropped by groupby.
+    """
+    return _month_keys(_parse_dates(series))
+
+
+def _month_keys(dates: pd.Series) -> pd.Series:
+    """Map parsed dates to reporting periods (YYYY-MM); NaT maps to NaN."""
+    keys = dates.dt.year * 100 + dates.dt.month
+    labels = {k: f"{int(k) // 100:04d}-{int(k) % 100:02d}" for k in keys.dropna().unique()}
+    return keys.map(labels)
+
+
+def _week_keys(dates: pd.Series) -> pd.Series:
+    """Map parsed dates to ISO weeks (YYYY-Www); NaT maps to NaN."""
+    iso = dates.dt.isocalendar()
+    keys = iso['year'] * 100 + iso['week']
+    labels = {k: f"{int(k) // 100:04d}-W{int(k) % 100:02d}" for k in keys.dropna().unique()}
+    return keys.map(labels).astype(object)
+
+
+# Finest stored grain: raw totals per 15-minute interval (see store.py raw_intervals)
+INTERVAL_FREQ = '15min'
+INTERVAL_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def _sum_by_interval(frame: pd.DataFrame, dates: pd.Series) -> pd.DataFrame:
+    """Sum every column of frame per 15-minute interval (index = interval start)."""
+    return frame.groupby(dates.dt.floor(INTERVAL_FREQ)).sum()
+
+
+def _span_slots(starts: pd.Series, ends: pd.Series, freq: str) -> Tuple[pd.Series, pd.Series]:
+    """
+    First slot and slot count of each [start, end) row at the given grain.
+    
+    Rows without a usable end (missing, or not after start) cover one slot.
+    """
+    first = starts.dt.floor(freq)
+    slots = np.ceil((ends - first) / pd.Timedelta(freq))
+    slots = slots.where(slots >= 1, 1).fillna(1).astype('int64')
+    return first, slots
+
+
+def _spread_by_interval(frame: pd.DataFrame, starts: pd.Series, ends: pd.Series) -> pd.DataFrame:
+    """
+    Sum every column of frame per 15-minute interval, spreading each row's
+    totals evenly over the intervals between its start and end.
+    
+    Agent Status exports are often summarized per day or per month; putting
+    a whole month in its first interval would make every week-level range
+    wrong. Rows sharing a span are summed before expanding, so a monthly
+    export costs one expansion per month, not one per agent.
+    """
+    first, slots = _span_slots(starts, ends, INTERVAL_FREQ)
+    spans = frame.groupby([first, slots]).sum()
+    if spans.empty:
+        return spans.droplevel(1)
+    lengths = spans.index.get_level_values(1).to_numpy()
+    rows = np.repeat(np.arange(len(spans)), lengths)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    index = (spans.index.get_level_values(0)[rows] +
+             pd.to_timedelta(offsets * pd.Timedelta(INTERVAL_FREQ).value, unit='ns'))
+    # Whole units per slot that add back up to each row's exact total
+    totals, n, k = spans.to_numpy(dtype='float64')[rows], lengths[rows, None], offsets[:, None]
+    values = np.round(totals * (k + 1) / n) - np.round(totals * k / n)
+    return pd.DataFrame(values, index=index, columns=spans.columns).groupby(level=0).sum()
+
+
+def _intervals_columnar(sums: pd.DataFrame) -> dict:
+    """
+    Interval sums as compact columns:
+    {'start': ['2025-01-06 08:00', ...], field: [int, ...], ...}.
+    """
+    sums = sums.sort_index()
+    columns = {'start': [ts.strftime(INTERVAL_FORMAT) for ts in sums.index]}
+    for col in sums.columns:
+        columns[col] = sums[col].round().astype('int64').tolist()
+    return columns
+
+
+def _sum_by_period(frame: pd.DataFrame, periods: pd.Series) -> dict:
+    """Sum every column of frame per period -> {period: {column: int}}."""
+    sums = frame.groupby(periods).sum()
+    return {
+        period: {col: int(round(value)) for col, value in row.items()}
+        for period, row in zip(sums.index, sums.to_dict('records'))
+    }
+
 
 # =============================================================================
 # PARSER FUNCTIONS
 # =============================================================================
 
-def parse_interactions(filepath: Path) -> dict:
+class InteractionsAccumulator:
+    """
+    Mergeable partial aggregates for the Interactions export.
+    
+    Holds only counts, millisecond sums, per-queue/per-agent/per-period
+    sums and quantile sketches, so an export can be fed in fixed-size chunks
+    (or several exports merged) and result() produces the same dict either
+    way. Memory is bounded by the number of queues, agents, periods and
+    15-minute intervals, not by the row count.
+    """
+    
+    TIME_COLS = ['Total Handle', 'Total Talk', 'Total Hold', 'Total ACW', 'Total Queue', 'Total Alert']
+    EXPECTED = ['Total Handle', 'Total Talk', 'Total Hold', 'Total ACW',
+                'Total Queue', 'Direction', 'Media Type', 'Abandoned', 'Non-ACD']
+    
+    def __init__(self):
+        self.columns = None
+        self.counts = dict.fromkeys([
+            'total', 'inbound', 'acd', 'valid', 'answered', 'callbacks',
+            'abandoned', 'valid_abandons', 'acw_timeout'], 0)
+        # [sum, non-null count] pairs, mirroring Series.mean() NaN handling
+        self.sums = {k: [0.0, 0] for k in [
+            'handle', 'talk', 'hold', 'acw', 'answered_queue', 'abandoned_queue']}
+        self.max_handle = None
+        self.handle_sketch = QuantileSketch()
+        self.by_queue = {}      # queue -> [handle count, handle sum, queue count, queue sum]
+        self.by_agent = {}      # agent -> [handle count, handle sum]
+        self.periods = {}       # period -> raw ISPN sums
+        self.intervals = None   # running raw ISPN sums by 15-minute interval
+        self.sketches = {}      # period -> metric -> dimension -> key -> QuantileSketch
+    
+    @staticmethod
+    def _sum(target: list, series: pd.Series):
+        target[0] += float(series.sum())
+        target[1] += int(series.count())
+    
+    def add(self, df: pd.DataFrame):
+        """Fold one chunk of the export into the running aggregates."""
+        if self.columns is None:
+            self.columns = df.columns.tolist()
+        
+        # Convert time columns to numeric (handle empty strings)
+        for col in self.TIME_COLS:
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # Filter: Inbound only, exclude Non-ACD
+        inbound = df['Direction'] == 'Inbound' if 'Direction' in df.columns else pd.Series(True, index=df.index)
+        acd = inbound & (df['Non-ACD'] != 'YES') if 'Non-ACD' in df.columns else inbound
+        
+        # Apply ISPN standards: exclude < 20 second handles
+        valid = acd & (df['Total Handle'] >= ISPN_STANDARDS['aht_min_threshold_ms'])
+        
+        c = self.counts
+        c['total'] += len(df)
+        c['inbound'] += int(inbound.sum())
+        c['acd'] += int(acd.sum())
+        c['valid'] += int(valid.sum())
+        
+        handle = df['Total Handle'][valid]
+        self._sum(self.sums['handle'], handle)
+        self._sum(self.sums['talk'], df['Total Talk'][valid])
+        self._sum(self.sums['hold'], df['Total Hold'][valid])
+        self._sum(self.sums['acw'], df['Total ACW'][valid])
+        if len(handle) > 0:
+            chunk_max = float(handle.max())
+            self.max_handle = chunk_max if self.max_handle is None else max(self.max_handle, chunk_max)
+            self.handle_sketch.add(handle)
+        
+        # AWT inputs (only answered calls)
+        if 'Abandoned' in df.columns:
+            answered = acd & (df['Abandoned'] == 'NO')
+            c['answered'] += int(answered.sum())
+            if 'Total Queue' in df.columns:
+                self._sum(self.sums['answered_queue'], df['Total Queue'][answered])
+        
+        # Callback identification (Media Type = "callback")
+        if 'Media Type' in df.columns:
+            c['callbacks'] += int((df['Media Type'].str.lower() == 'callback').sum())
+        
+        # Abandon inputs (queue time >= 60 seconds per ISPN standard)
+        if 'Abandoned' in df.columns and 'Total Queue' in df.columns:
+            abandoned = acd & (df['Abandoned'] == 'YES')
+            c['abandoned'] += int(abandoned.sum())
+            c['valid_abandons'] += int((abandoned & (df['Total Queue'] >= ISPN_STANDARDS['abandon_threshold_ms'])).sum())
+            self._sum(self.sums['abandoned_queue'], df['Total Queue'][abandoned])
+        
+        # By Queue partial sums
+        if 'Queue' in df.columns:
+            df_acd = df[acd]
+            queue_stats = df_acd.groupby('Queue', observed=True).agg(
+                handle_count=('Total Handle', 'count'),
+                handle_sum=('Total Handle', 'sum'),
+                wait_count=('Total Queue', 'count'),
+                wait_sum=('Total Queue', 'sum'),
+            )
+            for queue, row in zip(queue_stats.index, queue_stats.itertuples(index=False)):
+                acc = self.by_queue.setdefault(queue, [0, 0.0, 0, 0.0])
+                acc[0] += int(row.handle_count)
+                acc[1] += float(row.handle_sum)
+                acc[2] += int(row.wait_count)
+                acc[3] += float(row.wait_sum)
+        
+        # By Agent partial sums
+        if 'Users - Interacted' in df.columns:
+            agent_stats = df[valid].groupby('Users - Interacted', observed=True)['Total Handle'].agg(['count', 'sum'])
+            for agent, count, total in zip(agent_stats.index, agent_stats['count'], agent_stats['sum']):
+                acc = self.by_agent.setdefault(agent, [0, 0.0])
+                acc[0] += int(count)
+                acc[1] += float(total)
+        
+        # ACW timeout inputs
+        if 'Total ACW' in df.columns:
+            c['acw_timeout'] += int((valid & (df['Total ACW'] == ISPN_STANDARDS['acw_timeout_ms'])).sum())
+        
+        # Raw ISPN inputs per reporting period
+        if 'Date' in df.columns:
+            dates = _parse_dates(df['Date'])
+            parts = _interactions_raw_parts(df)
+            sums = _sum_by_interval(parts, dates)
+            self.intervals = sums if self.intervals is None else self.intervals.add(sums, fill_value=0)
+            periods = _month_keys(dates)
+            for period, raw in _sum_by_period(parts, periods).items():
+                target = self.periods.setdefault(period, dict.fromkeys(raw, 0))
+                for key, value in raw.items():
+                    target[key] += value
+            for period, metrics in _interactions_sketches_by_period(df, dates, periods).items():
+                for metric, dimensions in metrics.items():
+                    for dimension, keyed in dimensions.items():
+                        for key, sketch in keyed.items():
+                            target = (self.sketches.setdefault(period, {})
+                                      .setdefault(metric, {})
+                                      .setdefault(dimension, {}))
+                            if key in target:
+                                target[key].merge(sketch)
+                            else:
+                                target[key] = sketch
+    
+    def result(self, filepath: Path) -> dict:
+        """Build the parse_interactions output dict from the aggregates."""
+        columns = self.columns or []
+        c = self.counts
+        
+        def mean(key):
+            total, n = self.sums[key]
+            return total / n if n > 0 else float('nan')
+        
+        result = {
+            'source': 'genesys_interactions',
+            'filepath': str(filepath),
+            'parsed_at': datetime.now().isoformat(),
+            'record_count': c['total'],
+            'columns': columns,
+            'field_validation': {col: col in columns for col in self.EXPECTED},
+            'metrics': {},
+            'callbacks': {},
+            'by_queue': {},
+            'by_agent': {},
+        }
+        
+        result['total_count'] = c['total']
+        result['inbound_count'] = c['inbound']
+        result['acd_count'] = c['acd']
+        result['valid_handle_count'] = c['valid']
+        
+        metrics = result['metrics']
+        if c['valid'] > 0:
+            # Core metrics (convert ms to minutes/seconds)
+            metrics['avg_handle_time_min'] = mean('handle') / 60000
+            metrics['avg_talk_time_min'] = mean('talk') / 60000
+            metrics['avg_hold_time_min'] = mean('hold') / 60000
+            metrics['avg_acw_time_sec'] = mean('acw') / 1000
+            
+            # AWT calculation (only answered calls)
+            if c['answered'] > 0 and 'Total Queue' in columns:
+                metrics['avg_wait_time_sec'] = mean('answered_queue') / 1000
+                metrics['answer_count'] = c['answered']
+            
+            # Handle distribution (sketch estimates; exact for small exports)
+            metrics['p50_handle_min'] = self.handle_sketch.quantile(0.5) / 60000
+            metrics['p90_handle_min'] = self.handle_sketch.quantile(0.9) / 60000
+            metrics['p99_handle_min'] = self.handle_sketch.quantile(0.99) / 60000
+            metrics['max_handle_min'] = self.max_handle / 60000
+        
+        if 'Media Type' in columns:
+            result['callbacks']['count'] = c['callbacks']
+            result['callbacks']['pct_of_total'] = (c['callbacks'] / c['total'] * 100) if c['total'] > 0 else 0
+        
+        if 'Abandoned' in columns and 'Total Queue' in columns:
+            metrics['abandon_count'] = c['valid_abandons']
+            metrics['abandon_count_total'] = c['abandoned']
+            metrics['abandon_rate'] = (c['valid_abandons'] / c['acd'] * 100) if c['acd'] > 0 else 0
+            
+            # Abandon timing distribution
+            if c['abandoned'] > 0:
+                metrics['avg_abandon_wait_sec'] = mean('abandoned_queue') / 1000
+        
+        for queue in sorted(self.by_queue):
+            handle_count, handle_sum, wait_count, wait_sum = self.by_queue[queue]
+            if pd.notna(queue) and queue:
+                result['by_queue'][queue] = {
+                    'call_count': handle_count,
+                    'avg_handle_min': handle_sum / handle_count / 60000 if handle_count > 0 else None,
+                    'avg_wait_sec': wait_sum / wait_count / 1000 if wait_count > 0 else None,
+                }
+        
+        for agent in sorted(self.by_agent):
+            count, total = self.by_agent[agent]
+            if pd.notna(agent) and agent:
+                result['by_agent'][agent] = {
+                    'call_count': count,
+                    'avg_handle_min': total / count / 60000 if count > 0 else None,
+                }
+        
+        if 'Total ACW' in columns:
+            metrics['acw_timeout_count'] = c['acw_timeout']
+            metrics['acw_timeout_pct'] = (c['acw_timeout'] / c['valid'] * 100) if c['valid'] > 0 else 0
+        
+        if 'Date' in columns:
+            result['periods'] = dict(sorted(self.periods.items()))
+            if self.intervals is not None:
+                result['intervals'] = _intervals_columnar(self.intervals)
+            result['sketches'] = {
+                period: {
+                    metric: {
+                        dimension: {key: keyed[key].to_dict() for key in sorted(keyed)}
+                        for dimension, keyed in dimensions.items()
+                    }
+                    for metric, dimensions in metrics_.items()
+                }
+                for period, metrics_ in sorted(self.sketches.items())
+            }
+        
+        return result
+
+
+def parse_interactions(filepath: Path, chunksize: int = None, header: CsvHeader = None,
+                       frame: pd.DataFrame = None) -> dict:
     """
     Parse Genesys Cloud Interactions export CSV.
     
@@ -189,136 +843,153 @@ def parse_interactions(filepath: Path) -> dict:
     - Abandoned: YES/NO
     - Non-ACD: YES = exclude from queue metrics
     - Media Type: voice, callback
+    - Date: call start; raw ISPN totals are split by calendar month into
+      result['periods'] so multi-month exports bucket correctly
+    
+    Args:
+        filepath: Export CSV
+        chunksize: Rows per chunk. None streams automatically for files over
+                   STREAMING_THRESHOLD_BYTES; 0 forces a single full read.
+                   The output dict is the same either way, apart from
+                   sketch-estimated percentiles (within sketch error).
+        header: Result of sniff_header() if the caller already has it
+        frame: Full typed frame if the caller already read the file
+               (read_export(..., prune=False)); no chunking then
     """
-    df = pd.read_csv(filepath)
-    
-    result = {
-        'source': 'genesys_interactions',
-        'filepath': str(filepath),
-        'parsed_at': datetime.now().isoformat(),
-        'record_count': len(df),
-        'columns': df.columns.tolist(),
-        'field_validation': {},
-        'metrics': {},
-        'callbacks': {},
-        'by_queue': {},
-        'by_agent': {},
-    }
-    
-    # Validate expected columns
-    expected = ['Total Handle', 'Total Talk', 'Total Hold', 'Total ACW', 
-                'Total Queue', 'Direction', 'Media Type', 'Abandoned', 'Non-ACD']
-    for col in expected:
-        result['field_validation'][col] = col in df.columns
-    
-    # Convert time columns to numeric (handle empty strings)
-    time_cols = ['Total Handle', 'Total Talk', 'Total Hold', 'Total ACW', 'Total Queue', 'Total Alert']
-    for col in time_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    if frame is not None:
+        chunksize = 0
+    elif chunksize is None:
+        chunksize = INTERACTIONS_CHUNK_ROWS if Path(filepath).stat().st_size > STREAMING_THRESHOLD_BYTES else 0
+    
+    acc = InteractionsAccumulator()
+    if chunksize:
+        chunks, acc.columns = iter_export(filepath, 'genesys_interactions', chunksize, header)
+        for chunk in chunks:
+            acc.add(chunk)
+    else:
+        df, acc.columns = read_export(filepath, 'genesys_interactions', header=header, frame=frame)
+        acc.add(df)
     
-    # Filter: Inbound only, exclude Non-ACD
-    df_inbound = df[df['Direction'] == 'Inbound'].copy() if 'Direction' in df.columns else df.copy()
-    df_acd = df_inbound[df_inbound['Non-ACD'] != 'YES'].copy() if 'Non-ACD' in df.columns else df_inbound.copy()
+    return acc.result(filepath)
+
+
+def _interactions_raw_parts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Raw ISPN inputs from an Interactions frame, one row per interaction
+    (flags and ms), ready to be summed by month or by 15-minute interval.
     
-    result['total_count'] = len(df)
-    result['inbound_count'] = len(df_inbound)
-    result['acd_count'] = len(df_acd)
+    Field names match GenesysRawData. Inbound counts use the same filters
+    as parse_interactions (Inbound, Non-ACD excluded, handle >= 20s);
+    abandons only count after 60 seconds in queue.
+    """
+    def col(name):
+        if name in df.columns:
+            return df[name]
+        return pd.Series(float('nan'), index=df.index)
+    
+    direction = col('Direction')
+    media = col('Media Type').astype('string').str.lower()
+    handle = col('Total Handle')
+    queue = col('Total Queue')
+    
+    acd = (direction == 'Inbound') & (col('Non-ACD') != 'YES')
+    valid = acd & (handle >= ISPN_STANDARDS['aht_min_threshold_ms'])
+    abandoned = acd & (col('Abandoned') == 'YES') & (queue >= ISPN_STANDARDS['abandon_threshold_ms'])
+    outbound = (direction == 'Outbound') & (media == 'voice').fillna(False)
+    callback = (media == 'callback').fillna(False)
+    
+    return pd.DataFrame({
+        'inbound_call_count': valid,
+        'inbound_total_handle_ms': handle.where(valid, 0),
+        'inbound_total_talk_ms': col('Total Talk').where(valid, 0),
+        'inbound_total_hold_ms': col('Total Hold').where(valid, 0),
+        'inbound_total_acw_ms': col('Total ACW').where(valid, 0),
+        'inbound_total_queue_ms': queue.where(valid, 0),
+        'abandoned_call_count': abandoned,
+        'answered_under_30s': valid & (queue < 30000),
+        'answered_under_60s': valid & (queue < 60000),
+        'answered_under_90s': valid & (queue < 90000),
+        'answered_under_120s': valid & (queue < 120000),
+        'outbound_call_count': outbound,
+        'outbound_total_handle_ms': handle.where(outbound, 0),
+        'callback_call_count': callback,
+        'callback_total_handle_ms': handle.where(callback, 0),
+    })
+
+
+# Percentile sketches kept per period: metric -> the rows that feed it
+SKETCH_DIMENSIONS = ('all', 'queue', 'agent', 'week')
+
+
+def _interactions_sketches_by_period(df: pd.DataFrame, dates: pd.Series, periods: pd.Series) -> dict:
+    """
+    Quantile sketches of handle and wait time, split by month of 'Date'.
     
-    # Apply ISPN standards: exclude < 20 second handles
-    df_valid = df_acd[df_acd['Total Handle'] >= ISPN_STANDARDS['aht_min_threshold_ms']].copy()
-    result['valid_handle_count'] = len(df_valid)
+    handle_ms covers the same rows as inbound_call_count (Inbound, Non-ACD
+    excluded, handle >= 20s); queue_ms covers answered ACD calls, as the
+    avg_wait_time_sec metric does. Each metric is sketched overall ('all'),
+    per Queue, per agent and per ISO week, so percentiles for any of those
+    slices (or any set of periods) come from merging stored sketches.
     
-    if len(df_valid) > 0:
-        # Core metrics (convert ms to minutes/seconds)
-        result['metrics']['avg_handle_time_min'] = df_valid['Total Handle'].mean() / 60000
-        result['metrics']['avg_talk_time_min'] = df_valid['Total Talk'].mean() / 60000
-        result['metrics']['avg_hold_time_min'] = df_valid['Total Hold'].mean() / 60000
-        result['metrics']['avg_acw_time_sec'] = df_valid['Total ACW'].mean() / 1000
-        
-        # AWT calculation (only answered calls)
-        answered = df_acd[df_acd['Abandoned'] == 'NO']
-        if len(answered) > 0 and 'Total Queue' in df.columns:
-            result['metrics']['avg_wait_time_sec'] = answered['Total Queue'].mean() / 1000
-            result['metrics']['answer_count'] = len(answered)
-        
-        # Handle distribution
-        result['metrics']['p50_handle_min'] = df_valid['Total Handle'].median() / 60000
-        result['metrics']['p90_handle_min'] = df_valid['Total Handle'].quantile(0.9) / 60000
-        result['metrics']['max_handle_min'] = df_valid['Total Handle'].max() / 60000
-    
-    # Callback identification (Media Type = "callback")
-    if 'Media Type' in df.columns:
-        callbacks = df[df['Media Type'].str.lower() == 'callback']
-        result['callbacks']['count'] = len(callbacks)
-        result['callbacks']['pct_of_total'] = (len(callbacks) / len(df) * 100) if len(df) > 0 else 0
-    
-    # Abandon analysis (queue time >= 60 seconds per ISPN standard)
-    if 'Abandoned' in df.columns and 'Total Queue' in df.columns:
-        abandoned = df_acd[df_acd['Abandoned'] == 'YES']
-        valid_abandons = abandoned[abandoned['Total Queue'] >= ISPN_STANDARDS['abandon_threshold_ms']]
-        result['metrics']['abandon_count'] = len(valid_abandons)
-        result['metrics']['abandon_count_total'] = len(abandoned)
-        result['metrics']['abandon_rate'] = (len(valid_abandons) / len(df_acd) * 100) if len(df_acd) > 0 else 0
-        
-        # Abandon timing distribution
-        if len(abandoned) > 0:
-            result['metrics']['avg_abandon_wait_sec'] = abandoned['Total Queue'].mean() / 1000
-    
-    # By Queue breakdown
-    if 'Queue' in df.columns:
-        queue_stats = df_acd.groupby('Queue').agg({
-            'Total Handle': ['count', 'mean'],
-            'Total Queue': 'mean',
-        }).reset_index()
-        queue_stats.columns = ['queue', 'call_count', 'avg_handle_ms', 'avg_wait_ms']
-        
-        for _, row in queue_stats.iterrows():
-            if pd.notna(row['queue']) and row['queue']:
-                result['by_queue'][row['queue']] = {
-                    'call_count': int(row['call_count']),
-                    'avg_handle_min': row['avg_handle_ms'] / 60000 if pd.notna(row['avg_handle_ms']) else None,
-                    'avg_wait_sec': row['avg_wait_ms'] / 1000 if pd.notna(row['avg_wait_ms']) else None,
-                }
+    Args:
+        df: Interactions chunk
+        dates, periods: Its parsed 'Date' column and month keys (_month_keys),
+                        as already computed by the caller
     
-    # By Agent breakdown
-    if 'Users - Interacted' in df.columns:
-        agent_stats = df_valid.groupby('Users - Interacted').agg({
-            'Total Handle': ['count', 'mean'],
-        }).reset_index()
-        agent_stats.columns = ['agent', 'call_count', 'avg_handle_ms']
-        
-        for _, row in agent_stats.iterrows():
-            if pd.notna(row['agent']) and row['agent']:
-                result['by_agent'][row['agent']] = {
-                    'call_count': int(row['call_count']),
-                    'avg_handle_min': row['avg_handle_ms'] / 60000 if pd.notna(row['avg_handle_ms']) else None,
-                }
+    Returns:
+        {period: {metric: {dimension: {key: QuantileSketch}}}}
+    """
+    acd = (df['Direction'] == 'Inbound') if 'Direction' in df.columns else pd.Series(True, index=df.index)
+    if 'Non-ACD' in df.columns:
+        acd &= df['Non-ACD'] != 'YES'
     
-    # ACW timeout analysis
-    if 'Total ACW' in df.columns:
-        acw_at_timeout = df_valid[df_valid['Total ACW'] == ISPN_STANDARDS['acw_timeout_ms']]
-        result['metrics']['acw_timeout_count'] = len(acw_at_timeout)
-        result['metrics']['acw_timeout_pct'] = (len(acw_at_timeout) / len(df_valid) * 100) if len(df_valid) > 0 else 0
+    selections = {
+        'handle_ms': ('Total Handle', acd & (df['Total Handle'] >= ISPN_STANDARDS['aht_min_threshold_ms'])),
+    }
+    if 'Total Queue' in df.columns and 'Abandoned' in df.columns:
+        selections['queue_ms'] = ('Total Queue', acd & (df['Abandoned'] == 'NO'))
+    
+    keys = {
+        'all': pd.Series('all', index=df.index, dtype=object),
+        'queue': df['Queue'] if 'Queue' in df.columns else None,
+        'agent': df['Users - Interacted'] if 'Users - Interacted' in df.columns else None,
+        'week': _week_keys(dates),
+    }
     
+    result = {}
+    for metric, (column, mask) in selections.items():
+        mask = mask & periods.notna() & df[column].notna()
+        if not mask.any():
+            continue
+        values = df[column][mask]
+        for dimension in SKETCH_DIMENSIONS:
+            if keys[dimension] is None:
+                continue
+            for (period, key), group in values.groupby([periods[mask], keys[dimension][mask]], observed=True):
+                if not key:
+                    continue
+                (result.setdefault(period, {})
+                       .setdefault(metric, {})
+                       .setdefault(dimension, {}))[key] = QuantileSketch.from_values(group)
     return result
 
 
-def parse_agent_performance(filepath: Path) -> dict:
+def parse_agent_performance(filepath: Path, header: CsvHeader = None,
+                            frame: pd.DataFrame = None) -> dict:
     """
     Parse Genesys Cloud Agent Performance Summary export.
     
     Export location: Performance → Workspace → Agents Performance
     Time values: milliseconds
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'genesys_agent_performance', header=header, frame=frame)
     
     result = {
         'source': 'genesys_agent_performance',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'agents': {},
         'totals': {},
     }
@@ -350,39 +1021,41 @@ def parse_agent_performance(filepath: Path) -> dict:
             result['totals']['avg_acw_sec'] = df['Total ACW'].sum() / df['Handle'].sum() / 1000
         
         # By agent
-        for _, row in df.iterrows():
-            agent = row['Agent Name']
-            if pd.notna(agent) and agent:
-                result['agents'][agent] = {
-                    'call_count': int(row['Handle']) if pd.notna(row['Handle']) else 0,
-                    'avg_handle_min': row['Avg Handle'] / 60000 if pd.notna(row['Avg Handle']) else None,
-                    'avg_talk_min': row['Avg Talk'] / 60000 if pd.notna(row['Avg Talk']) else None,
-                    'avg_hold_min': row['Avg Hold'] / 60000 if pd.notna(row['Avg Hold']) else None,
-                    'avg_acw_sec': row['Avg ACW'] / 1000 if pd.notna(row['Avg ACW']) else None,
-                    'asa_sec': row['ASA'] / 1000 if pd.notna(row['ASA']) else None,
-                    'title': row.get('Title', ''),
-                    'department': row.get('Department', ''),
-                }
+        result['agents'] = frame_to_dict(df, 'Agent Name', {
+            'call_count': Col('Handle', cast=int, missing=0),
+            'avg_handle_min': Col('Avg Handle', divisor=60000),
+            'avg_talk_min': Col('Avg Talk', divisor=60000),
+            'avg_hold_min': Col('Avg Hold', divisor=60000),
+            'avg_acw_sec': Col('Avg ACW', divisor=1000),
+            'asa_sec': Col('ASA', divisor=1000),
+            'title': Col('Title', missing=''),
+            'department': Col('Department', missing=''),
+        })
     
     return result
 
 
-def parse_agent_status(filepath: Path) -> dict:
+def parse_agent_status(filepath: Path, header: CsvHeader = None,
+                       frame: pd.DataFrame = None) -> dict:
     """
     Parse Genesys Cloud Agent Status Summary export.
     
     Export location: Performance → Contact Center → Agent Status Duration Details
     Time values: milliseconds
     Percentages: decimals (0.72 = 72%)
+    Raw ISPN totals, per-interval totals and agent days are spread over each
+    row's Interval Start..Interval End span, so daily or monthly summaries
+    add up correctly over any date range, and a row crossing a month boundary
+    is split between result['periods'] months in proportion to its time in each
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'genesys_agent_status', header=header, frame=frame)
     
     result = {
         'source': 'genesys_agent_status',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'agents': {},
         'totals': {},
         'shrinkage': {},
@@ -427,23 +1100,69 @@ def parse_agent_status(filepath: Path) -> dict:
             result['shrinkage']['on_queue_pct'] = (on_queue / total_logged) * 100
         
         # By agent
-        for _, row in df.iterrows():
-            agent = row['Agent Name']
-            if pd.notna(agent) and agent:
-                logged = row['Logged In'] if pd.notna(row['Logged In']) else 0
-                result['agents'][agent] = {
-                    'logged_in_hours': logged / 3600000 if logged else 0,
-                    'on_queue_pct': float(row['On Queue %']) * 100 if pd.notna(row.get('On Queue %')) else None,
-                    'occupancy_pct': float(row['Occupancy']) * 100 if pd.notna(row.get('Occupancy')) else None,
-                    'idle_pct': float(row['Idle %']) * 100 if pd.notna(row.get('Idle %')) else None,
-                    'title': row.get('Title', ''),
-                    'department': row.get('Department', ''),
-                }
+        result['agents'] = frame_to_dict(df, 'Agent Name', {
+            'logged_in_hours': Col('Logged In', divisor=3600000, missing=0, zero=0),
+            'on_queue_pct': Col('On Queue %', multiplier=100),
+            'occupancy_pct': Col('Occupancy', multiplier=100),
+            'idle_pct': Col('Idle %', multiplier=100),
+            'title': Col('Title', missing=''),
+            'department': Col('Department', missing=''),
+        })
+        
+        # Raw ISPN inputs per reporting period
+        if 'Interval Start' in df.columns:
+            dates = _parse_dates(df['Interval Start'])
+            ends = _parse_dates(df['Interval End']) if 'Interval End' in df.columns else dates
+            raw_cols = {
+                'total_logged_in_ms': 'Logged In',
+                'total_on_queue_ms': 'On Queue',
+                'total_interacting_ms': 'Interacting',
+                'total_idle_ms': 'Idle',
+                'total_available_ms': 'Available',
+                'total_away_ms': 'Away',
+                'total_break_ms': 'Break',
+                'total_meal_ms': 'Meal',
+                'total_not_responding_ms': 'Not Responding',
+            }
+            parts = pd.DataFrame({
+                raw: df[col] if col in df.columns else 0
+                for raw, col in raw_cols.items()
+            }, index=df.index)
+            
+            # Months are summed from the spread intervals, so a row that
+            # crosses a month boundary is split between the two months
+            intervals = _spread_by_interval(parts, dates, ends)
+            result['periods'] = _sum_by_period(intervals, _month_keys(intervals.index.to_series()))
+            result['intervals'] = _intervals_columnar(intervals)
+            
+            # Distinct agents per day, so any date range can count distinct agents
+            # (an agent on a monthly row counts on every day of that month)
+            agent_key = 'Agent Id' if 'Agent Id' in df.columns else 'Agent Name'
+            known = df[agent_key].notna()
+            first_day, days = _span_slots(dates[known], ends[known], '1D')
+            spans = df.loc[known, agent_key].astype(str).groupby([first_day, days]).unique()
+            agent_days = {}
+            for (day, count), ids in spans.items():
+                for offset in range(count):
+                    agent_days.setdefault(day + pd.Timedelta(days=offset), set()).update(ids)
+            result['agent_days'] = {
+                day.strftime('%Y-%m-%d'): sorted(ids) for day, ids in sorted(agent_days.items())
+            }
+            
+            # ... and per period; the ids let partial exports merge
+            agent_ids = {}
+            for day, ids in agent_days.items():
+                agent_ids.setdefault(day.strftime('%Y-%m'), set()).update(ids)
+            for period, raw in result['periods'].items():
+                ids = sorted(agent_ids.get(period, []))
+                raw['agent_count'] = len(ids)
+                raw['agent_ids'] = ids
     
     return result
 
 
-def parse_skills_performance(filepath: Path) -> dict:
+def parse_skills_performance(filepath: Path, header: CsvHeader = None,
+                             frame: pd.DataFrame = None) -> dict:
     """
     Parse Genesys Cloud Skills Performance export.
     
@@ -451,14 +1170,14 @@ def parse_skills_performance(filepath: Path) -> dict:
     Percentages: decimals (0.85 = 85%)
     Times: milliseconds
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'genesys_skills_performance', header=header, frame=frame)
     
     result = {
         'source': 'genesys_skills_performance',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'by_queue': {},
         'by_skill': {},
         'totals': {},
@@ -485,7 +1204,7 @@ def parse_skills_performance(filepath: Path) -> dict:
     
     # By Queue
     if 'Queue Name' in df_detail.columns:
-        queue_stats = df_detail.groupby('Queue Name').agg({
+        queue_stats = df_detail.groupby('Queue Name', observed=True).agg({
             'Offer': 'sum',
             'Answer': 'sum',
             'Abandon': 'sum',
@@ -493,36 +1212,36 @@ def parse_skills_performance(filepath: Path) -> dict:
             'Avg Handle': 'mean',
         }).reset_index()
         
-        for _, row in queue_stats.iterrows():
-            queue = row['Queue Name']
-            if pd.notna(queue) and queue:
-                result['by_queue'][queue] = {
-                    'offered': int(row['Offer']) if pd.notna(row['Offer']) else 0,
-                    'answered': int(row['Answer']) if pd.notna(row['Answer']) else 0,
-                    'abandoned': int(row['Abandon']) if pd.notna(row['Abandon']) else 0,
-                    'asa_sec': row['ASA'] / 1000 if pd.notna(row['ASA']) else None,
-                    'avg_handle_min': row['Avg Handle'] / 60000 if pd.notna(row['Avg Handle']) else None,
-                }
+        result['by_queue'] = frame_to_dict(queue_stats, 'Queue Name', {
+            'offered': Col('Offer', cast=int, missing=0),
+            'answered': Col('Answer', cast=int, missing=0),
+            'abandoned': Col('Abandon', cast=int, missing=0),
+            'asa_sec': Col('ASA', divisor=1000),
+            'avg_handle_min': Col('Avg Handle', divisor=60000),
+        })
     
     return result
 
 
-def parse_historical_adherence(filepath: Path) -> dict:
+def parse_historical_adherence(filepath: Path, header: CsvHeader = None,
+                               frame: pd.DataFrame = None) -> dict:
     """
     Parse Genesys WFM Historical Adherence export.
     
     Export location: WFM → Historical Adherence
     Time values: MINUTES (not milliseconds!)
     Percentages: strings with % sign (need parsing)
+    If the export carries a date column, averages are also split by month
+    into result['periods']; agent-level summaries without dates are not.
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'genesys_adherence', header=header, frame=frame)
     
     result = {
         'source': 'genesys_adherence',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'agents': {},
         'totals': {},
     }
@@ -560,35 +1279,49 @@ def parse_historical_adherence(filepath: Path) -> dict:
             result['totals']['total_work_hours'] = pd.to_numeric(df_valid['Work Time On Queue'], errors='coerce').sum() / 60
         
         # By agent
-        for _, row in df_valid.iterrows():
-            agent = row['Agent']
-            if pd.notna(agent) and agent:
-                result['agents'][agent] = {
-                    'adherence_pct': row['adherence_parsed'],
-                    'conformance_pct': row['conformance_parsed'],
-                    'exceptions': int(row['Exceptions']) if pd.notna(row.get('Exceptions')) else 0,
-                    'scheduled_hours': float(row['Scheduled Minutes']) / 60 if pd.notna(row.get('Scheduled Minutes')) else None,
-                }
+        result['agents'] = frame_to_dict(df_valid, 'Agent', {
+            'adherence_pct': Col('adherence_parsed'),
+            'conformance_pct': Col('conformance_parsed'),
+            'exceptions': Col('Exceptions', cast=int, missing=0),
+            'scheduled_hours': Col('Scheduled Minutes', divisor=60),
+        })
+        
+        # Raw ISPN inputs per reporting period
+        date_col = next((c for c in ADHERENCE_DATE_COLUMNS if c in df_valid.columns), None)
+        if date_col:
+            averages = df_valid.groupby(_period_keys(df_valid[date_col])).agg(
+                avg_adherence_pct=('adherence_parsed', 'mean'),
+                avg_conformance_pct=('conformance_parsed', 'mean'),
+                adherence_count=('adherence_parsed', 'count'),
+                conformance_count=('conformance_parsed', 'count'),
+            )
+            # The counts weight the averages when periods/files are merged
+            result['periods'] = {
+                period: {k: (None if pd.isna(v) else int(v) if k.endswith('_count') else float(v))
+                         for k, v in row.items()}
+                for period, row in zip(averages.index, averages.to_dict('records'))
+            }
     
     return result
 
 
-def parse_wfm_scheduled(filepath: Path) -> dict:
+def parse_wfm_scheduled(filepath: Path, header: CsvHeader = None,
+                        frame: pd.DataFrame = None) -> dict:
     """
     Parse WFM Scheduled and Required export.
     
     15-minute interval staffing data.
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'wfm_scheduled_required', header=header, frame=frame)
     
     result = {
         'source': 'wfm_scheduled_required',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'summary': {},
-        'intervals': [],
+        'intervals': {},
     }
     
     # Convert numeric columns
@@ -608,24 +1341,42 @@ def parse_wfm_scheduled(filepath: Path) -> dict:
         result['summary']['understaffed_intervals'] = int((df['Difference'] < 0).sum())
         result['summary']['overstaffed_intervals'] = int((df['Difference'] > 0).sum())
         result['summary']['understaffed_pct'] = (df['Difference'] < 0).mean() * 100
+        
+        # Per-interval staffing as compact columns (same 'start' format as the
+        # Interactions intervals; local time preferred so the two line up)
+        time_col = next((c for c in (WFM_SCHEDULED_COLUMNS['time_local'], WFM_SCHEDULED_COLUMNS['time_utc'])
+                         if c in df.columns), None)
+        if time_col:
+            starts = _parse_dates(df[time_col])
+            if time_col == WFM_SCHEDULED_COLUMNS['time_utc']:
+                starts = starts.dt.tz_localize(None) if starts.dt.tz is not None else starts
+            known = starts.notna()
+            result['intervals'] = {'start': starts[known].dt.strftime(INTERVAL_FORMAT).tolist()}
+            for key, col in (('scheduled', 'Scheduled'), ('required', 'Required Staff'),
+                             ('required_with_shrinkage', 'Required Staff with Shrinkage')):
+                if col in df.columns:
+                    result['intervals'][key] = [
+                        None if pd.isna(v) else float(v) for v in df.loc[known, col].tolist()
+                    ]
     
     return result
 
 
-def parse_wfm_activities(filepath: Path) -> dict:
+def parse_wfm_activities(filepath: Path, header: CsvHeader = None,
+                         frame: pd.DataFrame = None) -> dict:
     """
     Parse WFM Activities export.
     
     Individual agent scheduled activities.
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'wfm_activities', header=header, frame=frame)
     
     result = {
         'source': 'wfm_activities',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'by_activity': {},
         'by_agent': {},
     }
@@ -634,49 +1385,45 @@ def parse_wfm_activities(filepath: Path) -> dict:
     df.columns = [c.strip().replace('\ufeff', '') for c in df.columns]
     
     if 'Activity Code Name' in df.columns:
-        activity_summary = df.groupby('Activity Code Name').agg({
+        activity_summary = df.groupby('Activity Code Name', observed=True).agg({
             'Length In Minutes': 'sum'
         }).reset_index()
         
-        for _, row in activity_summary.iterrows():
-            activity = row['Activity Code Name']
-            if pd.notna(activity):
-                result['by_activity'][activity] = {
-                    'total_hours': row['Length In Minutes'] / 60 if pd.notna(row['Length In Minutes']) else 0
-                }
+        result['by_activity'] = frame_to_dict(activity_summary, 'Activity Code Name', {
+            'total_hours': Col('Length In Minutes', divisor=60, missing=0),
+        }, skip_blank_keys=False)
     
     if 'Agent Name' in df.columns:
-        agent_summary = df.groupby('Agent Name').agg({
+        agent_summary = df.groupby('Agent Name', observed=True).agg({
             'Length In Minutes': 'sum'
         }).reset_index()
         
-        for _, row in agent_summary.iterrows():
-            agent = row['Agent Name']
-            if pd.notna(agent):
-                result['by_agent'][agent] = {
-                    'total_hours': row['Length In Minutes'] / 60 if pd.notna(row['Length In Minutes']) else 0
-                }
+        result['by_agent'] = frame_to_dict(agent_summary, 'Agent Name', {
+            'total_hours': Col('Length In Minutes', divisor=60, missing=0),
+        }, skip_blank_keys=False)
     
     return result
 
 
-def parse_agent_schedules(filepath: Path) -> dict:
+def parse_agent_schedules(filepath: Path, header: CsvHeader = None,
+                          frame: pd.DataFrame = None) -> dict:
     """
     Parse Agents Permanent Schedules export.
     
     Agent configuration: skills, queues, planning groups.
     """
-    df = pd.read_csv(filepath)
+    df, columns = read_export(filepath, 'agent_schedules', header=header, frame=frame)
     
     # Standardize column names (handle BOM and quotes)
-    df.columns = [c.strip().replace('\ufeff', '').replace('"', '') for c in df.columns]
+    df.columns = [_clean_column(c) for c in df.columns]
+    columns = [_clean_column(c) for c in columns]
     
     result = {
         'source': 'agent_schedules',
         'filepath': str(filepath),
         'parsed_at': datetime.now().isoformat(),
         'record_count': len(df),
-        'columns': df.columns.tolist(),
+        'columns': columns,
         'agents': {},
         'summary': {},
     }
@@ -803,10 +1550,13 @@ def parse_wcs(filepath: Path) -> dict:
 # FILE TYPE IDENTIFICATION
 # =============================================================================
 
-def identify_file_type(filepath: Path) -> str:
+def identify_file_type(filepath: Path, header: CsvHeader = None) -> str:
     """
     Identify file type based on filename pattern and content.
     
+    Content detection scores the CSV header against EXPORT_SIGNATURES;
+    pass header (from sniff_header) to avoid re-reading it.
+    
     Returns one of:
     - Genesys exports: 'genesys_interactions', 'genesys_agent_performance',
       'genesys_agent_status', 'genesys_skills_performance', 'genesys_adherence',
@@ -844,35 +1594,24 @@ def identify_file_type(filepath: Path) -> str:
     
     # Check CSV content
     if filepath.suffix.lower() == '.csv':
-        try:
-            df = pd.read_csv(filepath, nrows=5)
-            cols = ' '.join([str(c).lower() for c in df.columns])
-            
-            if 'total handle' in cols and 'conversation id' in cols:
-                return 'genesys_interactions'
-            if 'avg handle' in cols and 'agent name' in cols and 'handle' in cols:
-                return 'genesys_agent_performance'
-            if 'logged in' in cols and 'on queue' in cols and 'occupancy' in cols:
-                return 'genesys_agent_status'
-            if 'skill name' in cols and 'queue name' in cols:
-                return 'genesys_skills_performance'
-            if 'adherence' in cols and 'conformance' in cols:
-                return 'genesys_adherence'
-            if 'required staff' in cols and 'scheduled' in cols:
-                return 'wfm_scheduled'
-            if 'activity code' in cols:
-                return 'wfm_activities'
-            if 'planning groups' in cols and 'skills' in cols:
-                return 'agent_schedules'
-        except:
-            pass
+        header = header or sniff_header(filepath)
+        if header is not None:
+            return match_signature(header.columns) or 'unknown'
     
     return 'unknown'
 
 
-def parse_file(filepath: Path) -> dict:
-    """Auto-detect file type and parse accordingly."""
-    file_type = identify_file_type(filepath)
+def parse_file(filepath: Path, header: CsvHeader = None, frame: pd.DataFrame = None) -> dict:
+    """
+    Auto-detect file type and parse accordingly.
+    
+    The CSV header is sniffed once and shared by detection and the parser;
+    frame (the export's full typed read, see read_export) saves the parser
+    from reading the file again.
+    """
+    if header is None and filepath.suffix.lower() == '.csv':
+        header = sniff_header(filepath)
+    file_type = identify_file_type(filepath, header)
     
     parsers = {
         # Genesys exports
@@ -891,6 +1630,8 @@ def parse_file(filepath: Path) -> dict:
     }
     
     if file_type in parsers:
+        if file_type in EXPORT_SIGNATURES:
+            return parsers[file_type](filepath, header=header, frame=frame)
         return parsers[file_type](filepath)
     else:
         return {
@@ -0,0 +1,437 @@
+"""
+ISPN Queue Simulator
+Discrete-event simulation of a staffed queue for staffing what-ifs.
+
+Erlang C/A (utils/erlang.py) assume each interval is in steady state. The
+simulator instead plays a whole day forward, so a 10:00 spike spills its
+backlog into 10:15, staff changes land mid-queue, and callbacks hold a
+caller's place in line. It runs many replications of the day (spread over
+a process pool) and reports the distribution of AWT, abandon rate and
+service level per 15-minute interval.
+
+Model:
+    arrivals     Poisson per interval (calls = expected count) or
+                 'empirical' (exactly that many calls), uniform within it
+    handle time  sampled from the parsed Interactions handle-time sketch
+                 (HandleTimes.from_parsed), or exponential with a mean
+    patience     exponential with mean patience_sec (None = never abandon)
+    callbacks    a caller still waiting after callback_offer_sec is offered
+                 a callback and accepts with probability callback_accept;
+                 the callback keeps their place in line and cannot abandon
+    agents       staffed per interval; a reduction waits for busy agents
+                 to finish their current call
+
+Usage:
+    handle = HandleTimes.from_parsed(parse_interactions(path), queue='Tech Center')
+    result = simulate(calls_per_interval, agents_per_interval, handle,
+                      patience_sec=180, replications=2000)
+    result.summary()        # per-interval mean / p10 / p50 / p90
+"""
+
+import heapq
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .erlang import DEFAULT_TARGET_SECONDS, INTERVAL_SECONDS
+from .sketch import QuantileSketch
+
+ARRIVAL_MODES = ('poisson', 'empirical')
+
+# Per-interval outputs of one replication
+SIM_METRICS = ('offered', 'answered', 'abandoned', 'callbacks', 'awt_sec', 'abandon_pct', 'service_level')
+
+# Quantiles reported across replications
+SUMMARY_QUANTILES = (0.1, 0.5, 0.9)
+
+# Caller states
+_WAITING, _CALLBACK, _ANSWERED, _ABANDONED = 0, 1, 2, 3
+
+# Event kinds, in tie-break order (free agents before staff changes)
+_COMPLETE, _SHIFT, _ABANDON, _OFFER = 0, 1, 2, 3
+
+
+# =============================================================================
+# HANDLE TIMES
+# =============================================================================
+
+@dataclass(frozen=True)
+class HandleTimes:
+    """
+    Handle-time distribution in seconds, sampled by inverse CDF.
+
+    Attributes:
+        ranks: Cumulative probabilities (0..1, increasing)
+        values: Handle time (seconds) at each rank
+        mean_sec: If set, sample exponential with this mean instead
+    """
+    ranks: np.ndarray = None
+    values: np.ndarray = None
+    mean_sec: float = None
+
+    @classmethod
+    def exponential(cls, mean_sec: float) -> 'HandleTimes':
+        return cls(mean_sec=float(mean_sec))
+
+    @classmethod
+    def from_values(cls, seconds) -> 'HandleTimes':
+        """Empirical distribution of observed handle times (seconds)."""
+        return cls.from_sketch(QuantileSketch.from_values(np.asarray(seconds, dtype='float64') * 1000))
+
+    @classmethod
+    def from_sketch(cls, sketch: QuantileSketch) -> 'HandleTimes':
+        """Distribution of a millisecond QuantileSketch, interpolated as QuantileSketch.quantile() does."""
+        if sketch is None or sketch.count == 0:
+            raise ValueError("Handle-time sketch is empty")
+        total = sketch.weights.sum()
+        centres = np.cumsum(sketch.weights) - sketch.weights / 2
+        ranks = np.concatenate([[0.0], centres / total, [1.0]])
+        values = np.concatenate([[sketch.min], sketch.means, [sketch.max]]) / 1000
+        return cls(ranks=ranks, values=values)
+
+    @classmethod
+    def from_parsed(cls, parsed: dict, queue: str = None, periods=None) -> 'HandleTimes':
+        """
+        Handle times from parse_interactions() output.
+
+        Merges the stored 'handle_ms' sketches (same rows as AHT: inbound
+        ACD, handle >= 20s) of the given periods (default all), for one
+        queue or the whole export.
+        """
+        merged = QuantileSketch()
+        dimension, key = ('queue', queue) if queue else ('all', 'all')
+        for period, metrics in (parsed.get('sketches') or {}).items():
+            if periods is not None and period not in periods:
+                continue
+            data = metrics.get('handle_ms', {}).get(dimension, {}).get(key)
+            if data:
+                merged.merge(QuantileSketch.from_dict(data))
+        if merged.count == 0:
+            raise ValueError(f"No handle-time data{f' for queue {queue}' if queue else ''}")
+        return cls.from_sketch(merged)
+
+    @property
+    def mean(self) -> float:
+        if self.mean_sec is not None:
+            return self.mean_sec
+        # Area under the inverse CDF (trapezoid rule; np.trapezoid needs NumPy 2)
+        values = np.asarray(self.values, dtype=float)
+        return float(np.sum((values[1:] + values[:-1]) / 2 * np.diff(self.ranks)))
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        if self.mean_sec is not None:
+            return rng.exponential(self.mean_sec, size)
+        return np.interp(rng.random(size), self.ranks, self.values)
+
+
+# =============================================================================
+# ONE REPLICATION
+# =============================================================================
+
+def _arrivals(rng: np.random.Generator, calls: np.ndarray, interval_sec: float, mode: str):
+    """Sorted arrival times and their interval index."""
+    counts = rng.poisson(calls) if mode == 'poisson' else np.rint(calls).astype('int64')
+    interval = np.repeat(np.arange(calls.size), counts)
+    times = (interval + rng.random(interval.size)) * interval_sec
+    order = np.argsort(times, kind='stable')
+    return times[order], interval[order]
+
+
+def run_day(calls, agents, handle: HandleTimes, seed=None,
+            interval_sec: float = INTERVAL_SECONDS, arrival_mode: str = 'poisson',
+            patience_sec: float = None, callback_offer_sec: float = None,
+            callback_accept: float = 0.0, target_sec: float = DEFAULT_TARGET_SECONDS) -> Dict[str, np.ndarray]:
+    """
+    Simulate one day (one replication).
+
+    Args:
+        calls: Expected (poisson) or actual (empirical) calls per interval
+        agents: Agents staffed per interval (same length as calls)
+        handle: Handle-time distribution
+        seed: Seed or np.random.SeedSequence
+        (remaining arguments as in simulate())
+
+    Returns:
+        {metric: array per interval} for SIM_METRICS, by arrival interval.
+        awt_sec is the mean queue time of answered inbound calls (NaN when
+        none); service_level is answered within target_sec over offered
+        calls that did not take a callback; abandon_pct is abandoned over
+        offered, as a percentage.
+    """
+    calls = np.asarray(calls, dtype='float64')
+    staffing = np.asarray(agents, dtype='int64')
+    rng = np.random.default_rng(seed)
+
+    times, interval = _arrivals(rng, calls, interval_sec, arrival_mode)
+    n = times.size
+    service = handle.sample(rng, n).tolist()
+    patience = rng.exponential(patience_sec, n).tolist() if patience_sec else None
+    accepts = (rng.random(n) < callback_accept).tolist() if callback_offer_sec is not None else None
+    arrival = times.tolist()
+
+    state = [_WAITING] * n
+    wait = [0.0] * n
+    queue = deque()
+    events = [((i + 1) * interval_sec, _SHIFT, i + 1) for i in range(staffing.size - 1)]
+    heapq.heapify(events)
+
+    staffed = int(staffing[0]) if staffing.size else 0
+    free = staffed
+    busy = 0
+
+    def answer(now):
+        nonlocal free, busy
+        while free > 0 and queue:
+            caller = queue.popleft()
+            if state[caller] in (_WAITING, _CALLBACK):
+                if state[caller] == _WAITING:
+                    state[caller] = _ANSWERED
+                wait[caller] = now - arrival[caller]
+                free -= 1
+                busy += 1
+                heapq.heappush(events, (now + service[caller], _COMPLETE, caller))
+
+    next_arrival = 0
+    while next_arrival < n or events:
+        if next_arrival < n and (not events or arrival[next_arrival] < events[0][0]):
+            caller = next_arrival
+            next_arrival += 1
+            now = arrival[caller]
+            queue.append(caller)
+            if patience is not None:
+                heapq.heappush(events, (now + patience[caller], _ABANDON, caller))
+            if accepts is not None and accepts[caller]:
+                heapq.heappush(events, (now + callback_offer_sec, _OFFER, caller))
+            answer(now)
+            continue
+
+        now, kind, ref = heapq.heappop(events)
+        if kind == _COMPLETE:
+            busy -= 1
+            if busy + free < staffed:
+                free += 1
+            answer(now)
+        elif kind == _SHIFT:
+            staffed = int(staffing[ref])
+            # Add agents now; remove idle ones now and busy ones as they finish
+            free = max(0, staffed - busy)
+            answer(now)
+        elif kind == _ABANDON:
+            # Answered callers are marked before their completion is queued,
+            # so a caller still _WAITING is still in line
+            if state[ref] == _WAITING:
+                state[ref] = _ABANDONED
+                wait[ref] = now - arrival[ref]
+        elif kind == _OFFER:
+            if state[ref] == _WAITING:
+                state[ref] = _CALLBACK
+
+    return _interval_stats(np.asarray(state), np.asarray(wait), interval, staffing.size, target_sec)
+
+
+def _interval_stats(state: np.ndarray, wait: np.ndarray, interval: np.ndarray,
+                    intervals: int, target_sec: float) -> Dict[str, np.ndarray]:
+    def count(mask, weights=None):
+        return np.bincount(interval[mask], weights=None if weights is None else weights[mask], minlength=intervals)
+
+    answered = state == _ANSWERED
+    offered = np.bincount(interval, minlength=intervals).astype('float64')
+    answered_n = count(answered).astype('float64')
+    abandoned = count(state == _ABANDONED).astype('float64')
+    callbacks = count(state == _CALLBACK).astype('float64')
+    in_time = count(answered & (wait <= target_sec)).astype('float64')
+    wait_sum = count(answered, wait)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inbound = offered - callbacks
+        return {
+            'offered': offered,
+            'answered': answered_n,
+            'abandoned': abandoned,
+            'callbacks': callbacks,
+            'awt_sec': np.where(answered_n > 0, wait_sum / answered_n, np.nan),
+            'abandon_pct': np.where(offered > 0, abandoned / offered * 100, np.nan),
+            'service_level': np.where(inbound > 0, in_time / inbound, np.nan),
+        }
+
+
+# =============================================================================
+# REPLICATIONS
+# =============================================================================
+
+@dataclass
+class SimulationResult:
+    """
+    Per-replication, per-interval outcomes of simulate().
+
+    Attributes:
+        metrics: {metric: array of shape (replications, intervals)}
+        starts: Optional interval labels (e.g. Timestamps) for summaries
+    """
+    metrics: Dict[str, np.ndarray]
+    starts: Optional[list] = None
+
+    @property
+    def replications(self) -> int:
+        return self.metrics['offered'].shape[0]
+
+    def summary(self, quantiles=SUMMARY_QUANTILES) -> pd.DataFrame:
+        """
+        Distribution across replications per interval: one row per
+        interval, columns '<metric>_mean' and '<metric>_p10' etc.
+        Intervals where a metric is undefined in a replication (no calls)
+        are left out of that metric's statistics.
+        """
+        columns = {}
+        for metric in ('offered', 'awt_sec', 'abandon_pct', 'service_level', 'callbacks'):
+            values = self.metrics[metric]
+            columns[f'{metric}_mean'] = _nanquantile(values, None)
+            for q in quantiles:
+                columns[f'{metric}_p{round(q * 100):g}'] = _nanquantile(values, q)
+        frame = pd.DataFrame(columns)
+        if self.starts is not None:
+            frame.insert(0, 'start', self.starts)
+        return frame
+
+    def day_totals(self) -> pd.DataFrame:
+        """Whole-day AWT, abandon % and service level per replication."""
+        m = self.metrics
+        answered = m['answered'].sum(axis=1)
+        offered = m['offered'].sum(axis=1)
+        inbound = offered - m['callbacks'].sum(axis=1)
+        in_time = np.nansum(m['service_level'] * (m['offered'] - m['callbacks']), axis=1)
+        wait = np.nansum(m['awt_sec'] * m['answered'], axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.DataFrame({
+                'offered': offered,
+                'awt_sec': np.where(answered > 0, wait / answered, np.nan),
+                'abandon_pct': np.where(offered > 0, m['abandoned'].sum(axis=1) / offered * 100, np.nan),
+                'service_level': np.where(inbound > 0, in_time / inbound, np.nan),
+                'callbacks': m['callbacks'].sum(axis=1),
+            })
+
+
+def _nanquantile(values: np.ndarray, q: Optional[float]) -> np.ndarray:
+    """Per-interval quantile (mean when q is None) over replications, skipping NaNs."""
+    defined = ~np.isnan(values).all(axis=0)
+    out = np.full(values.shape[1], np.nan)
+    if defined.any():
+        subset = values[:, defined]
+        out[defined] = np.nanmean(subset, axis=0) if q is None else np.nanquantile(subset, q, axis=0)
+    return out
+
+
+def _run_batch(args) -> Dict[str, np.ndarray]:
+    """Run several replications in one worker; returns stacked metrics."""
+    seeds, calls, agents, handle, options = args
+    days = [run_day(calls, agents, handle, seed, **options) for seed in seeds]
+    return {metric: np.stack([day[metric] for day in days]) for metric in SIM_METRICS}
+
+
+def simulate(calls, agents, handle: HandleTimes, replications: int = 1000, workers: int = None,
+             seed: int = None, starts: list = None, interval_sec: float = INTERVAL_SECONDS,
+             arrival_mode: str = 'poisson', patience_sec: float = None,
+             callback_offer_sec: float = None, callback_accept: float = 0.0,
+             target_sec: float = DEFAULT_TARGET_SECONDS) -> SimulationResult:
+    """
+    Run replications of a day across a process pool.
+
+    Every replication has its own child seed of `seed`, so results are the
+    same whatever the worker count.
+
+    Args:
+        calls: Calls per interval (expected for poisson, actual for empirical)
+        agents: Agents staffed per interval (scalar or same length as calls)
+        handle: HandleTimes distribution
+        replications: Number of simulated days
+        workers: Processes (default os.cpu_count(); 1 runs in-process)
+        seed: Base seed for reproducible runs
+        starts: Optional interval labels for SimulationResult.summary()
+        interval_sec: Interval length in seconds
+        arrival_mode: 'poisson' or 'empirical'
+        patience_sec: Mean caller patience (None = callers never abandon)
+        callback_offer_sec: Wait after which callers are offered a callback
+        callback_accept: Probability a caller accepts the callback
+        target_sec: Service level threshold (seconds)
+
+    Returns:
+        SimulationResult
+    """
+    if arrival_mode not in ARRIVAL_MODES:
+        raise ValueError(f"arrival_mode must be one of {ARRIVAL_MODES}")
+    calls = np.asarray(calls, dtype='float64')
+    agents = np.broadcast_to(np.asarray(agents, dtype='int64'), calls.shape).copy()
+    options = {
+        'interval_sec': interval_sec, 'arrival_mode': arrival_mode, 'patience_sec': patience_sec,
+        'callback_offer_sec': callback_offer_sec, 'callback_accept': callback_accept,
+        'target_sec': target_sec,
+    }
+
+    seeds = np.random.SeedSequence(seed).spawn(replications)
+    workers = max(1, min(workers or os.cpu_count() or 1, replications))
+    # A few batches per worker keeps the pool busy without pickling per day
+    batches = [seeds[i::workers * 4] for i in range(min(replications, workers * 4))]
+    jobs = [(batch, calls, agents, handle, options) for batch in batches]
+
+    if workers == 1:
+        parts = [_run_batch(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_run_batch, jobs))
+
+    # Restore replication order (batches were dealt round-robin)
+    order = np.argsort(np.concatenate([np.arange(i, replications, len(batches)) for i in range(len(batches))]))
+    metrics = {metric: np.concatenate([part[metric] for part in parts])[order] for metric in SIM_METRICS}
+    return SimulationResult(metrics, starts)
+
+
+def compare_plans(calls, plans: Dict[str, object], handle: HandleTimes, **options) -> pd.DataFrame:
+    """
+    Simulate the same day under several staffing plans.
+
+    Args:
+        calls: Calls per interval
+        plans: {plan name: agents per interval (or a constant)}
+        handle: HandleTimes distribution
+        **options: Passed to simulate() (use the same seed for a paired comparison)
+
+    Returns:
+        One row per plan: agent-hours and whole-day mean / p10 / p90 of
+        AWT, abandon % and service level across replications
+    """
+    interval_sec = options.get('interval_sec', INTERVAL_SECONDS)
+    rows = []
+    for name, agents in plans.items():
+        totals = simulate(calls, agents, handle, **options).day_totals()
+        staffed = np.broadcast_to(np.asarray(agents, dtype='float64'), np.shape(calls))
+        row = {'plan': name, 'agent_hours': float(staffed.sum() * interval_sec / 3600)}
+        for metric in ('awt_sec', 'abandon_pct', 'service_level'):
+            row[f'{metric}_mean'] = float(totals[metric].mean())
+            row[f'{metric}_p10'] = float(totals[metric].quantile(0.1))
+            row[f'{metric}_p90'] = float(totals[metric].quantile(0.9))
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def day_profile(workload: pd.DataFrame, day: str, staffing: pd.DataFrame = None,
+                interval_sec: float = INTERVAL_SECONDS) -> pd.DataFrame:
+    """
+    One day's full interval grid from interactions_workload() (and
+    optionally wfm_staffing()) frames, with empty intervals as 0 calls.
+
+    Returns:
+        DataFrame: start, calls, aht_sec [, scheduled]
+    """
+    first = pd.Timestamp(day)
+    grid = pd.DataFrame({'start': pd.date_range(first, first + pd.Timedelta(days=1),
+                                                freq=f'{int(interval_sec)}s', inclusive='left')})
+    profile = grid.merge(workload, on='start', how='left')
+    if staffing is not None and 'scheduled' in staffing:
+        profile = profile.merge(staffing[['start', 'scheduled']], on='start', how='left')
+    profile['calls'] = profile['calls'].fillna(0)
+    return profile
@@ -0,0 +1,145 @@
+"""
+Quantile Sketches
+Compact, mergeable percentile summaries (merging t-digest).
+
+A sketch keeps a bounded number of weighted centroids instead of every
+value, so p50/p90/p99 handle and wait times can be built while parsing,
+stored alongside the raw period data and later merged across chunks,
+files, queues, agents, weeks or months without re-reading the CSVs.
+
+Small inputs (fewer than ~compression/3 values) are stored exactly; larger
+ones are accurate to well under 1% of rank, best at the tails.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, Optional
+
+DEFAULT_COMPRESSION = 200
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+class QuantileSketch:
+    """
+    Merging t-digest over non-negative numeric values (milliseconds here).
+
+    Usage:
+        sketch = QuantileSketch.from_values(df['Total Handle'])
+        sketch.merge(other_sketch)
+        p90 = sketch.quantile(0.9)
+    """
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def from_values(cls, values, compression: int = DEFAULT_COMPRESSION) -> 'QuantileSketch':
+        """Build a sketch from an array/Series; NaNs are ignored."""
+        sketch = cls(compression)
+        sketch.add(values)
+        return sketch
+
+    @property
+    def count(self) -> int:
+        return int(self.weights.sum())
+
+    def __len__(self):
+        return self.count
+
+    def add(self, values):
+        """Fold an array of raw values into the sketch."""
+        values = np.asarray(values, dtype='float64')
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+        self._absorb(values, np.ones(values.size), float(values.min()), float(values.max()))
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch into this one (in place) and return self."""
+        if other is None or other.count == 0:
+            return self
+        self._absorb(other.means, other.weights, other.min, other.max)
+        return self
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray, lo: float, hi: float):
+        self.min = lo if self.min is None else min(self.min, lo)
+        self.max = hi if self.max is None else max(self.max, hi)
+        self.means, self.weights = self._compress(
+            np.concatenate([self.means, means]),
+            np.concatenate([self.weights, weights]),
+        )
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray):
+        """
+        Re-cluster centroids so each spans at most one unit of the k1 scale
+        function k(q) = δ/2π · asin(2q - 1): tiny clusters at the tails,
+        wide ones around the median. Fully vectorized.
+        """
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+
+        q_mid = (np.cumsum(weights) - weights / 2) / total
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_mid - 1)
+        groups = np.floor(k - k.min()).astype(np.int64)
+
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        merged_weights = np.add.reduceat(weights, starts)
+        merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+        return merged_means, merged_weights
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimated value at quantile q (0..1), or None for an empty sketch.
+
+        Interpolates between centroid centres, anchored at the exact min/max.
+        """
+        if self.count == 0:
+            return None
+        total = self.weights.sum()
+        centres = np.cumsum(self.weights) - self.weights / 2
+        # Positions follow pandas' linear rule (q * (n - 1)) on the rank scale
+        target = q * (total - 1) + 0.5
+        xs = np.concatenate([[0.0], centres, [total]])
+        ys = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(target, xs, ys))
+
+    def percentiles(self, quantiles: Iterable[float] = DEFAULT_QUANTILES) -> Dict[str, Optional[float]]:
+        """{'p50': ..., 'p90': ..., 'p99': ...} for the requested quantiles."""
+        return {f"p{round(q * 100):g}": self.quantile(q) for q in quantiles}
+
+    # -------------------------------------------------------------------------
+    # Serialization (JSON-safe; stored in the metrics store and parsed output)
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            'compression': self.compression,
+            'count': self.count,
+            'min': self.min,
+            'max': self.max,
+            'means': [round(float(m), 3) for m in self.means],
+            'weights': [int(w) for w in self.weights],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'QuantileSketch':
+        sketch = cls(data.get('compression', DEFAULT_COMPRESSION))
+        sketch.means = np.asarray(data.get('means', []), dtype='float64')
+        sketch.weights = np.asarray(data.get('weights', []), dtype='float64')
+        sketch.min = data.get('min')
+        sketch.max = data.get('max')
+        return sketch
+
+
+def merge_sketches(sketches: Iterable[Optional[QuantileSketch]],
+                   compression: int = DEFAULT_COMPRESSION) -> QuantileSketch:
+    """Merge any number of sketches (None entries are skipped) into a new one."""
+    merged = QuantileSketch(compression)
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
@@ -0,0 +1,780 @@
+"""
+ISPN Metrics Store
+SQLite-backed storage for raw period data, manual inputs, processed files
+and ISPN-calculated metrics.
+
+Replaces the read-modify-write JSON documents (raw_data_store.json,
+ispn_metrics_history.json, ingest_manifest.json). Every write is a single
+transaction, so a crash mid-ingest never loses previously stored periods,
+and lookups by period/source hit an index instead of parsing the whole file.
+
+Values are stored JSON-encoded, one row per (period, section, field), so the
+period dict handed to the calculation engine has the same shape as before.
+Quantile sketches (see sketch.py) live next to them, one row per
+(period, metric, dimension, key), and are merged on read.
+
+Parsed exports are stored as parts: one RawAggregate (see aggregates.py)
+per (period, section, part), where part identifies the file it came from.
+A section's values are the merge of its parts, so several partial exports
+for one month add up, and re-ingesting the same file replaces its own part
+instead of counting it twice. Weeks and fiscal years are served by merging
+the stored days/months (get_period(..., rollup=True)).
+
+The same raw totals are also kept per 15-minute interval (raw_intervals,
+one narrow integer row per section/interval/file, clustered on
+(section, start)) with distinct agents per day alongside. Any date range -
+a week, a month, a custom window - is then a single indexed SUM over
+pre-aggregated rows (get_range()), fast even across years of history.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable, TYPE_CHECKING
+
+from .aggregates import RawAggregate, merge_aggregates, grain_of, rollup_key, period_bounds
+
+if TYPE_CHECKING:
+    from .sketch import QuantileSketch
+
+METRICS_DIR = Path(__file__).parent.parent.parent / "data" / "metrics"
+STORE_FILE = METRICS_DIR / "ispn_metrics.db"
+
+# Legacy JSON documents (next to the database) imported once by migrate_from_json()
+LEGACY_RAW_STORE_NAME = "raw_data_store.json"
+LEGACY_HISTORY_NAME = "ispn_metrics_history.json"
+LEGACY_MANIFEST_NAME = "ingest_manifest.json"
+
+# raw_parts key holding a migrated section's totals, so later parts add to them
+LEGACY_PART = "legacy"
+
+# Sections every period exposes, even when empty
+RAW_SECTIONS = ('interactions', 'agent_status', 'helpdesk', 'quality', 'manual')
+
+# Additive raw fields kept per 15-minute interval, by section
+INTERVAL_FIELDS = {
+    'interactions': (
+        'inbound_call_count', 'inbound_total_handle_ms', 'inbound_total_talk_ms',
+        'inbound_total_hold_ms', 'inbound_total_acw_ms', 'inbound_total_queue_ms',
+        'abandoned_call_count', 'answered_under_30s', 'answered_under_60s',
+        'answered_under_90s', 'answered_under_120s', 'outbound_call_count',
+        'outbound_total_handle_ms', 'callback_call_count', 'callback_total_handle_ms',
+    ),
+    'agent_status': (
+        'total_logged_in_ms', 'total_on_queue_ms', 'total_interacting_ms', 'total_idle_ms',
+        'total_available_ms', 'total_away_ms', 'total_break_ms', 'total_meal_ms',
+        'total_not_responding_ms',
+    ),
+}
+_INTERVAL_COLUMNS = [f for fields in INTERVAL_FIELDS.values() for f in fields]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS raw_values (
+    period      TEXT NOT NULL,
+    section     TEXT NOT NULL,
+    field       TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (period, section, field)
+);
+CREATE INDEX IF NOT EXISTS idx_raw_values_section ON raw_values (section, period);
+
+CREATE TABLE IF NOT EXISTS raw_parts (
+    period      TEXT NOT NULL,
+    section     TEXT NOT NULL,
+    part        TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (period, section, part)
+);
+
+CREATE TABLE IF NOT EXISTS raw_intervals (
+    section     TEXT NOT NULL,
+    start       TEXT NOT NULL,
+    part        TEXT NOT NULL,
+""" + "".join(f"    {name} INTEGER,\n" for name in _INTERVAL_COLUMNS) + """    PRIMARY KEY (section, start, part)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_raw_intervals_part ON raw_intervals (part);
+
+CREATE TABLE IF NOT EXISTS raw_agent_days (
+    section     TEXT NOT NULL,
+    day         TEXT NOT NULL,
+    agent       TEXT NOT NULL,
+    part        TEXT NOT NULL,
+    PRIMARY KEY (section, day, agent, part)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sketches (
+    period      TEXT NOT NULL,
+    metric      TEXT NOT NULL,
+    dimension   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (period, metric, dimension, key)
+);
+CREATE INDEX IF NOT EXISTS idx_sketches_metric ON sketches (metric, dimension, period);
+
+CREATE TABLE IF NOT EXISTS files_processed (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    period      TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    timestamp   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_processed ON files_processed (period, source);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    period          TEXT PRIMARY KEY,
+    data            TEXT NOT NULL,
+    formula_version TEXT,
+    calculated_at   TEXT
+);
+
+CREATE TABLE IF NOT EXISTS ingest_manifest (
+    content_hash    TEXT PRIMARY KEY,
+    file            TEXT NOT NULL,
+    size            INTEGER NOT NULL,
+    source          TEXT NOT NULL,
+    parser_version  TEXT NOT NULL,
+    ingested_at     TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   TEXT
+);
+"""
+
+
+def _encode(value) -> str:
+    return json.dumps(value, default=str)
+
+
+class MetricsStore:
+    """
+    Transactional store for everything ingest.py persists.
+
+    Usage:
+        store = MetricsStore()
+        store.upsert_raw('2025-01', 'interactions', raw, source='genesys_interactions')
+        period_data = store.get_period('2025-01')
+    """
+
+    def __init__(self, path: Path = STORE_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Raw period data
+    # -------------------------------------------------------------------------
+
+    def upsert_raw(self, period: str, section: str, values: dict,
+                   replace: bool = False, source: str = None):
+        """
+        Write raw values for one period section in a single transaction.
+
+        Args:
+            period: Period key (YYYY-MM)
+            section: Store section ('interactions', 'agent_status', 'manual', ...)
+            values: Field -> value; existing fields are overwritten
+            replace: Drop the section's other fields first
+            source: If given, also record a files_processed entry
+        """
+        now = datetime.now().isoformat()
+        with self.conn:
+            if replace:
+                self.conn.execute(
+                    "DELETE FROM raw_values WHERE period = ? AND section = ?",
+                    (period, section)
+                )
+            self.conn.executemany(
+                """
+                INSERT INTO raw_values (period, section, field, value, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (period, section, field)
+                DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+                """,
+                [(period, section, k, _encode(v), now) for k, v in values.items()]
+            )
+            if source is not None:
+                self.conn.execute(
+                    "INSERT INTO files_processed (period, source, timestamp) VALUES (?, ?, ?)",
+                    (period, source, now)
+                )
+            self._touch()
+
+    def add_raw_part(self, period: str, section: str, part: str, values: dict,
+                     source: str = None) -> dict:
+        """
+        Store one file's raw values for a period section and re-merge it.
+
+        The section's fields become the merge of all its parts, so a second
+        export for the same period adds to the first. Storing the same part
+        again (e.g. re-ingesting a file) replaces it.
+
+        Args:
+            period: Period key (YYYY-MM, or YYYY-MM-DD for daily data)
+            section: Store section ('interactions', 'agent_status', ...)
+            part: Identifies the contribution (the file's content hash)
+            values: Raw field -> value (counts, ms totals, see aggregates.py)
+            source: If given, also record a files_processed entry
+
+        Returns:
+            The section's merged values
+        """
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO raw_parts (period, section, part, data, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (period, section, part)
+                DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+                """,
+                (period, section, part, _encode(values), now)
+            )
+            parts = self.conn.execute(
+                "SELECT data FROM raw_parts WHERE period = ? AND section = ? ORDER BY rowid",
+                (period, section)
+            )
+            merged = merge_aggregates(RawAggregate(json.loads(data)) for data, in parts).to_dict()
+            self.conn.execute(
+                "DELETE FROM raw_values WHERE period = ? AND section = ?", (period, section)
+            )
+            self.conn.executemany(
+                "INSERT INTO raw_values (period, section, field, value, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(period, section, k, _encode(v), now) for k, v in merged.items()]
+            )
+            if source is not None:
+                self.conn.execute(
+                    "INSERT INTO files_processed (period, source, timestamp) VALUES (?, ?, ?)",
+                    (period, source, now)
+                )
+            self._touch()
+        return merged
+
+    def get_raw_parts(self, period: str, section: str) -> Dict[str, dict]:
+        """{part: raw values} stored for one period section."""
+        rows = self.conn.execute(
+            "SELECT part, data FROM raw_parts WHERE period = ? AND section = ? ORDER BY rowid",
+            (period, section)
+        )
+        return {part: json.loads(data) for part, data in rows}
+
+    # -------------------------------------------------------------------------
+    # Interval grain (15-minute raw totals)
+    # -------------------------------------------------------------------------
+
+    def replace_intervals(self, section: str, part: str, intervals: dict,
+                          agent_days: Dict[str, List[str]] = None) -> int:
+        """
+        Store one file's per-interval raw totals, replacing its earlier rows.
+
+        Args:
+            section: 'interactions' or 'agent_status'
+            part: Identifies the file (content hash), as for add_raw_part()
+            intervals: Columnar {'start': ['YYYY-MM-DD HH:MM', ...], field: [...]}
+                       as emitted by the parsers under 'intervals'
+            agent_days: {'YYYY-MM-DD': [agent ids]} for distinct agent counts
+
+        Returns:
+            Number of interval rows stored
+        """
+        fields = [f for f in INTERVAL_FIELDS[section] if f in intervals]
+        starts = intervals.get('start', [])
+        rows = zip(*([[section] * len(starts), starts, [part] * len(starts)] +
+                     [intervals[f] for f in fields]))
+        with self.conn:
+            self.conn.execute("DELETE FROM raw_intervals WHERE section = ? AND part = ?", (section, part))
+            self.conn.execute("DELETE FROM raw_agent_days WHERE section = ? AND part = ?", (section, part))
+            self.conn.executemany(
+                f"INSERT INTO raw_intervals (section, start, part{''.join(', ' + f for f in fields)}) "
+                f"VALUES ({', '.join('?' * (len(fields) + 3))})",
+                rows
+            )
+            if agent_days:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO raw_agent_days (section, day, agent, part) VALUES (?, ?, ?, ?)",
+                    [(section, day, agent, part) for day, agents in agent_days.items() for agent in agents]
+                )
+            self._touch()
+        return len(starts)
+
+    def sum_intervals(self, section: str, start: str, end: str) -> Optional[dict]:
+        """
+        Sum a section's interval rows with start <= interval < end.
+
+        Args:
+            start, end: 'YYYY-MM-DD' or 'YYYY-MM-DD HH:MM' (end exclusive)
+
+        Returns:
+            {field: total} (plus agent_count for agent_status), or None if no
+            interval in the range has data
+        """
+        fields = INTERVAL_FIELDS[section]
+        row = self.conn.execute(
+            f"SELECT COUNT(*), {', '.join(f'SUM({f})' for f in fields)} FROM raw_intervals "
+            "WHERE section = ? AND start >= ? AND start < ?",
+            (section, start, end)
+        ).fetchone()
+        if not row[0]:
+            return None
+        totals = {f: (value or 0) for f, value in zip(fields, row[1:])}
+        if section == 'agent_status':
+            totals['agent_count'] = self.conn.execute(
+                "SELECT COUNT(DISTINCT agent) FROM raw_agent_days "
+                "WHERE section = ? AND day >= ? AND day < ?",
+                (section, start[:10], end[:10])
+            ).fetchone()[0]
+        return totals
+
+    def get_intervals(self, section: str, start: str, end: str) -> dict:
+        """
+        A section's interval rows with start <= interval < end, summed over
+        files, in the columnar form the parsers emit:
+        {'start': ['YYYY-MM-DD HH:MM', ...], field: [int, ...], ...}.
+        """
+        fields = INTERVAL_FIELDS[section]
+        rows = self.conn.execute(
+            f"SELECT start, {', '.join(f'SUM({f})' for f in fields)} FROM raw_intervals "
+            "WHERE section = ? AND start >= ? AND start < ? GROUP BY start ORDER BY start",
+            (section, start, end)
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * (len(fields) + 1)
+        intervals = {'start': list(columns[0])}
+        for field, values in zip(fields, columns[1:]):
+            intervals[field] = [value or 0 for value in values]
+        return intervals
+
+    def interval_span(self, section: str = 'interactions') -> Optional[tuple]:
+        """(first, last) interval start stored for a section, or None."""
+        row = self.conn.execute(
+            "SELECT MIN(start), MAX(start) FROM raw_intervals WHERE section = ?", (section,)
+        ).fetchone()
+        return row if row[0] else None
+
+    def get_range(self, period: str) -> Optional[dict]:
+        """
+        Raw data for any period key (day, week, month, FY or
+        'YYYY-MM-DD..YYYY-MM-DD') from the interval rows, in get_period() shape.
+
+        Interactions and Agent Status are range sums. Manual, helpdesk and
+        quality inputs are not split below the grain they were entered at,
+        so they are merged from stored periods that lie wholly inside the
+        range (e.g. a week's manual inputs, or the months of a FY).
+
+        Returns None if no interval data falls in the range.
+        """
+        bounds = period_bounds(period)
+        if bounds is None:
+            return None
+        start, end = (d.isoformat() for d in bounds)
+
+        period_data = {section: {} for section in RAW_SECTIONS}
+        found = False
+        for section in INTERVAL_FIELDS:
+            totals = self.sum_intervals(section, start, end)
+            if totals is not None:
+                period_data[section] = totals
+                found = True
+        if not found:
+            return None
+
+        inside = []
+        for stored in self.periods():
+            stored_bounds = period_bounds(stored)
+            if stored_bounds and stored_bounds[0] >= bounds[0] and stored_bounds[1] <= bounds[1]:
+                inside.append(stored)
+        for section in ('helpdesk', 'quality', 'manual'):
+            period_data[section] = merge_aggregates(
+                RawAggregate(self.get_period(p)[section]) for p in inside
+            ).to_dict()
+        period_data['metadata'] = {'files_processed': [], 'range': [start, end], 'inputs_from': inside}
+        return period_data
+
+    def periods(self) -> List[str]:
+        """All periods with raw data or processed files, sorted."""
+        rows = self.conn.execute(
+            "SELECT period FROM raw_values UNION SELECT period FROM files_processed ORDER BY period"
+        )
+        return [r[0] for r in rows]
+
+    def get_period(self, period: str, rollup: bool = False) -> Optional[dict]:
+        """
+        Return one period in the legacy raw_data_store.json shape:
+        {section: {field: value}, 'metadata': {'files_processed': [...]}}.
+        Returns None if nothing has been stored for the period.
+
+        With rollup=True a period that isn't stored itself (a week, a
+        fiscal year, a month only held as days) is built by merging the
+        stored periods it covers (see rollup_members()), or failing that
+        from the interval rows (see get_range()).
+        """
+        if rollup and not self._has_period(period):
+            return self._rollup_period(period) or self.get_range(period)
+
+        rows = self.conn.execute(
+            "SELECT section, field, value FROM raw_values WHERE period = ?", (period,)
+        ).fetchall()
+        files = self.conn.execute(
+            "SELECT source, timestamp FROM files_processed WHERE period = ? ORDER BY id", (period,)
+        ).fetchall()
+
+        if not rows and not files:
+            return None
+
+        period_data = {section: {} for section in RAW_SECTIONS}
+        for section, field, value in rows:
+            period_data.setdefault(section, {})[field] = json.loads(value)
+        period_data['metadata'] = {
+            'files_processed': [{'source': s, 'timestamp': t} for s, t in files]
+        }
+        return period_data
+
+    def _has_period(self, period: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM raw_values WHERE period = ? UNION SELECT 1 FROM files_processed WHERE period = ?",
+            (period, period)
+        ).fetchone() is not None
+
+    def rollup_members(self, period: str) -> List[str]:
+        """
+        Stored periods that make up a coarser period, e.g. the months of
+        'FY2025' or the days of '2025-W11'.
+
+        Where a month is stored both as a month and as days, the month
+        record is used and its days are skipped, so nothing counts twice.
+        """
+        grain = grain_of(period)
+        if grain is None:
+            return []
+        members = [p for p in self.periods() if p != period and rollup_key(p, grain) == period]
+        months = {p for p in members if grain_of(p) == 'month'}
+        return [p for p in members if not (grain_of(p) == 'day' and p[:7] in months)]
+
+    def _rollup_period(self, period: str) -> Optional[dict]:
+        members = self.rollup_members(period)
+        if not members:
+            return None
+
+        merged = {section: RawAggregate.empty() for section in RAW_SECTIONS}
+        files = []
+        for member in members:
+            member_data = self.get_period(member)
+            for section, values in member_data.items():
+                if section == 'metadata':
+                    files.extend(values.get('files_processed', []))
+                else:
+                    merged.setdefault(section, RawAggregate.empty()).merge(RawAggregate(values))
+
+        period_data = {section: aggregate.to_dict() for section, aggregate in merged.items()}
+        period_data['metadata'] = {'files_processed': files, 'rolled_up_from': members}
+        return period_data
+
+    def load_raw_store(self) -> dict:
+        """The whole raw store in the legacy raw_data_store.json shape."""
+        return {
+            'periods': {p: self.get_period(p) for p in self.periods()},
+            'last_updated': self.get_meta('last_updated'),
+        }
+
+    # -------------------------------------------------------------------------
+    # Quantile sketches
+    # -------------------------------------------------------------------------
+
+    def upsert_sketches(self, period: str, sketches: dict):
+        """
+        Store a period's sketches, replacing any with the same key.
+
+        Args:
+            period: Period key (YYYY-MM)
+            sketches: {metric: {dimension: {key: sketch dict}}}, as emitted
+                      under parse_interactions()['sketches'][period]
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (period, metric, dimension, str(key), _encode(sketch), now)
+            for metric, dimensions in sketches.items()
+            for dimension, keyed in dimensions.items()
+            for key, sketch in keyed.items()
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO sketches (period, metric, dimension, key, data, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (period, metric, dimension, key)
+                DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+                """,
+                rows
+            )
+            self._touch()
+
+    def get_sketches(self, metric: str, dimension: str = 'all',
+                     periods: Iterable[str] = None) -> Dict[str, 'QuantileSketch']:
+        """
+        Merge stored sketches per key across the requested periods.
+
+        Args:
+            metric: 'handle_ms' or 'queue_ms'
+            dimension: 'all', 'queue', 'agent' or 'week'
+            periods: Periods to include; None = every stored period
+
+        Returns:
+            {key: merged QuantileSketch}
+        """
+        # sketch.py needs numpy; imported here so opening the store doesn't
+        from .sketch import QuantileSketch
+
+        query = "SELECT key, data FROM sketches WHERE metric = ? AND dimension = ?"
+        params = [metric, dimension]
+        if periods is not None:
+            periods = list(periods)
+            query += f" AND period IN ({', '.join('?' * len(periods))})"
+            params += periods
+
+        merged = {}
+        for key, data in self.conn.execute(query + " ORDER BY key, period", params):
+            sketch = QuantileSketch.from_dict(json.loads(data))
+            if key in merged:
+                merged[key].merge(sketch)
+            else:
+                merged[key] = sketch
+        return merged
+
+    def get_percentiles(self, metric: str, dimension: str = 'all',
+                        periods: Iterable[str] = None,
+                        quantiles: Iterable[float] = None) -> Dict[str, dict]:
+        """
+        Percentiles per key from merged sketches, e.g.
+        get_percentiles('handle_ms', 'queue', ['2025-01', '2025-02']) ->
+        {'Support': {'p50': ..., 'p90': ..., 'p99': ..., 'count': ...}}.
+        Values are in the metric's unit (milliseconds). quantiles defaults
+        to sketch.DEFAULT_QUANTILES.
+        """
+        from .sketch import DEFAULT_QUANTILES
+
+        quantiles = DEFAULT_QUANTILES if quantiles is None else quantiles
+        return {
+            key: {**sketch.percentiles(quantiles), 'count': sketch.count}
+            for key, sketch in self.get_sketches(metric, dimension, periods).items()
+        }
+
+    # -------------------------------------------------------------------------
+    # Calculated metrics
+    # -------------------------------------------------------------------------
+
+    def save_metrics(self, period: str, record: dict):
+        """Upsert the ISPN-calculated metrics record for a period."""
+        metadata = record.get('metadata', {})
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO metrics (period, data, formula_version, calculated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (period) DO UPDATE SET
+                    data = excluded.data,
+                    formula_version = excluded.formula_version,
+                    calculated_at = excluded.calculated_at
+                """,
+                (period, _encode(record), metadata.get('formula_version'),
+                 metadata.get('calculation_timestamp'))
+            )
+            self._touch()
+
+    def get_metrics(self, period: str) -> Optional[dict]:
+        """Calculated metrics record for one period, or None."""
+        row = self.conn.execute(
+            "SELECT data FROM metrics WHERE period = ?", (period,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def metric_periods(self) -> List[str]:
+        """Periods with a calculated metrics record, sorted."""
+        return [r[0] for r in self.conn.execute("SELECT period FROM metrics ORDER BY period")]
+
+    def load_metrics_history(self) -> dict:
+        """All calculated periods in the legacy ispn_metrics_history.json shape."""
+        rows = self.conn.execute("SELECT period, data FROM metrics ORDER BY period")
+        return {
+            'periods': {period: json.loads(data) for period, data in rows},
+            'last_updated': self.get_meta('last_updated'),
+        }
+
+    # -------------------------------------------------------------------------
+    # Ingest manifest
+    # -------------------------------------------------------------------------
+
+    def get_ingested(self, content_hash: str) -> Optional[dict]:
+        """Manifest record for a content hash, or None."""
+        row = self.conn.execute(
+            """
+            SELECT file, size, source, parser_version, ingested_at
+            FROM ingest_manifest WHERE content_hash = ?
+            """,
+            (content_hash,)
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ('file', 'size', 'source', 'parser_version', 'ingested_at')
+        return dict(zip(keys, row))
+
+    def record_ingested(self, content_hash: str, file: str, size: int,
+                        source: str, parser_version: str, ingested_at: str = None):
+        """Upsert a manifest record."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO ingest_manifest
+                    (content_hash, file, size, source, parser_version, ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (content_hash, file, size, source, parser_version,
+                 ingested_at or datetime.now().isoformat())
+            )
+
+    # -------------------------------------------------------------------------
+    # Metadata
+    # -------------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def _touch(self):
+        """Update last_updated (caller holds the transaction)."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_updated', ?)",
+            (datetime.now().isoformat(),)
+        )
+
+    # -------------------------------------------------------------------------
+    # One-time migration from the JSON documents
+    # -------------------------------------------------------------------------
+
+    def migrate_from_json(self, raw_store_file: Path = None,
+                          history_file: Path = None,
+                          manifest_file: Path = None) -> Dict[str, int]:
+        """
+        Import the legacy JSON documents into this store.
+
+        Runs once: the completion time is recorded in the meta table and
+        later calls are no-ops. The JSON files are left untouched.
+        Each migrated section is also stored as a LEGACY_PART, so exports
+        ingested afterwards merge with the migrated totals.
+        Files default to the legacy names in the database's directory.
+
+        Returns:
+            Counts of imported periods/metrics/manifest records
+        """
+        counts = {'raw_periods': 0, 'metric_periods': 0, 'manifest_files': 0}
+        if self.get_meta('json_migrated_at'):
+            return counts
+
+        raw_store_file = raw_store_file or self.path.parent / LEGACY_RAW_STORE_NAME
+        history_file = history_file or self.path.parent / LEGACY_HISTORY_NAME
+        manifest_file = manifest_file or self.path.parent / LEGACY_MANIFEST_NAME
+
+        with self.conn:
+            if raw_store_file.exists():
+                with open(raw_store_file) as f:
+                    raw_store = json.load(f)
+                updated_at = raw_store.get('last_updated') or ''
+                for period, period_data in raw_store.get('periods', {}).items():
+                    rows, parts = [], []
+                    for section, values in period_data.items():
+                        if section == 'metadata' or not isinstance(values, dict):
+                            continue
+                        for field, value in values.items():
+                            rows.append((period, section, field, _encode(value), updated_at))
+                        if values:
+                            parts.append((period, section, LEGACY_PART, _encode(values), updated_at))
+                    self.conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO raw_values (period, section, field, value, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        rows
+                    )
+                    self.conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO raw_parts (period, section, part, data, updated_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        """,
+                        parts
+                    )
+                    self.conn.executemany(
+                        "INSERT INTO files_processed (period, source, timestamp) VALUES (?, ?, ?)",
+                        [(period, f.get('source', 'unknown'), f.get('timestamp', ''))
+                         for f in period_data.get('metadata', {}).get('files_processed', [])]
+                    )
+                    counts['raw_periods'] += 1
+
+            if history_file.exists():
+                with open(history_file) as f:
+                    history = json.load(f)
+                for period, record in history.get('periods', {}).items():
+                    metadata = record.get('metadata', {})
+                    self.conn.execute(
+                        """
+                        INSERT OR REPLACE INTO metrics (period, data, formula_version, calculated_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (period, _encode(record), metadata.get('formula_version'),
+                         metadata.get('calculation_timestamp'))
+                    )
+                    counts['metric_periods'] += 1
+
+            if manifest_file.exists():
+                with open(manifest_file) as f:
+                    manifest = json.load(f)
+                for content_hash, entry in manifest.get('files', {}).items():
+                    self.conn.execute(
+                        """
+                        INSERT OR REPLACE INTO ingest_manifest
+                            (content_hash, file, size, source, parser_version, ingested_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (content_hash, entry.get('file', ''), entry.get('size', 0),
+                         entry.get('source', 'unknown'), entry.get('parser_version', ''),
+                         entry.get('ingested_at', ''))
+                    )
+                    counts['manifest_files'] += 1
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated_at', ?)",
+                (datetime.now().isoformat(),)
+            )
+
+        return counts
+
+
+def open_store(path: Path = STORE_FILE) -> MetricsStore:
+    """
+    Open the metrics store, importing the legacy JSON documents on first use.
+    """
+    store = MetricsStore(path)
+    counts = store.migrate_from_json()
+    if any(counts.values()):
+        print(f"✓ Migrated legacy JSON metrics into {store.path.name}: "
+              f"{counts['raw_periods']} raw periods, {counts['metric_periods']} calculated periods, "
+              f"{counts['manifest_files']} manifest entries")
+    return store
@@ -1,63 +1,251 @@
 """
 ISPN Threshold Logic
 Centralized GREEN/YELLOW/RED status calculations
+
+data/metrics/targets.json is the single source of thresholds. The parser
+validators, ISPNCalculationEngine and the skill scripts all delegate here
+under their own metric names (ALIASES) and units (unit=...), so a value is
+judged the same way whether it arrives as 0.70 or 70%.
+
+targets.json is read once per process and re-read only when its mtime or
+size changes, and each metric's thresholds are compiled into an evaluator
+up front, so get_status() in a loop costs a stat() and a few comparisons.
+get_statuses() classifies a whole column (per-agent, per-interval values)
+in one vectorized call.
 """
 
 import json
+import os
 from pathlib import Path
 
 TARGETS_FILE = Path(__file__).parent.parent.parent / "data" / "metrics" / "targets.json"
 
+STATUSES = ('GREEN', 'YELLOW', 'RED', 'UNKNOWN')
+
+# Names other modules use for targets.json metrics
+ALIASES = {
+    'aht_min': 'aht', 'aht_minutes': 'aht', 'avg_handle_time_min': 'aht',
+    'awt_sec': 'awt', 'awt_seconds': 'awt', 'avg_wait_time_sec': 'awt',
+    'fcr_pct': 'fcr',
+    'escalation_pct': 'escalation',
+    'abandon_pct': 'abandon', 'abandon_rate_pct': 'abandon',
+    'utilization_pct': 'utilization',
+    'occupancy_pct': 'occupancy',
+    'shrinkage_pct': 'shrinkage',
+    'adherence_pct': 'schedule_adherence',
+    'answer_rate_pct': 'answer_rate',
+    'on_queue_pct': 'on_queue',
+    'service_level_pct': 'service_level',
+    'quality_score': 'quality',
+}
+
+# Multiplier taking a value from the caller's unit to the rule's unit
+UNIT_SCALE = {
+    ('fraction', 'percent'): 100.0,
+    ('percent', 'fraction'): 0.01,
+    ('seconds', 'minutes'): 1 / 60,
+    ('minutes', 'seconds'): 60.0,
+}
+
+# Display suffix per rule unit for describe_target()
+UNIT_SUFFIX = {'percent': '%', 'minutes': ' min', 'seconds': ' sec'}
+
+# Process-wide cache: (mtime_ns, size), parsed targets, compiled evaluators
+_CACHE = {'key': None, 'targets': None, 'evaluators': {}}
+
+
+class Evaluator:
+    """
+    One metric's thresholds, resolved once.
+
+    Directions:
+        lower_better   RED above red, YELLOW above yellow, GREEN at or below target
+        higher_better  RED below red, YELLOW below yellow, GREEN at or above target
+        range          RED outside red_low..red_high, YELLOW outside
+                       yellow_low..yellow_high, GREEN within target_low..target_high
+    Anything that falls between the bands is YELLOW; None and NaN are UNKNOWN.
+    """
+
+    def __init__(self, spec: dict):
+        self.direction = spec.get('direction', 'lower_better')
+        self.unit = spec.get('unit')
+        inf = float('inf')
+        if self.direction == 'range':
+            self.bounds = (spec.get('red_low', 0), spec.get('red_high', 100),
+                           spec.get('yellow_low', 0), spec.get('yellow_high', 100),
+                           spec.get('target_low', 0), spec.get('target_high', 100))
+        elif self.direction == 'lower_better':
+            self.bounds = (spec.get('red', inf), spec.get('yellow', inf), spec.get('target', inf))
+        elif self.direction == 'higher_better':
+            self.bounds = (spec.get('red', 0), spec.get('yellow', 0), spec.get('target', 0))
+        else:
+            self.bounds = ()
+
+    def __call__(self, value: float) -> str:
+        if value is None or value != value:
+            return 'UNKNOWN'
+        if self.direction == 'range':
+            red_low, red_high, yellow_low, yellow_high, target_low, target_high = self.bounds
+            if value < red_low or value > red_high:
+                return 'RED'
+            elif value < yellow_low or value > yellow_high:
+                return 'YELLOW'
+            elif target_low <= value <= target_high:
+                return 'GREEN'
+            return 'YELLOW'
+        elif self.direction == 'lower_better':
+            red, yellow, target = self.bounds
+            if value > red:
+                return 'RED'
+            elif value > yellow:
+                return 'YELLOW'
+            elif value <= target:
+                return 'GREEN'
+            return 'YELLOW'
+        elif self.direction == 'higher_better':
+            red, yellow, target = self.bounds
+            if value < red:
+                return 'RED'
+            elif value < yellow:
+                return 'YELLOW'
+            elif value >= target:
+                return 'GREEN'
+            return 'YELLOW'
+        return 'UNKNOWN'
+
+    def scale(self, unit: str = None) -> float:
+        """Factor converting values in `unit` to this rule's unit."""
+        if unit is None or self.unit is None or unit == self.unit:
+            return 1.0
+        if (unit, self.unit) not in UNIT_SCALE:
+            raise ValueError(f"Cannot compare {unit} values against a {self.unit} threshold")
+        return UNIT_SCALE[(unit, self.unit)]
+
+    def classify(self, values, scale: float = 1.0):
+        """Statuses for an array of values (NaN -> 'UNKNOWN')."""
+        import numpy as np
+
+        v = np.asarray(values, dtype='float64') * scale
+        if self.direction == 'range':
+            red_low, red_high, yellow_low, yellow_high, target_low, target_high = self.bounds
+            conditions = [(v < red_low) | (v > red_high), (v < yellow_low) | (v > yellow_high),
+                          (target_low <= v) & (v <= target_high)]
+        elif self.direction == 'lower_better':
+            red, yellow, target = self.bounds
+            conditions = [v > red, v > yellow, v <= target]
+        elif self.direction == 'higher_better':
+            red, yellow, target = self.bounds
+            conditions = [v < red, v < yellow, v >= target]
+        else:
+            return np.full(v.shape, 'UNKNOWN', dtype=object)
+        statuses = np.select(conditions, ['RED', 'YELLOW', 'GREEN'], 'YELLOW').astype(object)
+        statuses[np.isnan(v)] = 'UNKNOWN'
+        return statuses
+
+
 def load_targets():
-    """Load targets from JSON file."""
-    with open(TARGETS_FILE, 'r') as f:
-        return json.load(f)
+    """
+    Load targets from JSON file.
+
+    Cached per process and reloaded when the file's mtime or size changes;
+    treat the returned dict as read-only.
+    """
+    stat = os.stat(TARGETS_FILE)
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _CACHE['key'] != key:
+        with open(TARGETS_FILE, 'r') as f:
+            _CACHE['targets'] = json.load(f)
+        _CACHE['key'] = key
+        _CACHE['evaluators'] = {}
+    return _CACHE['targets']
+
 
-def get_status(metric: str, value: float, targets: dict = None) -> str:
+def get_spec(metric: str, targets: dict = None):
+    """targets.json entry for a metric or one of its ALIASES, or None."""
+    if targets is None:
+        targets = load_targets()
+    if metric in targets:
+        return targets[metric]
+    return targets.get(ALIASES.get(metric))
+
+
+def get_evaluator(metric: str, targets: dict = None):
+    """Compiled Evaluator for a metric (or alias), or None if it has no targets."""
+    if targets is None or targets is _CACHE['targets']:
+        spec = get_spec(metric)
+        evaluators = _CACHE['evaluators']
+        if metric not in evaluators:
+            evaluators[metric] = Evaluator(spec) if spec else None
+        return evaluators[metric]
+    spec = get_spec(metric, targets)
+    return Evaluator(spec) if spec else None
+
+
+def get_status(metric: str, value: float, targets: dict = None, unit: str = None) -> str:
     """
     Calculate status for a given metric value.
+
+    Args:
+        metric: targets.json key or one of its ALIASES
+        value: Metric value
+        targets: Explicit targets dict (default: cached targets.json)
+        unit: Unit of value when it differs from the rule's ('fraction' for 0.70-style rates)
+
     Returns: 'GREEN', 'YELLOW', or 'RED'
     """
-    if targets is None:
-        targets = load_targets()
-    
-    if metric not in targets:
+    evaluator = get_evaluator(metric, targets)
+    if evaluator is None or value is None:
         return 'UNKNOWN'
-    
-    t = targets[metric]
-    direction = t.get('direction', 'lower_better')
-    
-    # Handle range-based metrics (utilization)
-    if direction == 'range':
-        if value < t.get('red_low', 0) or value > t.get('red_high', 100):
-            return 'RED'
-        elif value < t.get('yellow_low', 0) or value > t.get('yellow_high', 100):
-            return 'YELLOW'
-        elif t.get('target_low', 0) <= value <= t.get('target_high', 100):
-            return 'GREEN'
-        return 'YELLOW'
-    
-    # Handle lower-is-better metrics (AHT, AWT, escalation, abandon, shrinkage)
-    elif direction == 'lower_better':
-        if value > t.get('red', float('inf')):
-            return 'RED'
-        elif value > t.get('yellow', float('inf')):
-            return 'YELLOW'
-        elif value <= t.get('target', float('inf')):
-            return 'GREEN'
-        return 'YELLOW'
-    
-    # Handle higher-is-better metrics (FCR, quality)
-    elif direction == 'higher_better':
-        if value < t.get('red', 0):
-            return 'RED'
-        elif value < t.get('yellow', 0):
-            return 'YELLOW'
-        elif value >= t.get('target', 0):
-            return 'GREEN'
-        return 'YELLOW'
-    
-    return 'UNKNOWN'
+    return evaluator(value * evaluator.scale(unit))
+
+
+def get_statuses(metric: str, values, targets: dict = None, unit: str = None):
+    """
+    Vectorized get_status() for a column of values (list, array or Series).
+
+    Returns:
+        Statuses as a Series (same index) for Series input, otherwise a numpy
+        object array; 'UNKNOWN' for NaN values and metrics without targets
+    """
+    import numpy as np
+
+    evaluator = get_evaluator(metric, targets)
+    if evaluator is None:
+        statuses = np.full(len(values), 'UNKNOWN', dtype=object)
+    else:
+        statuses = evaluator.classify(values, evaluator.scale(unit))
+    if type(values).__name__ == 'Series':
+        return type(values)(statuses, index=values.index, name=values.name)
+    return statuses
+
+
+def target_value(metric: str, unit: str = None, targets: dict = None):
+    """Target for a metric in the caller's unit (target_low for range metrics), or None."""
+    evaluator = get_evaluator(metric, targets)
+    if evaluator is None:
+        return None
+    spec = get_spec(metric, targets)
+    target = spec.get('target') or spec.get('target_low')
+    if target is None:
+        return None
+    return target / evaluator.scale(unit)
+
+
+def describe_target(metric: str, targets: dict = None) -> str:
+    """Display form of a metric's target ('> 70%', '< 10.7 min', '55-65%'), or 'N/A'."""
+    evaluator = get_evaluator(metric, targets)
+    if evaluator is None:
+        return 'N/A'
+    suffix = UNIT_SUFFIX.get(evaluator.unit, '')
+    if evaluator.direction == 'range':
+        return f"{evaluator.bounds[4]:g}-{evaluator.bounds[5]:g}{suffix}"
+    if evaluator.direction not in ('lower_better', 'higher_better'):
+        return 'N/A'
+    target = evaluator.bounds[2]
+    if target in (0, float('inf')):
+        return 'N/A'
+    return f"{'<' if evaluator.direction == 'lower_better' else '>'} {target:g}{suffix}"
+
 
 def get_all_statuses(metrics: dict) -> dict:
     """
@@ -66,7 +254,7 @@ def get_all_statuses(metrics: dict) -> dict:
     """
     targets = load_targets()
     results = {}
-    
+
     for metric, value in metrics.items():
         if metric in targets:
             t = targets[metric]
@@ -76,7 +264,7 @@ def get_all_statuses(metrics: dict) -> dict:
                 'target': target,
                 'status': get_status(metric, value, targets)
             }
-    
+
     return results
 
 def count_by_status(statuses: dict) -> dict:
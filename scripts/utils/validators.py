@@ -2,77 +2,27 @@
 ISPN Data Validators
 Validate parsed Genesys exports against ISPN standards
 
-Thresholds based on ISPN operational targets:
-- AHT: < 10.7 min (warning: 11.5, critical: 12.0)
-- AWT: < 90 sec (warning: 120, critical: 180)
-- FCR: > 70% (warning: 65%, critical: 60%)
-- Abandon: < 5% (warning: 8%, critical: 10%)
-- Utilization: 55-65% (warning: <50% or >70%)
-- Shrinkage: < 30% (warning: 35%, critical: 40%)
-- Adherence: > 90% (warning: 85%, critical: 80%)
-- Occupancy: 75-85% (warning: <70% or >90%)
+Statuses come from the shared rule engine (utils.thresholds), which reads
+data/metrics/targets.json; values here are in percent, minutes and seconds.
 """
 
 from typing import Tuple, List, Dict, Any
 
+from . import thresholds
+
 
 # =============================================================================
-# THRESHOLD DEFINITIONS
+# STATUS
 # =============================================================================
 
-THRESHOLDS = {
-    'aht_min': {'target': 10.7, 'warning': 11.5, 'critical': 12.0},
-    'awt_sec': {'target': 90, 'warning': 120, 'critical': 180},
-    'fcr_pct': {'target': 70, 'warning': 65, 'critical': 60},
-    'abandon_pct': {'target': 5, 'warning': 8, 'critical': 10},
-    'utilization_pct': {'target_low': 55, 'target_high': 65, 'warning_low': 50, 'warning_high': 70},
-    'shrinkage_pct': {'target': 30, 'warning': 35, 'critical': 40},
-    'adherence_pct': {'target': 90, 'warning': 85, 'critical': 80},
-    'occupancy_pct': {'target_low': 75, 'target_high': 85, 'warning_low': 70, 'warning_high': 90},
-    'answer_rate_pct': {'target': 90, 'warning': 85, 'critical': 80},
-    'on_queue_pct': {'target': 70, 'warning': 60, 'critical': 50},
-}
-
-
 def get_status(value: float, metric: str) -> str:
     """
-    Determine status (green/yellow/red) based on threshold.
+    Determine status (green/yellow/red) from targets.json.
     
-    Returns: 'green', 'yellow', or 'red'
+    metric is a targets.json key or alias ('aht_min', 'fcr_pct', ...).
+    Returns: 'green', 'yellow', 'red' or 'unknown'
     """
-    if metric not in THRESHOLDS:
-        return 'unknown'
-    
-    t = THRESHOLDS[metric]
-    
-    # Metrics where lower is better
-    if metric in ['aht_min', 'awt_sec', 'abandon_pct', 'shrinkage_pct']:
-        if value <= t['target']:
-            return 'green'
-        elif value <= t['warning']:
-            return 'yellow'
-        else:
-            return 'red'
-    
-    # Metrics where higher is better
-    elif metric in ['fcr_pct', 'adherence_pct', 'answer_rate_pct', 'on_queue_pct']:
-        if value >= t['target']:
-            return 'green'
-        elif value >= t['warning']:
-            return 'yellow'
-        else:
-            return 'red'
-    
-    # Range metrics
-    elif metric in ['utilization_pct', 'occupancy_pct']:
-        if t['target_low'] <= value <= t['target_high']:
-            return 'green'
-        elif t['warning_low'] <= value <= t['warning_high']:
-            return 'yellow'
-        else:
-            return 'red'
-    
-    return 'unknown'
+    return thresholds.get_status(metric, value).lower()
 
 
 # =============================================================================
@@ -171,10 +121,9 @@ def validate_agent_performance(data: dict) -> Tuple[bool, List[str], Dict[str, s
     
     # Identify high-AHT agents
     agents = data.get('agents', {})
-    high_aht_agents = []
-    for name, agent_data in agents.items():
-        if agent_data.get('avg_handle_min', 0) > THRESHOLDS['aht_min']['critical']:
-            high_aht_agents.append(name)
+    agent_aht = [agent_data.get('avg_handle_min', 0) for agent_data in agents.values()]
+    high_aht_agents = [name for name, status in zip(agents, thresholds.get_statuses('aht', agent_aht))
+                       if status == 'RED']
     
     if high_aht_agents:
         issues.append(f"INFO: {len(high_aht_agents)} agents exceed critical AHT threshold")
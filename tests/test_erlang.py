@@ -0,0 +1,97 @@
+"""Tests for scripts/utils/erlang.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.erlang import (
+    average_speed_of_answer, erlang_a, erlang_c, required_agents, service_level, week_requirements,
+)
+
+
+def smallest_meeting(load, aht, target_sl, target_sec):
+    """Brute-force required agents: first n whose Erlang C service level is met."""
+    n = int(load) + 1
+    while service_level(n, load, aht, target_sec) < target_sl:
+        n += 1
+    return n
+
+
+def test_erlang_c_known_value():
+    assert erlang_c(11, 10.0) == pytest.approx(0.6821, abs=1e-4)
+    assert erlang_c(10, 10.0) == 1.0          # load meets agents: every call waits
+
+
+def test_erlang_c_broadcasts():
+    values = erlang_c(np.array([11, 12, 15]), 10.0)
+    assert values.shape == (3,)
+    assert values[0] == pytest.approx(erlang_c(11, 10.0))
+    assert np.all(np.diff(values) < 0)
+
+
+def test_required_agents_scalar_and_array():
+    loads = np.array([0.0, 0.4, 3.2, 10.0, 47.5])
+    ahts = np.array([300.0, 300.0, 420.0, 180.0, 600.0])
+
+    agents = required_agents(loads, ahts, target_sl=0.8, target_sec=20)
+    assert agents.dtype == np.int64
+    assert agents[0] == 0
+    for load, aht, n in zip(loads[1:], ahts[1:], agents[1:]):
+        scalar = required_agents(load, aht, target_sl=0.8, target_sec=20)
+        assert isinstance(scalar, int)
+        assert scalar == n == smallest_meeting(load, aht, 0.8, 20)
+
+
+def test_required_agents_extra_goals():
+    n = required_agents(10.0, 180, target_sl=0.8, target_sec=20, max_asa_sec=5, max_occupancy=0.7)
+    assert average_speed_of_answer(n, 10.0, 180) <= 5
+    assert 10.0 / n <= 0.7
+    assert average_speed_of_answer(n - 1, 10.0, 180) > 5 or 10.0 / (n - 1) > 0.7
+
+
+def test_required_agents_limit():
+    with pytest.raises(ValueError):
+        required_agents(50.0, 300, max_agents=40)
+
+
+def test_erlang_a_converges_to_erlang_c():
+    agents, load, aht = 11, 10.0, 180.0
+    patient = erlang_a(agents, load, aht, patience_sec=1e7, target_sec=20)
+
+    assert patient['p_wait'] == pytest.approx(erlang_c(agents, load), rel=1e-3)
+    assert patient['service_level'] == pytest.approx(service_level(agents, load, aht, 20), rel=1e-3)
+    assert patient['avg_wait_sec'] == pytest.approx(average_speed_of_answer(agents, load, aht), rel=1e-3)
+    assert patient['p_abandon'] < 1e-4
+
+    # Less patience: more abandons, fewer callers left waiting
+    waits = [erlang_a(agents, load, aht, p, 20)['p_wait'] for p in (60, 600, 6000, 1e7)]
+    assert waits == sorted(waits)
+
+
+def test_week_requirements_small_frame():
+    starts = pd.to_datetime(['2026-01-05 08:00', '2026-01-05 08:15', '2026-01-05 08:30',
+                             '2026-01-12 08:00'])
+    workload = pd.DataFrame({'start': starts, 'calls': [40.0, 0.0, 90.0, 60.0],
+                             'aht_sec': [360.0, np.nan, 300.0, 360.0]})
+    staffing = pd.DataFrame({'start': starts[:3], 'scheduled': [20.0, 15.0, 25.0]})
+
+    plan = week_requirements(workload, staffing, week='2026-W02', target_sl=0.8, target_sec=120,
+                             shrinkage=0.3)
+
+    assert list(plan['start']) == list(starts[:3])
+    assert list(plan['load_erlangs']) == pytest.approx([16.0, 0.0, 30.0])
+    assert plan.loc[1, 'required_agents'] == 0
+    assert plan.loc[1, 'service_level'] == 1.0
+    for i in (0, 2):
+        row = plan.loc[i]
+        assert row['required_agents'] == smallest_meeting(row['load_erlangs'], row['aht_sec'], 0.8, 120)
+        assert row['service_level'] >= 0.8
+    assert list(plan['gap']) == list(plan['scheduled'] - plan['required_agents'])
+    assert list(plan['required_with_shrinkage']) == [
+        int(np.ceil(n / 0.7)) for n in plan['required_agents']
+    ]
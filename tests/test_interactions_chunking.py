@@ -0,0 +1,71 @@
+"""parse_interactions(): chunked reads must match a single full read."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.parsers import parse_interactions
+from utils.sketch import QuantileSketch
+
+ROWS = 3000
+
+
+@pytest.fixture
+def interactions_csv(tmp_path):
+    """A synthetic export spanning a month boundary, with blank cells."""
+    rng = np.random.default_rng(7)
+    start = pd.Timestamp('2026-01-30 08:00')
+    dates = start + pd.to_timedelta(np.sort(rng.integers(0, 3 * 24 * 3600, ROWS)), unit='s')
+    handle = rng.gamma(4.0, 120000, ROWS).astype(int)
+    df = pd.DataFrame({
+        'Media Type': rng.choice(['voice', 'callback'], ROWS, p=[0.9, 0.1]),
+        'Users - Interacted': rng.choice(['Agent A', 'Agent B', 'Agent C', ''], ROWS),
+        'Date': dates.strftime('%-m/%-d/%y %-I:%M %p'),
+        'Direction': rng.choice(['Inbound', 'Outbound'], ROWS, p=[0.85, 0.15]),
+        'Queue': rng.choice(['Partner Queue 1', 'Partner Queue 2', 'Partner Queue 3'], ROWS),
+        'Conversation ID': [f'uuid-{i}' for i in range(ROWS)],
+        'Abandoned': rng.choice(['NO', 'YES'], ROWS, p=[0.93, 0.07]),
+        'Non-ACD': rng.choice(['NO', 'YES'], ROWS, p=[0.97, 0.03]),
+        'Total Queue': rng.exponential(40000, ROWS).astype(int),
+        'Total Talk': (handle * 0.85).astype(int),
+        'Total Hold': (handle * 0.1).astype(int),
+        'Total ACW': 15000,
+        'Total Handle': handle,
+    })
+    # Blank cells, as real exports have them
+    df['Total Hold'] = df['Total Hold'].astype('Int64').mask(rng.random(ROWS) < 0.2)
+    df['Total Handle'] = df['Total Handle'].astype('Int64').mask(df['Abandoned'] == 'YES')
+    path = tmp_path / "interactions.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_chunked_parse_matches_full_read(interactions_csv):
+    full = parse_interactions(interactions_csv, chunksize=0)
+    chunked = parse_interactions(interactions_csv, chunksize=257)
+
+    assert sorted(full['periods']) == ['2026-01', '2026-02']
+    for key in ('record_count', 'periods', 'intervals', 'by_queue', 'by_agent', 'callbacks'):
+        assert chunked[key] == full[key], key
+
+
+def test_chunked_sketch_quantiles_within_tolerance(interactions_csv):
+    full = parse_interactions(interactions_csv, chunksize=0)
+    chunked = parse_interactions(interactions_csv, chunksize=257)
+
+    for name in ('p50_handle_min', 'p90_handle_min', 'p99_handle_min'):
+        assert chunked['metrics'][name] == pytest.approx(full['metrics'][name], rel=0.02), name
+    assert chunked['metrics']['max_handle_min'] == full['metrics']['max_handle_min']
+
+    for period, sketches in full['sketches'].items():
+        for metric in ('handle_ms', 'queue_ms'):
+            expected = QuantileSketch.from_dict(sketches[metric]['all']['all'])
+            got = QuantileSketch.from_dict(chunked['sketches'][period][metric]['all']['all'])
+            assert got.count == expected.count
+            for q in (0.5, 0.9, 0.99):
+                assert got.quantile(q) == pytest.approx(expected.quantile(q), rel=0.02), (period, metric, q)
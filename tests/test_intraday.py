@@ -0,0 +1,88 @@
+"""Tests for scripts/utils/intraday.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.intraday import IntradayEngine, summarize
+
+
+def rows(*values, start_minute=8 * 60, step=15):
+    """Engine rows from field dicts, one 15-minute interval apart from 2026-01-05 08:00."""
+    out = []
+    for i, fields in enumerate(values):
+        minute = start_minute + i * step
+        out.append({'start': f'2026-01-05 {minute // 60:02d}:{minute % 60:02d}', **fields})
+    return out
+
+
+def test_awt_over_180_fires_on_first_qualifying_interval():
+    verdicts = IntradayEngine().replay(rows({'awt_sec': 120}, {'awt_sec': 200}, {'awt_sec': 190}))
+
+    assert verdicts[0].verdict == 'WITHIN_TOLERANCE'
+    assert verdicts[1].verdict == 'UNDERSTAFFED'
+    assert verdicts[1].status == 'WARNING'
+    assert verdicts[1].triggers == ['awt_over_180s']
+    assert verdicts[2].triggers == ['awt_over_180s']
+
+
+def test_occupancy_over_90_needs_two_consecutive_intervals():
+    # Occupancy > 90% (30 min) only counts together with queue > 20 (10 min)
+    busy = {'occupancy': 0.95, 'calls_in_queue': 25}
+    verdicts = IntradayEngine().replay(rows(busy, busy, {'occupancy': 0.80, 'calls_in_queue': 25}, busy))
+
+    assert verdicts[0].verdict == 'WITHIN_TOLERANCE'
+    assert verdicts[1].status == 'WARNING'
+    assert verdicts[1].triggers == ['occupancy_over_90pct', 'queue_over_20']
+    # A dip resets the run
+    assert verdicts[2].verdict == 'WITHIN_TOLERANCE'
+    assert verdicts[3].verdict == 'WITHIN_TOLERANCE'
+
+
+def test_gap_in_interval_starts_resets_runs():
+    busy = {'occupancy': 0.95, 'calls_in_queue': 25}
+    engine = IntradayEngine()
+    # 08:00, then 08:30: the missing 08:15 interval breaks the run
+    verdicts = engine.replay(rows(busy, busy, busy, step=30))
+    assert [v.verdict for v in verdicts] == ['WITHIN_TOLERANCE'] * 3
+
+    engine.reset()
+    verdicts = engine.replay(rows(busy, busy, busy))
+    assert [v.verdict for v in verdicts] == ['WITHIN_TOLERANCE', 'UNDERSTAFFED', 'UNDERSTAFFED']
+
+
+def test_vto_hours_for_overstaffed_gap():
+    # Utilization < 50% (3 points) + AWT < 30s sustained 30 min (3 points) = OVERSTAFFED
+    quiet = {'utilization': 0.40, 'awt_sec': 10, 'staff': 12, 'required': 10}
+    verdicts = IntradayEngine().replay(rows(quiet, {**quiet, 'remaining_hours': 2}))
+
+    assert verdicts[0].status == 'WITHIN_TOLERANCE'
+    assert verdicts[0].vto_hours == 0.0
+    assert verdicts[1].status == 'OVERSTAFFED'
+    assert verdicts[1].score == 6
+    assert verdicts[1].gap == -2
+    assert verdicts[1].vto_hours == pytest.approx(4.0)       # 2 agents x 2 hours left
+    assert verdicts[1].magnitude_pct == pytest.approx(20.0)
+    assert verdicts[1].ot_hours == 0.0
+
+
+def test_ot_hours_for_understaffed_gap():
+    # Workload: 80 calls x 270s in 15 min at 85% occupancy = 28.24 agents
+    short = {'awt_sec': 400, 'staff': 20, 'offered': 80, 'aht_sec': 270}
+    verdicts = IntradayEngine().replay(rows(short, {**short, 'remaining_hours': 3}))
+    required = 80 * 4 * 270 / 3600 / 0.85
+
+    assert verdicts[0].status == 'CRITICAL'
+    assert verdicts[0].required == pytest.approx(required)
+    assert verdicts[0].ot_hours == pytest.approx((required - 20) * 0.25)
+    assert verdicts[1].ot_hours == pytest.approx((required - 20) * 3)
+    assert verdicts[1].magnitude_pct == pytest.approx((required - 20) / 20 * 100)
+    assert verdicts[1].vto_hours == 0.0
+
+    totals = summarize(verdicts)
+    assert totals['by_status'] == {'CRITICAL': 2}
+    assert totals['ot_hours'] == pytest.approx((required - 20) * 3.25)
+    assert totals['vto_hours'] == 0.0
@@ -0,0 +1,86 @@
+"""Tests for scripts/utils/ispn_calculations.py."""
+
+import math
+import sys
+from dataclasses import fields
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils import thresholds
+from utils.ispn_calculations import (
+    GenesysRawData, ISPNCalculatedMetrics, ISPNCalculationEngine, METRIC_UNITS, metrics_from_batch,
+)
+
+HOUR_MS = 3600000
+
+# Sparse rows: calculate_batch() sees absent keys as NaN cells, and
+# answered_under_120s / efficacy_scores as missing columns
+ROWS = [
+    # Normal month, Genesys + Wave
+    {'inbound_call_count': 50403, 'inbound_total_handle_ms': 538180 * 60000,
+     'inbound_total_queue_ms': 39 * 50403 * 1000, 'outbound_call_count': 5913,
+     'outbound_total_handle_ms': int(512.77 * HOUR_MS), 'callback_call_count': 1388,
+     'callback_total_handle_ms': int(304.13 * HOUR_MS), 'abandoned_call_count': 2100,
+     'answered_under_30s': 30000, 'answered_under_60s': 41000, 'answered_under_90s': 46000,
+     'total_logged_in_ms': int(19869.67 * HOUR_MS), 'total_on_queue_ms': int(14113.82 * HOUR_MS),
+     'training_hours': 120.5, 'call_tickets': 57743, 'escalations': 17770, 'alert_tickets': 2939,
+     'tech_review_scores': [94.3, 88.0], 'agent_count': 123,
+     'wave_call_count': 812, 'wave_total_minutes': 7400.0, 'wave_awt_seconds': 52.5},
+    # Every denominator zero
+    {},
+    # Calls but no tickets; training eats all hours; nobody on queue
+    {'inbound_call_count': 40, 'inbound_total_handle_ms': 40 * 600000, 'inbound_total_queue_ms': 40 * 30000,
+     'total_logged_in_ms': 8 * HOUR_MS, 'training_hours': 8.0, 'escalations': 3, 'agent_count': 1},
+    # Wave-only inbound (no Genesys inbound calls), efficacy scores empty
+    {'wave_call_count': 25, 'wave_total_minutes': 210.0, 'wave_awt_seconds': 41.0,
+     'outbound_call_count': 5, 'call_tickets': 30, 'escalations': 9,
+     'total_logged_in_ms': 10 * HOUR_MS, 'total_on_queue_ms': 7 * HOUR_MS, 'tech_review_scores': []},
+    # Abandons only
+    {'abandoned_call_count': 12, 'total_on_queue_ms': HOUR_MS},
+]
+
+
+def _scalar_raw(row):
+    return GenesysRawData(**{name: value for name, value in row.items()
+                             if not (isinstance(value, float) and math.isnan(value))})
+
+
+def test_calculate_batch_matches_calculate_all_per_row():
+    engine = ISPNCalculationEngine()
+    table = pd.DataFrame(ROWS)
+    assert 'answered_under_120s' not in table.columns
+    assert table['wave_call_count'].isna().any()
+
+    batch = engine.calculate_batch(table)
+    got = metrics_from_batch(batch)
+    assert len(got) == len(ROWS)
+
+    for i, (row, result) in enumerate(zip(ROWS, got)):
+        expected = engine.calculate_all(_scalar_raw(row))
+        for f in fields(ISPNCalculatedMetrics):
+            if f.name == 'calculation_timestamp':
+                continue
+            a, b = getattr(expected, f.name), getattr(result, f.name)
+            assert a == b and type(a) is type(b), f"row {i} {f.name}: scalar={a!r} batch={b!r}"
+
+        for metric, unit in METRIC_UNITS.items():
+            scalar_status = engine.get_status(metric, getattr(expected, metric))
+            batch_status = thresholds.get_statuses(metric, batch[metric], unit=unit).iloc[i]
+            assert scalar_status == batch_status.lower(), f"row {i} {metric}"
+
+
+def test_warnings_for_zero_denominators():
+    engine = ISPNCalculationEngine()
+    batch = metrics_from_batch(engine.calculate_batch(pd.DataFrame(ROWS)))
+
+    assert batch[0].warnings == []
+    assert len(batch[1].warnings) == 6
+    assert batch[2].warnings == [
+        "FCR: No call tickets - cannot calculate",
+        "Utilization: No hours (excl training) - cannot calculate",
+        "Occupancy: No on-queue hours - cannot calculate",
+    ]
+    assert batch[1].aht_minutes is None and batch[1].fcr_pct is None
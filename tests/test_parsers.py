@@ -0,0 +1,65 @@
+"""Tests for scripts/utils/parsers.py against small fixture exports."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils import parsers
+
+FIXTURES = Path(__file__).parent / "fixtures" / "parsers"
+
+# Fixture stem -> parser. Each <stem>.csv has blank (NaN) cells and
+# millisecond / minute columns; <stem>.expected.json is the parser output
+# minus the run-specific 'filepath' and 'parsed_at' keys.
+CASES = {
+    'interactions': parsers.parse_interactions,
+    'agent_performance': parsers.parse_agent_performance,
+    'agent_status': parsers.parse_agent_status,
+    'skills_performance': parsers.parse_skills_performance,
+    'adherence': parsers.parse_historical_adherence,
+    'wfm_activities': parsers.parse_wfm_activities,
+}
+
+
+def parse_fixture(stem):
+    result = parsers.parse_file(FIXTURES / f"{stem}.csv")
+    assert result['source'] == CASES[stem](FIXTURES / f"{stem}.csv")['source']
+    result.pop('filepath')
+    result.pop('parsed_at')
+    # allow_nan=False: a NaN that escaped the NaN -> None conversion fails here
+    return json.loads(json.dumps(result, allow_nan=False))
+
+
+@pytest.mark.parametrize('stem', sorted(CASES))
+def test_parser_output_matches_expected(stem):
+    expected = json.loads((FIXTURES / f"{stem}.expected.json").read_text())
+    assert parse_fixture(stem) == expected
+
+
+def test_blank_cells_become_none():
+    agents = parse_fixture('agent_performance')['agents']
+    assert agents['Agent B']['avg_hold_min'] is None
+    assert agents['Agent B']['asa_sec'] is None
+    assert agents['Agent B']['title'] == ''
+
+    assert parse_fixture('adherence')['agents']['Agent B']['conformance_pct'] is None
+    assert parse_fixture('skills_performance')['by_queue']['Partner Queue 2']['asa_sec'] is None
+
+
+def test_millisecond_unit_conversions():
+    agent = parse_fixture('agent_performance')['agents']['Agent A']
+    assert agent['avg_handle_min'] == 10.0    # 600000 ms
+    assert agent['avg_acw_sec'] == 30.0       # 30000 ms
+    assert agent['asa_sec'] == 20.0           # 20000 ms
+
+    status = parse_fixture('agent_status')
+    assert status['agents']['Agent A']['logged_in_hours'] == 1.0    # 3600000 ms
+    assert status['totals']['on_queue_hours'] == 1.25               # 2700000 + 1800000 ms
+
+    metrics = parse_fixture('interactions')['metrics']
+    assert metrics['avg_handle_time_min'] == 7.25    # (555000 + 315000) / 2 ms
+    assert metrics['avg_acw_time_sec'] == 15.0
@@ -0,0 +1,84 @@
+"""Tests for scripts/utils/simulation.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.erlang import INTERVAL_SECONDS, average_speed_of_answer, service_level
+from utils.simulation import SIM_METRICS, HandleTimes, run_day, simulate
+
+
+def test_steady_day_matches_erlang_c():
+    # M/M/N: Poisson arrivals, exponential handle, nobody abandons
+    agents, load, aht, target = 10, 8.0, 180.0, 20
+    intervals = 96
+    calls = np.full(intervals, load * INTERVAL_SECONDS / aht)
+    result = simulate(calls, agents, HandleTimes.exponential(aht), replications=60, workers=1,
+                      seed=11, target_sec=target)
+
+    # Drop the first hour (the day starts with an empty queue)
+    m = {metric: values[:, 4:] for metric, values in result.metrics.items()}
+    answered = m['answered'].sum()
+    asa = np.nansum(m['awt_sec'] * m['answered']) / answered
+    sl = np.nansum(m['service_level'] * m['offered']) / m['offered'].sum()
+
+    assert m['abandoned'].sum() == 0
+    assert answered == m['offered'].sum()
+    assert asa == pytest.approx(average_speed_of_answer(agents, load, aht), rel=0.15)
+    assert sl == pytest.approx(service_level(agents, load, aht, target), abs=0.03)
+
+
+def test_seeded_results_do_not_depend_on_workers():
+    calls = [30, 45, 60, 40]
+    options = dict(replications=9, seed=123, patience_sec=150, callback_offer_sec=90, callback_accept=0.5)
+    handle = HandleTimes.exponential(300)
+
+    one = simulate(calls, [8, 10, 12, 9], handle, workers=1, **options)
+    two = simulate(calls, [8, 10, 12, 9], handle, workers=2, **options)
+    for metric in SIM_METRICS:
+        np.testing.assert_array_equal(one.metrics[metric], two.metrics[metric])
+
+    again = simulate(calls, [8, 10, 12, 9], handle, workers=1, **options)
+    np.testing.assert_array_equal(one.metrics['awt_sec'], again.metrics['awt_sec'])
+
+
+def test_abandons_count_in_arrival_interval():
+    # No agents and ~3h patience: every caller abandons, mostly in a later interval
+    day = run_day([2, 3, 0, 0], [0, 0, 0, 0], HandleTimes.exponential(300), seed=5,
+                  arrival_mode='empirical', patience_sec=3 * 3600)
+
+    np.testing.assert_array_equal(day['offered'], [2, 3, 0, 0])
+    np.testing.assert_array_equal(day['abandoned'], [2, 3, 0, 0])
+    np.testing.assert_array_equal(day['answered'], [0, 0, 0, 0])
+    np.testing.assert_array_equal(day['abandon_pct'][:2], [100, 100])
+    assert np.isnan(day['abandon_pct'][2:]).all()
+
+
+def test_callbacks_count_in_arrival_interval():
+    # Nobody staffed until interval 3; everyone waiting 60s takes a callback,
+    # which holds their place in line and is answered once agents arrive
+    day = run_day([0, 4, 0, 0], [0, 0, 0, 5], HandleTimes.exponential(300), seed=5,
+                  arrival_mode='empirical', patience_sec=None,
+                  callback_offer_sec=60, callback_accept=1.0)
+
+    np.testing.assert_array_equal(day['offered'], [0, 4, 0, 0])
+    np.testing.assert_array_equal(day['callbacks'], [0, 4, 0, 0])
+    np.testing.assert_array_equal(day['abandoned'], [0, 0, 0, 0])
+    # Callbacks are not inbound answers and leave no inbound calls to score
+    np.testing.assert_array_equal(day['answered'], [0, 0, 0, 0])
+    assert np.isnan(day['service_level']).all()
+
+
+def test_callbacks_and_abandons_split_by_interval():
+    # Callers waiting past 60s either already abandoned or take a callback
+    day = run_day([6, 0, 5], [0, 0, 0], HandleTimes.exponential(300), seed=9,
+                  arrival_mode='empirical', patience_sec=45,
+                  callback_offer_sec=60, callback_accept=1.0)
+
+    np.testing.assert_array_equal(day['offered'], [6, 0, 5])
+    np.testing.assert_array_equal(day['callbacks'] + day['abandoned'], [6, 0, 5])
+    assert day['abandoned'].sum() > 0 and day['callbacks'].sum() > 0
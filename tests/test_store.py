@@ -0,0 +1,36 @@
+"""Tests for scripts/utils/store.py."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.store import MetricsStore, LEGACY_RAW_STORE_NAME
+
+
+def test_ingest_after_migration_adds_to_legacy_totals(tmp_path):
+    (tmp_path / LEGACY_RAW_STORE_NAME).write_text(json.dumps({
+        'last_updated': '2025-02-01T00:00:00',
+        'periods': {
+            '2025-01': {
+                'interactions': {'inbound_call_count': 1000, 'inbound_total_handle_ms': 600000000},
+                'metadata': {'files_processed': [{'source': 'genesys_interactions'}]},
+            },
+        },
+    }))
+
+    store = MetricsStore(tmp_path / "ispn_metrics.db")
+    try:
+        assert store.migrate_from_json()['raw_periods'] == 1
+
+        part = {'inbound_call_count': 10, 'inbound_total_handle_ms': 6000000}
+        merged = store.add_raw_part('2025-01', 'interactions', 'sha-new-export', part)
+        assert merged['inbound_call_count'] == 1010
+        assert merged['inbound_total_handle_ms'] == 606000000
+
+        # Re-ingesting the same export replaces its part instead of adding it again
+        store.add_raw_part('2025-01', 'interactions', 'sha-new-export', part)
+        assert store.get_period('2025-01')['interactions']['inbound_call_count'] == 1010
+    finally:
+        store.close()
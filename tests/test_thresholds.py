@@ -0,0 +1,32 @@
+"""Tests for scripts/utils/thresholds.py."""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from utils.thresholds import Evaluator
+
+SPECS = [
+    {'target': 90, 'yellow': 180, 'red': 180, 'direction': 'lower_better'},
+    {'target': 70, 'yellow': 65, 'red': 65, 'direction': 'higher_better'},
+    {'target_low': 80, 'target_high': 85, 'yellow_low': 75, 'yellow_high': 90,
+     'red_low': 70, 'red_high': 95, 'direction': 'range'},
+]
+
+
+def test_scalar_and_vectorized_statuses_agree():
+    values = [0, 60, 67, 72, 77, 82, 88, 92, 97, 150, 200, float('nan')]
+    for spec in SPECS:
+        evaluator = Evaluator(spec)
+        assert list(evaluator.classify(values)) == [evaluator(v) for v in values]
+
+
+def test_missing_values_are_unknown():
+    for spec in SPECS:
+        evaluator = Evaluator(spec)
+        assert evaluator(float('nan')) == 'UNKNOWN'
+        assert evaluator(np.nan) == 'UNKNOWN'
+        assert evaluator(None) == 'UNKNOWN'